@@ -0,0 +1,73 @@
+"""Bounded LRU cache of live aggregates."""
+
+from collections import OrderedDict
+from typing import Optional, Type, TypeVar
+
+from eventuali import Aggregate
+
+A = TypeVar("A", bound=Aggregate)
+
+
+class AggregateCache:
+    """Keeps recently used aggregates in memory between requests.
+    
+    Entries are the aggregates as last saved, tagged by their version.
+    Callers receive a copy, so a request that fails half way never
+    leaves a modified aggregate behind.  The least recently used entry
+    is evicted once ``max_size`` aggregates are cached.
+    """
+    
+    def __init__(self, max_size: int = 1000) -> None:
+        self.max_size = max_size
+        self._entries: OrderedDict[str, Aggregate] = OrderedDict()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def get(self, aggregate_class: Type[A], aggregate_id: str) -> Optional[A]:
+        """Return a copy of a cached aggregate, or None on a miss."""
+        aggregate = self._entries.get(aggregate_id)
+        if aggregate is None or not isinstance(aggregate, aggregate_class):
+            return None
+        self._entries.move_to_end(aggregate_id)
+        return aggregate.model_copy(deep=True)
+    
+    def put(self, aggregate: Aggregate) -> None:
+        """Cache an aggregate whose events have all been committed."""
+        if self.max_size <= 0:
+            return
+        self._entries[aggregate.id] = aggregate.model_copy(deep=True)
+        self._entries.move_to_end(aggregate.id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+    
+    def version(self, aggregate_id: str) -> Optional[int]:
+        """Return the cached version of an aggregate, if any."""
+        aggregate = self._entries.get(aggregate_id)
+        return aggregate.version if aggregate is not None else None
+    
+    def advance(
+        self, aggregate_id: str, from_version: int, to_version: int
+    ) -> Optional[Aggregate]:
+        """Move an entry past events that did not change its state.
+        
+        Returns the updated entry, or None if the aggregate was not
+        cached at ``from_version`` (in which case it is dropped).
+        """
+        aggregate = self._entries.get(aggregate_id)
+        if aggregate is None:
+            return None
+        if aggregate.version != from_version:
+            self.discard(aggregate_id)
+            return None
+        aggregate.version = to_version
+        self._entries.move_to_end(aggregate_id)
+        return aggregate
+    
+    def discard(self, aggregate_id: str) -> None:
+        """Drop an entry that may no longer match the store."""
+        self._entries.pop(aggregate_id, None)
+    
+    def clear(self) -> None:
+        """Drop every cached aggregate."""
+        self._entries.clear()
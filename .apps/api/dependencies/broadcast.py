@@ -0,0 +1,40 @@
+"""Hand newly stored events to open /events/stream clients."""
+
+import asyncio
+from typing import Any, Dict, Set
+
+# Events a stream client may have pending before it is dropped
+STREAM_QUEUE_SIZE = 1000
+
+
+class EventBroadcaster:
+    """One bounded queue per open stream, filled by create_event."""
+    
+    def __init__(self, queue_size: int = STREAM_QUEUE_SIZE) -> None:
+        self.queue_size = queue_size
+        self._queues: Set[asyncio.Queue] = set()
+    
+    def subscribe(self) -> asyncio.Queue:
+        """Open a queue for a new stream client."""
+        # The spare slot holds the None that ends a lagging stream
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size + 1)
+        self._queues.add(queue)
+        return queue
+    
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        """Forget a stream client's queue."""
+        self._queues.discard(queue)
+    
+    def publish(self, event: Dict[str, Any]) -> None:
+        """Queue an event for every stream, dropping those that lag."""
+        for queue in list(self._queues):
+            if queue.qsize() < self.queue_size:
+                queue.put_nowait(event)
+            else:
+                print("Warning: Stream client fell behind; disconnecting")
+                queue.put_nowait(None)
+                self._queues.discard(queue)
+
+
+# Global broadcaster instance
+event_broadcaster = EventBroadcaster()
@@ -2,9 +2,53 @@
 
 import asyncio
 from pathlib import Path
-from typing import AsyncGenerator, List, Dict, Any
+from typing import AsyncGenerator, List, Dict, Any, Optional, Type, TypeVar
 
-from eventuali import EventStore, Event
+from eventuali import Aggregate, EventStore, Event
+from eventuali.exceptions import OptimisticConcurrencyError
+
+from .aggregate_cache import AggregateCache
+from .locks import AggregateLockTable
+from .snapshots import SnapshotStore
+
+A = TypeVar("A", bound=Aggregate)
+
+
+def event_to_dict(event: Event) -> Dict[str, Any]:
+    """Convert a stored event to the dictionary served to the UI."""
+    event_dict = event.to_dict()
+    
+    # Add metadata fields for better UI display
+    causation_id = event.causation_id
+    correlation_id = event.correlation_id
+    event_dict.update({
+        'event_id': str(event.event_id),
+        'aggregate_id': event.aggregate_id,
+        'aggregate_type': event.aggregate_type,
+        'event_type': event.event_type,
+        'aggregate_version': event.aggregate_version,
+        'timestamp': (
+            event.timestamp.isoformat() if event.timestamp else None
+        ),
+        'user_id': event.user_id,
+        'causation_id': str(causation_id) if causation_id else None,
+        'correlation_id': str(correlation_id) if correlation_id else None,
+        # Get custom fields from properly deserialized event
+        'attributes': getattr(event, 'attributes', {}),
+        'agent_name': getattr(event, 'agent_name', ''),
+        'agent_id': getattr(event, 'agent_id', ''),
+        'parent_agent_id': getattr(event, 'parent_agent_id', ''),
+        'workflow_id': getattr(event, 'workflow_id', ''),
+        'event_name': getattr(event, 'event_name', ''),
+    })
+    
+    # Override correlation_id and causation_id with agent-specific
+    # fields if available
+    if event_dict.get('workflow_id'):
+        event_dict['correlation_id'] = event_dict['workflow_id']
+    if event_dict.get('parent_agent_id'):
+        event_dict['causation_id'] = event_dict['parent_agent_id']
+    return event_dict
 
 
 class DatabaseManager:
@@ -12,6 +56,9 @@ class DatabaseManager:
     
     def __init__(self) -> None:
         self._store: EventStore | None = None
+        self._snapshots: SnapshotStore | None = None
+        self._aggregates = AggregateCache(max_size=1000)
+        self.aggregate_locks = AggregateLockTable(max_size=10000)
         self._lock = asyncio.Lock()
     
     async def get_store(self) -> EventStore:
@@ -39,11 +86,109 @@ class DatabaseManager:
                     EventStore.register_event_class("SystemEvent", SystemEvent)
                     
                     print("Registered custom event classes for proper deserialization")
+                    
+                    # Snapshots live next to the events in the same file
+                    self._snapshots = SnapshotStore(db_path.absolute())
         
         return self._store
     
+    async def load_aggregate(
+        self, aggregate_class: Type[A], aggregate_id: str
+    ) -> Optional[A]:
+        """Load an aggregate from the cache, or its snapshot and events."""
+        store = await self.get_store()
+        
+        cached = self._aggregates.get(aggregate_class, aggregate_id)
+        if cached is not None:
+            return cached
+        
+        return await self._snapshots.load(store, aggregate_class, aggregate_id)
+    
+    async def save_aggregate(self, aggregate: Aggregate) -> Aggregate:
+        """Save an aggregate's new events and snapshot it when due.
+        
+        The version the aggregate was loaded at is checked against the
+        store first.  If another writer got there in between, the cached
+        copy is stale: the aggregate is rebuilt from the store and the
+        new events are applied again on top.  Returns the saved aggregate.
+        """
+        store = await self.get_store()
+        
+        events = aggregate.get_uncommitted_events()
+        loaded_version = aggregate.version - len(events)
+        stored_version = await store.get_aggregate_version(aggregate.id) or 0
+        
+        if stored_version != loaded_version:
+            print(
+                f"Stale aggregate {aggregate.id}: loaded at version "
+                f"{loaded_version}, store is at {stored_version}; reloading"
+            )
+            self._aggregates.discard(aggregate.id)
+            aggregate_class = type(aggregate)
+            fresh = await self._snapshots.load(
+                store, aggregate_class, aggregate.id
+            )
+            if fresh is None:
+                fresh = aggregate_class(id=aggregate.id)
+            for event in events:
+                fresh.apply(event)
+            aggregate = fresh
+        
+        try:
+            await store.save(aggregate)
+        except Exception:
+            self._aggregates.discard(aggregate.id)
+            raise
+        
+        self._aggregates.put(aggregate)
+        await self._snapshots.maybe_snapshot(aggregate)
+        return aggregate
+    
+    async def append_event(
+        self,
+        aggregate_class: Type[Aggregate],
+        event: Event,
+        attempts: int = 3
+    ) -> None:
+        """Append an event that changes no aggregate state.
+        
+        The event is saved at the aggregate's next version through an
+        empty aggregate of ``aggregate_class``, so nothing is loaded or
+        replayed.  If another writer takes that version first, the save
+        is retried at the new one; any other error is raised at once.
+        """
+        store = await self.get_store()
+        
+        for attempt in range(attempts):
+            current = self._aggregates.version(event.aggregate_id)
+            if current is None:
+                current = await store.get_aggregate_version(
+                    event.aggregate_id
+                ) or 0
+            event.aggregate_version = current + 1
+            shell = aggregate_class(id=event.aggregate_id, version=current)
+            shell.uncommitted_events.append(event)
+            
+            try:
+                await store.save(shell)
+                break
+            except OptimisticConcurrencyError:
+                self._aggregates.discard(event.aggregate_id)
+                if attempt == attempts - 1:
+                    raise
+        
+        cached = self._aggregates.advance(
+            event.aggregate_id, current, current + 1
+        )
+        if cached is not None:
+            await self._snapshots.maybe_snapshot(cached)
+    
     async def close(self) -> None:
         """Close the EventStore connection."""
+        self._aggregates.clear()
+        if self._snapshots is not None:
+            self._snapshots.close()
+            self._snapshots = None
         if self._store is not None:
             # EventStore cleanup if needed
             self._store = None
@@ -102,34 +247,7 @@ class DatabaseManager:
             # Convert events to dictionaries and apply filtering
             event_dicts = []
             for event in events:
-                event_dict = event.to_dict()
-                
-                # Add metadata fields for better UI display
-                event_dict.update({
-                    'event_id': str(event.event_id),
-                    'aggregate_id': event.aggregate_id,
-                    'aggregate_type': event.aggregate_type,
-                    'event_type': event.event_type,
-                    'aggregate_version': event.aggregate_version,
-                    'timestamp': event.timestamp.isoformat() if event.timestamp else None,
-                    'user_id': event.user_id,
-                    'causation_id': str(event.causation_id) if event.causation_id else None,
-                    'correlation_id': str(event.correlation_id) if event.correlation_id else None,
-                    # Get custom fields from properly deserialized event
-                    'attributes': getattr(event, 'attributes', {}),
-                    'agent_name': getattr(event, 'agent_name', ''),
-                    'agent_id': getattr(event, 'agent_id', ''),
-                    'parent_agent_id': getattr(event, 'parent_agent_id', ''),
-                    'workflow_id': getattr(event, 'workflow_id', ''),
-                    'event_name': getattr(event, 'event_name', ''),
-                })
-                
-                
-                # Override correlation_id and causation_id with agent-specific fields if available
-                if event_dict.get('workflow_id'):
-                    event_dict['correlation_id'] = event_dict['workflow_id']
-                if event_dict.get('parent_agent_id'):
-                    event_dict['causation_id'] = event_dict['parent_agent_id']
+                event_dict = event_to_dict(event)
                 
                 # Filter by event type if specified
                 if event_type is None or event.event_type == event_type:
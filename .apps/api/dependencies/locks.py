@@ -0,0 +1,54 @@
+"""Per-aggregate write locks."""
+
+import asyncio
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List
+
+
+class AggregateLockTable:
+    """Keyed asyncio locks that serialize writes to one aggregate.
+    
+    Writers to the same aggregate id queue behind each other, while
+    writers to different aggregates proceed in parallel.  The table keeps
+    at most ``max_size`` idle locks, evicting the least recently used
+    ones; a lock that is held or waited on is never evicted.
+    """
+    
+    def __init__(self, max_size: int = 10000) -> None:
+        self.max_size = max_size
+        # aggregate_id -> [lock, number of holders and waiters]
+        self._entries: OrderedDict[str, List] = OrderedDict()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    @asynccontextmanager
+    async def hold(self, aggregate_id: str) -> AsyncIterator[None]:
+        """Hold the lock for an aggregate for the duration of the block."""
+        entry = self._entries.get(aggregate_id)
+        if entry is None:
+            entry = [asyncio.Lock(), 0]
+            self._entries[aggregate_id] = entry
+        self._entries.move_to_end(aggregate_id)
+        entry[1] += 1
+        
+        try:
+            async with entry[0]:
+                yield
+        finally:
+            entry[1] -= 1
+            self._evict()
+    
+    def _evict(self) -> None:
+        excess = len(self._entries) - self.max_size
+        if excess <= 0:
+            return
+        idle = []
+        for aggregate_id, entry in self._entries.items():
+            if entry[1] == 0:
+                idle.append(aggregate_id)
+                if len(idle) == excess:
+                    break
+        for aggregate_id in idle:
+            del self._entries[aggregate_id]
@@ -0,0 +1,155 @@
+"""Aggregate snapshot store for fast rehydration."""
+
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Type, TypeVar
+
+from eventuali import Aggregate, EventStore
+
+A = TypeVar("A", bound=Aggregate)
+
+SNAPSHOTS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS aggregate_snapshots (
+    aggregate_id TEXT PRIMARY KEY,
+    aggregate_type TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    state TEXT NOT NULL,
+    created_at REAL NOT NULL
+)
+"""
+
+
+class SnapshotStore:
+    """Persists aggregate state so loads replay only recent events.
+    
+    A snapshot is written after a save once ``every_events`` events have
+    been appended since the last one, or once ``every_seconds`` have
+    passed with new events.  Loading starts from the latest snapshot and
+    applies only the events after its version, so the cost of a load no
+    longer grows with the aggregate's history.
+    """
+    
+    def __init__(
+        self,
+        db_path: Path,
+        every_events: int = 50,
+        every_seconds: float = 60.0
+    ) -> None:
+        self.db_path = db_path
+        self.every_events = every_events
+        self.every_seconds = every_seconds
+        self._conn: sqlite3.Connection | None = None
+        self._conn_lock = threading.Lock()
+        # aggregate_id -> (version, created_at) of its latest snapshot
+        self._latest: Dict[str, Tuple[int, float]] = {}
+    
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.execute(SNAPSHOTS_SCHEMA)
+            self._conn.commit()
+        return self._conn
+    
+    def _read(
+        self, aggregate_id: str
+    ) -> Optional[Tuple[str, int, str, float]]:
+        with self._conn_lock:
+            return self._connection().execute(
+                "SELECT aggregate_type, version, state, created_at "
+                "FROM aggregate_snapshots WHERE aggregate_id = ?",
+                (aggregate_id,)
+            ).fetchone()
+    
+    def _write(
+        self, aggregate_id: str, aggregate_type: str, version: int, state: str
+    ) -> float:
+        created_at = time.time()
+        with self._conn_lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO aggregate_snapshots "
+                "VALUES (?, ?, ?, ?, ?)",
+                (aggregate_id, aggregate_type, version, state, created_at)
+            )
+            conn.commit()
+        return created_at
+    
+    async def load(
+        self,
+        store: EventStore,
+        aggregate_class: Type[A],
+        aggregate_id: str
+    ) -> Optional[A]:
+        """Rehydrate an aggregate from its snapshot plus later events.
+        
+        Falls back to a full replay when there is no usable snapshot.
+        """
+        try:
+            row = await asyncio.to_thread(self._read, aggregate_id)
+        except Exception as e:
+            print(f"Warning: Failed to read snapshot for {aggregate_id}: {e}")
+            row = None
+        
+        if row is None or row[0] != aggregate_class.get_aggregate_type():
+            self._latest.setdefault(aggregate_id, (0, time.time()))
+            return await store.load(aggregate_class, aggregate_id)
+        
+        aggregate_type, version, state, created_at = row
+        self._latest[aggregate_id] = (version, created_at)
+        
+        aggregate = aggregate_class.from_dict(json.loads(state))
+        aggregate.version = version
+        
+        events = await store.load_events(aggregate_id, from_version=version)
+        for event in events:
+            event_version = event.aggregate_version
+            if event_version is not None and event_version <= version:
+                continue
+            aggregate._apply_event(event)
+            # Replaying does not advance the version by itself, and the
+            # next save numbers its events from it
+            if event_version is not None:
+                aggregate.version = event_version
+        
+        return aggregate
+    
+    async def maybe_snapshot(self, aggregate: Aggregate) -> None:
+        """Snapshot a freshly saved aggregate if a threshold was crossed."""
+        version, created_at = self._latest.setdefault(
+            aggregate.id, (0, time.time())
+        )
+        if aggregate.version <= version:
+            return
+        
+        due = (
+            aggregate.version - version >= self.every_events
+            or time.time() - created_at >= self.every_seconds
+        )
+        if not due:
+            return
+        
+        state: Dict[str, Any] = aggregate.to_dict()
+        try:
+            created_at = await asyncio.to_thread(
+                self._write,
+                aggregate.id,
+                aggregate.get_aggregate_type(),
+                aggregate.version,
+                json.dumps(state, default=str)
+            )
+        except Exception as e:
+            print(f"Warning: Failed to snapshot {aggregate.id}: {e}")
+            return
+        self._latest[aggregate.id] = (aggregate.version, created_at)
+    
+    def close(self) -> None:
+        """Close the snapshot database connection."""
+        with self._conn_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+        self._latest.clear()
@@ -10,7 +10,8 @@ from eventuali import Event, EventStore, Aggregate
 from fastapi import APIRouter, Depends, HTTPException
 from sse_starlette.sse import EventSourceResponse
 
-from dependencies.database import get_event_store, db_manager
+from dependencies.broadcast import event_broadcaster
+from dependencies.database import event_to_dict, get_event_store, db_manager
 from models.events import EventRequest, EventResponse, HealthResponse
 
 router = APIRouter(prefix="/events", tags=["events"])
@@ -353,6 +354,27 @@ class SystemAggregate(Aggregate):
         return "system_aggregate"
 
 
+# Aggregates whose apply_* fallback is a no-op.  SystemAggregate is not
+# listed: its fallback moves a started session to running.
+APPEND_ONLY_FALLBACK_AGGREGATES = (AgentAggregate, WorkflowAggregate)
+
+
+def is_append_only(aggregate_class: type, event: Event) -> bool:
+    """Check whether an event leaves its aggregate's state untouched.
+    
+    That holds when the aggregate's fallback handler is a no-op and the
+    class defines no apply_* method under the name the aggregate
+    dispatches the event to.  Such events can be appended without
+    rehydrating the aggregate.
+    """
+    if not issubclass(aggregate_class, APPEND_ONLY_FALLBACK_AGGREGATES):
+        return False
+    # Resolve the name the same way Aggregate._apply_event does
+    aggregate = aggregate_class(id=event.aggregate_id)
+    method_name = aggregate._get_method_name(event.get_event_type())
+    return not hasattr(aggregate_class, f"apply_{method_name}")
+
+
 @router.post("/", response_model=EventResponse)
 async def create_event(
     event_request: EventRequest,
@@ -380,15 +402,8 @@ async def create_event(
                     detail="Agent events require aggregate_id parameter"
                 )
             
-            # Check if aggregate exists, if not create it
-            try:
-                aggregate = await store.load(AgentAggregate, event_request.aggregate_id)
-                if not aggregate or aggregate.get_aggregate_type() != "agent_aggregate":
-                    # Create new agent aggregate
-                    aggregate = AgentAggregate(id=event_request.aggregate_id)
-            except:
-                # Create new agent aggregate if load fails
-                aggregate = AgentAggregate(id=event_request.aggregate_id)
+            aggregate_class = AgentAggregate
+            aggregate_id = event_request.aggregate_id
             
             # Create agent event
             event = AgentEvent(
@@ -439,8 +454,6 @@ async def create_event(
                         # Not a valid UUID, leave as None
                         pass
             
-            aggregate.apply(event)
-            
         elif event_name.startswith("workflow."):
             # Workflow events - use correlation_id as workflow ID
             if not event_request.correlation_id:
@@ -449,13 +462,8 @@ async def create_event(
                     detail="Workflow events require correlation_id parameter"
                 )
             
-            # Check if aggregate exists, if not create it
-            try:
-                aggregate = await store.load(WorkflowAggregate, event_request.correlation_id)
-                if not aggregate or aggregate.get_aggregate_type() != "workflow_aggregate":
-                    aggregate = WorkflowAggregate(id=event_request.correlation_id)
-            except:
-                aggregate = WorkflowAggregate(id=event_request.correlation_id)
+            aggregate_class = WorkflowAggregate
+            aggregate_id = event_request.correlation_id
             
             # Create workflow event
             event = WorkflowEvent(
@@ -468,21 +476,12 @@ async def create_event(
                 attributes=event_request.attributes
             )
             
-            aggregate.apply(event)
-            
         elif event_name.startswith("system."):
             # System events - use session-based aggregation
             session_id = event_request.attributes.get("session_id", "default_session")
+            aggregate_class = SystemAggregate
             aggregate_id = f"system_{session_id}"
             
-            # Check if aggregate exists, if not create it
-            try:
-                aggregate = await store.load(SystemAggregate, aggregate_id)
-                if not aggregate or aggregate.get_aggregate_type() != "system_aggregate":
-                    aggregate = SystemAggregate(id=aggregate_id)
-            except:
-                aggregate = SystemAggregate(id=aggregate_id)
-            
             # Create system event
             event = SystemEvent(
                 event_id=event_id,
@@ -493,8 +492,6 @@ async def create_event(
                 attributes=event_request.attributes
             )
             
-            aggregate.apply(event)
-            
         else:
             # Reject events that don't match the three-aggregate pattern
             raise HTTPException(
@@ -502,13 +499,43 @@ async def create_event(
                 detail=f"Event name must start with 'agent.', 'workflow.', or 'system.'. Got: {event_name}"
             )
         
-        # Store aggregate in eventuali
-        await store.save(aggregate)
+        # One writer per aggregate at a time, so concurrent emits never
+        # load the same version twice
+        async with db_manager.aggregate_locks.hold(aggregate_id):
+            if is_append_only(aggregate_class, event):
+                # Nothing in the aggregate changes, so skip load/apply/save
+                await db_manager.append_event(aggregate_class, event)
+            else:
+                # Check if aggregate exists, if not create it
+                try:
+                    aggregate = await db_manager.load_aggregate(
+                        aggregate_class, aggregate_id
+                    )
+                    aggregate_type = aggregate_class.get_aggregate_type()
+                    if (
+                        not aggregate
+                        or aggregate.get_aggregate_type() != aggregate_type
+                    ):
+                        aggregate = aggregate_class(id=aggregate_id)
+                except Exception:
+                    # Create new aggregate if load fails
+                    aggregate = aggregate_class(id=aggregate_id)
+                
+                aggregate.apply(event)
+                
+                # Store aggregate in eventuali
+                await db_manager.save_aggregate(aggregate)
+        
+        # Push the stored event to open streams
+        event_broadcaster.publish(event_to_dict(event))
         
         return EventResponse(
             success=True,
             event_id=event_id,
-            message=f"Event '{event_request.name}' stored successfully in {aggregate.get_aggregate_type()}",
+            message=(
+                f"Event '{event_request.name}' stored successfully in "
+                f"{aggregate_class.get_aggregate_type()}"
+            ),
             timestamp=timestamp
         )
         
@@ -521,53 +548,53 @@ async def create_event(
         )
 
 
+# Seconds without events after which a stream sends a heartbeat
+HEARTBEAT_INTERVAL = 2.0
+
+
 async def event_stream() -> AsyncGenerator[Dict[str, Any], None]:
-    """Stream events via Server-Sent Events."""
-    last_check = datetime.now(timezone.utc)
-    
-    while True:
-        try:
-            # Get recent events since last check
-            events = await db_manager.get_recent_events(limit=50)
-            
-            # Send events that are newer than last check
-            for event in events:
-                event_time_str = event.get('timestamp')
-                if event_time_str:
-                    event_time = datetime.fromisoformat(
-                        event_time_str.replace('Z', '+00:00')
-                    )
-                    if event_time > last_check:
-                        yield {
-                            "event": "event_created",
-                            "data": json.dumps(event),
-                            "id": event.get('event_id', ''),
-                        }
-            
-            # Update last check time
-            last_check = datetime.now(timezone.utc)
-            
-            # Send heartbeat to keep connection alive
-            yield {
-                "event": "heartbeat",
-                "data": json.dumps({
-                    "timestamp": last_check.isoformat(),
-                    "status": "connected"
-                }),
-            }
+    """Stream events via Server-Sent Events.
+    
+    Events are pushed by create_event through the in-process
+    broadcaster as they are stored, so open streams never poll the
+    database.  A client that falls a full queue behind receives an
+    error event and is disconnected.
+    """
+    queue = event_broadcaster.subscribe()
+    try:
+        while True:
+            try:
+                event = await asyncio.wait_for(
+                    queue.get(), timeout=HEARTBEAT_INTERVAL
+                )
+            except asyncio.TimeoutError:
+                # Send heartbeat to keep connection alive
+                yield {
+                    "event": "heartbeat",
+                    "data": json.dumps({
+                        "timestamp": datetime.now(timezone.utc).isoformat(),
+                        "status": "connected"
+                    }),
+                }
+                continue
             
-            # Wait before next poll
-            await asyncio.sleep(2)
+            if event is None:
+                yield {
+                    "event": "error",
+                    "data": json.dumps({
+                        "error": "Subscriber lagged",
+                        "timestamp": datetime.now(timezone.utc).isoformat()
+                    }),
+                }
+                break
             
-        except Exception as e:
             yield {
-                "event": "error",
-                "data": json.dumps({
-                    "error": str(e),
-                    "timestamp": datetime.now(timezone.utc).isoformat()
-                }),
+                "event": "event_created",
+                "data": json.dumps(event, default=str),
+                "id": event.get('event_id', ''),
             }
-            await asyncio.sleep(5)
+    finally:
+        event_broadcaster.unsubscribe(queue)
 
 
 @router.get("/stream")
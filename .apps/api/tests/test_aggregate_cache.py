@@ -0,0 +1,56 @@
+"""Tests for the live aggregate cache."""
+
+from eventuali import Aggregate
+
+from dependencies.aggregate_cache import AggregateCache
+
+
+class Counter(Aggregate):
+    """Aggregate with a single piece of state."""
+
+    ticks: int = 0
+
+
+class Other(Aggregate):
+    """A different aggregate class."""
+
+
+def test_get_returns_copies():
+    """Changing a cached aggregate needs another put."""
+    cache = AggregateCache()
+    cache.put(Counter(id="counter-1", version=2, ticks=2))
+
+    first = cache.get(Counter, "counter-1")
+    first.ticks = 99
+    assert cache.get(Counter, "counter-1").ticks == 2
+    assert cache.get(Other, "counter-1") is None
+    assert cache.get(Counter, "missing") is None
+
+
+def test_least_recently_used_is_evicted():
+    """The entry used longest ago goes first."""
+    cache = AggregateCache(max_size=2)
+    cache.put(Counter(id="a"))
+    cache.put(Counter(id="b"))
+    cache.get(Counter, "a")
+    cache.put(Counter(id="c"))
+
+    assert len(cache) == 2
+    assert cache.version("b") is None
+    assert cache.version("a") == 0
+
+    disabled = AggregateCache(max_size=0)
+    disabled.put(Counter(id="a"))
+    assert len(disabled) == 0
+
+
+def test_advance_moves_matching_versions_only():
+    """Entries advance from their version; stale ones are dropped."""
+    cache = AggregateCache()
+    cache.put(Counter(id="counter-1", version=3))
+
+    assert cache.advance("counter-1", 3, 4).version == 4
+    assert cache.version("counter-1") == 4
+    assert cache.advance("counter-1", 3, 4) is None
+    assert cache.version("counter-1") is None
+    assert cache.advance("missing", 0, 1) is None
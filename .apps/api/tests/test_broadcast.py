@@ -0,0 +1,63 @@
+"""Tests for pushing created events to stream clients."""
+
+import asyncio
+import json
+
+import pytest
+import pytest_asyncio
+from eventuali import EventStore
+
+from dependencies.broadcast import EventBroadcaster, event_broadcaster
+from dependencies.database import db_manager
+from dependencies.snapshots import SnapshotStore
+from models.events import EventRequest
+from routes.events import create_event, event_stream
+
+
+@pytest_asyncio.fixture
+async def store(tmp_path):
+    """Point the global database manager at a temporary store."""
+    db_path = tmp_path / "events.db"
+    db_manager._store = await EventStore.create(f"sqlite:///{db_path}")
+    db_manager._snapshots = SnapshotStore(db_path)
+    yield db_manager._store
+    await db_manager.close()
+
+
+@pytest.mark.asyncio
+async def test_create_event_reaches_open_stream(store):
+    """A connected stream client receives each event once it is stored."""
+    stream = event_stream()
+    pending = asyncio.create_task(anext(stream))
+    # Let the stream subscribe before anything is published
+    await asyncio.sleep(0)
+
+    names = ["agent.started", "agent.planner.tool_used"]
+    for name in names:
+        await create_event(
+            EventRequest(name=name, aggregate_id="agent-1"), store
+        )
+
+    messages = [await pending, await anext(stream)]
+    assert [m["event"] for m in messages] == ["event_created"] * 2
+    events = [json.loads(m["data"]) for m in messages]
+    assert [e["event_name"] for e in events] == names
+    assert [e["aggregate_version"] for e in events] == [1, 2]
+    assert messages[0]["id"] == events[0]["event_id"]
+
+    await stream.aclose()
+    assert not event_broadcaster._queues
+
+
+@pytest.mark.asyncio
+async def test_lagging_stream_is_dropped():
+    """A full queue ends with a None marker instead of losing events."""
+    broadcaster = EventBroadcaster(queue_size=2)
+    queue = broadcaster.subscribe()
+    for event_id in "abc":
+        broadcaster.publish({"event_id": event_id})
+
+    assert not broadcaster._queues
+    assert [queue.get_nowait() for _ in range(3)] == [
+        {"event_id": "a"}, {"event_id": "b"}, None
+    ]
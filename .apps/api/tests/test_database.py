@@ -0,0 +1,137 @@
+"""Tests for the append-only write path of the database manager."""
+
+import pytest
+import pytest_asyncio
+from eventuali import EventStore
+from eventuali.exceptions import OptimisticConcurrencyError
+
+from dependencies.database import DatabaseManager
+from dependencies.snapshots import SnapshotStore
+from routes.events import (
+    AgentAggregate,
+    AgentEvent,
+    SystemAggregate,
+    SystemEvent,
+    WorkflowAggregate,
+    WorkflowEvent,
+    is_append_only,
+)
+
+
+def tool_used(aggregate_id):
+    """An append-only event for an agent aggregate."""
+    return AgentEvent(
+        aggregate_id=aggregate_id, event_name="agent.planner.tool_used"
+    )
+
+
+class RacingStore(EventStore):
+    """Event store where another writer wins the next ``races`` saves."""
+
+    races = 0
+
+    async def save(self, aggregate):
+        if self.races:
+            self.races -= 1
+            version = await self.get_aggregate_version(aggregate.id)
+            rival = AgentAggregate(id=aggregate.id, version=version or 0)
+            rival.emit_agent_event("agent.rival.tool_used")
+            await super().save(rival)
+        await super().save(aggregate)
+
+
+class FailingStore(EventStore):
+    """Event store whose saves fail with an unrelated error."""
+
+    saves = 0
+
+    async def save(self, aggregate):
+        self.saves += 1
+        raise RuntimeError("disk full")
+
+
+@pytest_asyncio.fixture
+async def manager(tmp_path):
+    """Database manager over a temporary store."""
+    db_path = tmp_path / "events.db"
+    manager = DatabaseManager()
+    manager._store = await EventStore.create(f"sqlite:///{db_path}")
+    manager._snapshots = SnapshotStore(db_path)
+    yield manager
+    await manager.close()
+
+
+def test_is_append_only():
+    """Only events without a dedicated handler on a no-op fallback."""
+    progress = WorkflowEvent(
+        aggregate_id="workflow-1", event_name="workflow.progress"
+    )
+    heartbeat = SystemEvent(
+        aggregate_id="system-1", event_name="system.heartbeat"
+    )
+    assert is_append_only(AgentAggregate, tool_used("agent-1"))
+    assert is_append_only(WorkflowAggregate, progress)
+    assert not is_append_only(SystemAggregate, heartbeat)
+
+
+def test_dedicated_handler_is_not_append_only():
+    """A handler under the aggregate's dispatch name keeps the full path."""
+    # Dispatch keeps the dots and snake-cases capitals
+    paused = AgentEvent(aggregate_id="agent-1", event_name="agent.wasPaused")
+    pausing_agent = type(
+        "PausingAgent",
+        (AgentAggregate,),
+        {"apply_agent.was_paused": lambda self, event: None},
+    )
+    assert is_append_only(AgentAggregate, paused)
+    assert not is_append_only(pausing_agent, paused)
+
+
+@pytest.mark.asyncio
+async def test_append_event_numbers_versions(manager):
+    """Appends take the aggregate's next version."""
+    for _ in range(2):
+        await manager.append_event(AgentAggregate, tool_used("agent-1"))
+
+    store = await manager.get_store()
+    events = await store.load_events("agent-1")
+    assert [e.aggregate_version for e in events] == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_append_event_advances_cached_aggregate(manager):
+    """A cached aggregate moves to the appended version."""
+    agent = AgentAggregate(id="agent-1")
+    agent.start_agent("planner", "agent-1")
+    await manager.save_aggregate(agent)
+
+    await manager.append_event(AgentAggregate, tool_used("agent-1"))
+    assert manager._aggregates.version("agent-1") == 2
+
+
+@pytest.mark.asyncio
+async def test_append_event_retries_version_conflicts(manager, tmp_path):
+    """A conflict is retried at the version the store now reports."""
+    store = await RacingStore.create(f"sqlite:///{tmp_path / 'race.db'}")
+    manager._store = store
+    store.races = 2
+    event = tool_used("agent-1")
+    await manager.append_event(AgentAggregate, event)
+    assert event.aggregate_version == 3
+
+    store.races = 3
+    with pytest.raises(OptimisticConcurrencyError):
+        await manager.append_event(AgentAggregate, tool_used("agent-1"))
+    events = await store.load_events("agent-1")
+    assert [e.aggregate_version for e in events] == [1, 2, 3, 4, 5, 6]
+
+
+@pytest.mark.asyncio
+async def test_append_event_raises_other_errors(manager, tmp_path):
+    """Errors other than a version conflict are not retried."""
+    store = await FailingStore.create(f"sqlite:///{tmp_path / 'fail.db'}")
+    manager._store = store
+    with pytest.raises(RuntimeError):
+        await manager.append_event(AgentAggregate, tool_used("agent-1"))
+    assert store.saves == 1
+    assert await store.get_aggregate_version("agent-1") is None
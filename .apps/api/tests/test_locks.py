@@ -0,0 +1,52 @@
+"""Tests for the per-aggregate write locks."""
+
+import asyncio
+
+import pytest
+
+from dependencies.locks import AggregateLockTable
+
+
+async def record(locks, aggregate_id, log, label):
+    """Hold an aggregate's lock across a yield to the event loop."""
+    async with locks.hold(aggregate_id):
+        log.append(f"{label} start")
+        await asyncio.sleep(0)
+        log.append(f"{label} end")
+
+
+@pytest.mark.asyncio
+async def test_same_aggregate_is_serialized():
+    """Writers to one aggregate never overlap."""
+    locks = AggregateLockTable()
+    log = []
+    await asyncio.gather(
+        record(locks, "agent-1", log, "a"),
+        record(locks, "agent-1", log, "b"),
+    )
+    assert log == ["a start", "a end", "b start", "b end"]
+
+
+@pytest.mark.asyncio
+async def test_other_aggregates_run_in_parallel():
+    """Writers to different aggregates interleave."""
+    locks = AggregateLockTable()
+    log = []
+    await asyncio.gather(
+        record(locks, "agent-1", log, "a"),
+        record(locks, "agent-2", log, "b"),
+    )
+    assert log == ["a start", "b start", "a end", "b end"]
+
+
+@pytest.mark.asyncio
+async def test_only_idle_locks_are_evicted():
+    """The table shrinks to max_size without dropping a held lock."""
+    locks = AggregateLockTable(max_size=1)
+    async with locks.hold("agent-1"):
+        async with locks.hold("agent-2"):
+            assert len(locks) == 2
+        # agent-2 is idle, agent-1 is still held
+        assert len(locks) == 1
+        assert "agent-1" in locks._entries
+    assert len(locks) == 1
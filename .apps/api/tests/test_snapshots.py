@@ -0,0 +1,95 @@
+"""Tests for the aggregate snapshot store."""
+
+import sqlite3
+
+import pytest
+import pytest_asyncio
+from eventuali import Aggregate, Event, EventStore
+
+from dependencies.snapshots import SnapshotStore
+
+
+class Tick(Event):
+    """Event counted by the Counter aggregate."""
+
+
+class Counter(Aggregate):
+    """Aggregate whose state is the number of ticks applied to it."""
+
+    ticks: int = 0
+
+    def tick(self) -> None:
+        """Record one tick."""
+        self.apply(Tick())
+
+    def apply_tick(self, event: Tick) -> None:
+        """Apply a tick event."""
+        self.ticks += 1
+
+
+@pytest_asyncio.fixture
+async def store(tmp_path):
+    """Event store in a temporary database."""
+    EventStore.register_event_class("Tick", Tick)
+    return await EventStore.create(f"sqlite:///{tmp_path / 'events.db'}")
+
+
+async def save_ticks(store, aggregate, count):
+    """Apply and save ``count`` ticks."""
+    for _ in range(count):
+        aggregate.tick()
+    await store.save(aggregate)
+
+
+@pytest.mark.asyncio
+async def test_snapshot_round_trip(store, tmp_path):
+    """A snapshot restores the aggregate's state and version."""
+    snapshots = SnapshotStore(tmp_path / "events.db", every_events=2)
+    counter = Counter(id="counter-1")
+    await save_ticks(store, counter, 2)
+    await snapshots.maybe_snapshot(counter)
+
+    # Rewrite the event history so only the snapshot can explain the state
+    with sqlite3.connect(tmp_path / "events.db") as conn:
+        conn.execute("UPDATE events SET event_type = 'Unknown'")
+    loaded = await snapshots.load(store, Counter, "counter-1")
+    assert loaded.version == 2
+    assert loaded.ticks == 2
+    snapshots.close()
+
+
+@pytest.mark.asyncio
+async def test_load_replays_events_after_snapshot(store, tmp_path):
+    """Events after the snapshot are applied and advance the version."""
+    snapshots = SnapshotStore(tmp_path / "events.db", every_events=2)
+    counter = Counter(id="counter-1")
+    await save_ticks(store, counter, 2)
+    await snapshots.maybe_snapshot(counter)
+    await save_ticks(store, counter, 1)
+
+    loaded = await snapshots.load(store, Counter, "counter-1")
+    assert loaded.version == 3
+    assert loaded.ticks == 3
+
+    # The next save continues the stream instead of reusing a version
+    await save_ticks(store, loaded, 1)
+    assert await store.get_aggregate_version("counter-1") == 4
+    snapshots.close()
+
+
+@pytest.mark.asyncio
+async def test_snapshots_wait_for_the_threshold(store, tmp_path):
+    """Aggregates load from their events until a snapshot is due."""
+    snapshots = SnapshotStore(tmp_path / "events.db", every_events=5)
+    counter = Counter(id="counter-1")
+    await save_ticks(store, counter, 2)
+    await snapshots.maybe_snapshot(counter)
+
+    loaded = await snapshots.load(store, Counter, "counter-1")
+    assert (loaded.version, loaded.ticks) == (2, 2)
+    assert await snapshots.load(store, Counter, "missing") is None
+    with sqlite3.connect(tmp_path / "events.db") as conn:
+        assert conn.execute(
+            "SELECT COUNT(*) FROM aggregate_snapshots"
+        ).fetchone()[0] == 0
+    snapshots.close()
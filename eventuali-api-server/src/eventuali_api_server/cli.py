@@ -1,13 +1,30 @@
 """Command-line interface for the Eventuali API server."""
 
+import asyncio
+import gzip
 import logging
+import sqlite3
 import sys
+import time
+from pathlib import Path
 from typing import Optional
 
 import click
 import uvicorn
+from eventuali import EventStore
 
 from .config import APIServerConfig, set_config
+from .dependencies.export import iter_export, ndjson_line
+from .dependencies.importer import (
+    IMPORT_BATCH_SIZE,
+    insert_events,
+    open_archive,
+    read_ndjson,
+    resume_maintenance,
+    suspend_maintenance,
+)
+from .dependencies.partitions import list_partitions
+from .dependencies.reader import normalize_timestamp
 
 
 def setup_logging(log_level: str) -> None:
@@ -20,7 +37,7 @@ def setup_logging(log_level: str) -> None:
     )
 
 
-@click.command()
+@click.group(invoke_without_command=True)
 @click.option(
     "--host",
     default="127.0.0.1",
@@ -65,16 +82,38 @@ def setup_logging(log_level: str) -> None:
     help="Database operation timeout in seconds",
     envvar="DATABASE_TIMEOUT"
 )
+@click.option(
+    "--partition-period",
+    type=click.Choice(["day", "week"]),
+    help="Move events older than the hot periods into per-period files",
+    envvar="PARTITION_PERIOD"
+)
+@click.option(
+    "--partition-hot-periods",
+    default=2,
+    type=click.IntRange(min=1),
+    help="Newest periods kept in events.db when partitioning",
+    envvar="PARTITION_HOT_PERIODS"
+)
+@click.pass_context
 def main(
+    ctx: click.Context,
     host: str,
     port: int,
     reload: bool,
     log_level: str,
     data_dir: str,
     cors_origins: Optional[str],
-    database_timeout: float
+    database_timeout: float,
+    partition_period: Optional[str],
+    partition_hot_periods: int
 ) -> None:
-    """Start the Eventuali API server."""
+    """Start the Eventuali API server.
+    
+    Run without a command to serve the API.
+    """
+    if ctx.invoked_subcommand is not None:
+        return
     
     # Setup logging
     setup_logging(log_level)
@@ -93,6 +132,8 @@ def main(
         log_level=log_level,
         data_dir=data_dir,
         database_timeout=database_timeout,
+        partition_period=partition_period,
+        partition_hot_periods=partition_hot_periods,
         cors_origins=cors_origins_list
     )
     
@@ -101,6 +142,11 @@ def main(
     
     logger.info(f"Starting Eventuali API Server on {host}:{port}")
     logger.info(f"Data directory: {data_dir}")
+    if partition_period:
+        logger.info(
+            f"Partitioning by {partition_period}, "
+            f"{partition_hot_periods} periods kept in events.db"
+        )
     logger.info(f"Reload mode: {reload}")
     logger.info(f"Log level: {log_level}")
     
@@ -121,5 +167,185 @@ def main(
         sys.exit(1)
 
 
+def open_store(data_dir: str) -> sqlite3.Connection:
+    """Open the event store under ``data_dir`` read-only."""
+    db_path = Path(data_dir) / "events.db"
+    if not db_path.exists():
+        raise click.ClickException(f"No event store at {db_path}")
+    conn = sqlite3.connect(f"{db_path.absolute().as_uri()}?mode=ro", uri=True)
+    conn.row_factory = sqlite3.Row
+    positioned = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE name = 'event_positions'"
+    ).fetchone()
+    if not positioned:
+        conn.close()
+        raise click.ClickException(
+            f"{db_path} has no event positions yet; start the server on it "
+            "once to assign them"
+        )
+    return conn
+
+
+@main.command()
+@click.option(
+    "--data-dir",
+    default=".events",
+    help="Directory holding the event store",
+    envvar="DATA_DIR"
+)
+@click.option(
+    "--output", "-o",
+    default="-",
+    help="File to write, or - for stdout"
+)
+@click.option(
+    "--gzip/--no-gzip", "compress",
+    default=None,
+    help="Gzip the output (default: when --output ends in .gz)"
+)
+@click.option(
+    "--after",
+    default=0,
+    type=click.IntRange(min=0),
+    help="Export events after this global position"
+)
+@click.option(
+    "--to-position",
+    type=click.IntRange(min=0),
+    help="Last position to export (default: the current end)"
+)
+@click.option("--since", help="Inclusive start time (ISO 8601)")
+@click.option("--until", help="Exclusive end time (ISO 8601)")
+@click.option("--aggregate-type", help="Only export this aggregate type")
+@click.option("--event-type", help="Only export this event type")
+def export(
+    data_dir: str,
+    output: str,
+    compress: Optional[bool],
+    after: int,
+    to_position: Optional[int],
+    since: Optional[str],
+    until: Optional[str],
+    aggregate_type: Optional[str],
+    event_type: Optional[str]
+) -> None:
+    """Export the event log as NDJSON.
+    
+    Events are written in append order with their global positions,
+    including those moved to partition files.  If an export is
+    interrupted, rerun it with --after set to the last position written
+    to continue where it stopped.
+    """
+    if compress is None:
+        compress = output.endswith(".gz")
+    
+    conn = open_store(data_dir)
+    partitions = [
+        partition.connect()
+        for partition in list_partitions(Path(data_dir) / "partitions")
+        if partition.overlaps(
+            since and normalize_timestamp(since),
+            until and normalize_timestamp(until)
+        )
+    ]
+    raw = sys.stdout.buffer if output == "-" else open(output, "wb")
+    stream = gzip.GzipFile(fileobj=raw, mode="wb") if compress else raw
+    
+    count, last_position = 0, after
+    try:
+        for record in iter_export(
+            conn,
+            after=after,
+            to_position=to_position,
+            since=since,
+            until=until,
+            aggregate_type=aggregate_type,
+            event_type=event_type,
+            partitions=partitions
+        ):
+            stream.write(ndjson_line(record))
+            count += 1
+            last_position = record["position"]
+    finally:
+        if compress:
+            stream.close()
+        if raw is not sys.stdout.buffer:
+            raw.close()
+        else:
+            raw.flush()
+        for partition in partitions:
+            partition.close()
+        conn.close()
+        click.echo(
+            f"Exported {count} events, last position {last_position}",
+            err=True
+        )
+
+
+@main.command("import")
+@click.argument("source", default="-")
+@click.option(
+    "--data-dir",
+    default=".events",
+    help="Directory holding the event store",
+    envvar="DATA_DIR"
+)
+@click.option(
+    "--batch-size",
+    default=IMPORT_BATCH_SIZE,
+    type=click.IntRange(min=1),
+    help="Events per transaction"
+)
+def import_events(source: str, data_dir: str, batch_size: int) -> None:
+    """Import an NDJSON event log or export archive.
+    
+    SOURCE is a file written by the export (plain or gzip-compressed),
+    or - for stdin.  Events keep their ids, versions and timestamps and
+    are appended in file order; events already in the store are skipped,
+    so an interrupted import can simply be rerun.  An event that takes
+    the version of another event of its aggregate fails the import.
+    Stop the server before importing into its store.
+    """
+    events_dir = Path(data_dir)
+    events_dir.mkdir(exist_ok=True)
+    db_path = events_dir / "events.db"
+    # Let eventuali lay out a new store so the server can open it later
+    asyncio.run(EventStore.create(f"sqlite:///{db_path.absolute()}"))
+    
+    conn = sqlite3.connect(str(db_path))
+    raw = sys.stdin.buffer if source == "-" else open(source, "rb")
+    started = time.monotonic()
+    imported = skipped = 0
+    
+    index_ddl = suspend_maintenance(conn)
+    try:
+        records = read_ndjson(open_archive(raw))
+        for imported, skipped in insert_events(conn, records, batch_size):
+            elapsed = time.monotonic() - started
+            click.echo(
+                f"Imported {imported} events "
+                f"({imported / elapsed:,.0f} events/s)",
+                err=True
+            )
+    except ValueError as e:
+        raise click.ClickException(str(e))
+    finally:
+        load_seconds = time.monotonic() - started
+        click.echo("Rebuilding indexes and read models...", err=True)
+        resume_maintenance(conn, index_ddl, rebuild=imported > 0)
+        conn.close()
+        if raw is not sys.stdin.buffer:
+            raw.close()
+    
+    total_seconds = time.monotonic() - started
+    click.echo(
+        f"Imported {imported} events, skipped {skipped} already stored, "
+        f"in {total_seconds:.1f}s "
+        f"({imported / max(load_seconds, 1e-9):,.0f} events/s loading, "
+        f"{total_seconds - load_seconds:.1f}s rebuilding)",
+        err=True
+    )
+
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
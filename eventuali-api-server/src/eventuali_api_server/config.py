@@ -20,6 +20,27 @@ class APIServerConfig:
     data_dir: str = ".events"
     database_timeout: float = 10.0
     
+    # Group commit settings
+    write_batch_window: float = 0.002
+    write_batch_max_size: int = 500
+    
+    # Streaming settings
+    stream_queue_size: int = 1000
+    
+    # Number of newest events kept in memory (0 disables)
+    recent_buffer_size: int = 1000
+    
+    # Number of finished workflow timelines kept in memory (0 disables)
+    timeline_cache_size: int = 256
+    
+    # Attribute paths given an expression index, e.g. ["success"]
+    attribute_indexes: List[str] = None
+    
+    # Time partitioning: "day", "week" or None (one events.db), and the
+    # number of newest periods kept in events.db
+    partition_period: Optional[str] = None
+    partition_hot_periods: int = 2
+    
     # CORS settings
     cors_origins: List[str] = None
     cors_allow_credentials: bool = True
@@ -46,6 +67,16 @@ class APIServerConfig:
         
         if self.cors_allow_headers is None:
             self.cors_allow_headers = ["*"]
+        
+        if self.attribute_indexes is None:
+            self.attribute_indexes = []
+        
+        if self.partition_period not in (None, "day", "week"):
+            raise ValueError(
+                f"Invalid partition period: {self.partition_period!r}"
+            )
+        if self.partition_hot_periods < 1:
+            raise ValueError("partition_hot_periods must be at least 1")
     
     @classmethod
     def from_env(cls) -> "APIServerConfig":
@@ -56,6 +87,12 @@ class APIServerConfig:
         else:
             cors_origins_list = None
         
+        attribute_indexes = [
+            path.strip()
+            for path in os.getenv("ATTRIBUTE_INDEXES", "").split(",")
+            if path.strip()
+        ]
+        
         return cls(
             host=os.getenv("HOST", "127.0.0.1"),
             port=int(os.getenv("PORT", "8765")),
@@ -63,6 +100,16 @@ class APIServerConfig:
             log_level=os.getenv("LOG_LEVEL", "info").lower(),
             data_dir=os.getenv("DATA_DIR", ".events"),
             database_timeout=float(os.getenv("DATABASE_TIMEOUT", "10.0")),
+            write_batch_window=float(os.getenv("WRITE_BATCH_WINDOW", "0.002")),
+            write_batch_max_size=int(os.getenv("WRITE_BATCH_MAX_SIZE", "500")),
+            stream_queue_size=int(os.getenv("STREAM_QUEUE_SIZE", "1000")),
+            recent_buffer_size=int(os.getenv("RECENT_BUFFER_SIZE", "1000")),
+            timeline_cache_size=int(os.getenv("TIMELINE_CACHE_SIZE", "256")),
+            attribute_indexes=attribute_indexes,
+            partition_period=(
+                os.getenv("PARTITION_PERIOD", "").strip().lower() or None
+            ),
+            partition_hot_periods=int(os.getenv("PARTITION_HOT_PERIODS", "2")),
             cors_origins=cors_origins_list,
             cors_allow_credentials=os.getenv("CORS_ALLOW_CREDENTIALS", "true").lower() == "true",
             title=os.getenv("API_TITLE", "Eventuali API Server"),
@@ -0,0 +1,77 @@
+"""In-process fan-out of newly appended events to stream subscribers."""
+
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional, Set
+
+from ..config import get_config
+
+logger = logging.getLogger(__name__)
+
+
+class Subscription:
+    """A single stream client's bounded queue of pending events."""
+
+    def __init__(self, maxsize: int) -> None:
+        # One extra slot is reserved for the lag marker
+        self.maxsize = maxsize
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize + 1)
+        self.overflowed = False
+
+    def push(self, event: Dict[str, Any]) -> bool:
+        """Queue an event, returning False once the client has lagged."""
+        if self.overflowed:
+            return False
+        if self.queue.qsize() >= self.maxsize:
+            # Wake the consumer so it can end the stream after the events
+            # it already has, instead of silently skipping some
+            self.overflowed = True
+            self.queue.put_nowait(None)
+            return False
+        self.queue.put_nowait(event)
+        return True
+
+    async def get(self) -> Optional[Dict[str, Any]]:
+        """Wait for the next event; None means the subscriber lagged."""
+        return await self.queue.get()
+
+
+class EventBroadcaster:
+    """Broadcast hub fed by the emit endpoints after a successful append.
+
+    Each connected stream owns a bounded queue, so the number of clients
+    has no effect on database load.  Clients that fall a full queue behind
+    are disconnected rather than silently losing events.
+    """
+
+    def __init__(self) -> None:
+        self._subscribers: Set[Subscription] = set()
+
+    @property
+    def subscriber_count(self) -> int:
+        """Number of currently connected subscribers."""
+        return len(self._subscribers)
+
+    def subscribe(self) -> Subscription:
+        """Register a new subscriber."""
+        subscription = Subscription(get_config().stream_queue_size)
+        self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Remove a subscriber."""
+        self._subscribers.discard(subscription)
+
+    def publish(self, events: List[Dict[str, Any]]) -> None:
+        """Deliver events to every subscriber without blocking."""
+        for subscription in list(self._subscribers):
+            for event in events:
+                if not subscription.push(event):
+                    logger.warning("Stream subscriber lagged; disconnecting")
+                    self.unsubscribe(subscription)
+                    break
+
+
+# Global broadcaster instances: appended events, and agent status changes
+event_broadcaster = EventBroadcaster()
+status_broadcaster = EventBroadcaster()
@@ -0,0 +1,191 @@
+"""In-memory caches: the hot tail of recent events and derived results."""
+
+import bisect
+import logging
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from .reader import normalize_timestamp
+
+logger = logging.getLogger(__name__)
+
+SortKey = Tuple[str, int]
+
+
+def _sort_key(event: Dict[str, Any]) -> SortKey:
+    return (event.get('timestamp') or '', event['position'])
+
+
+class RecentEventBuffer:
+    """Bounded, ordered buffer of the newest serialized events.
+
+    The buffer holds exactly the ``capacity`` greatest events by
+    (timestamp, position) -- the same order GET /events lists them in --
+    so any query whose page lies inside that window can be answered from
+    memory.  It also remembers the highest position it does *not* hold,
+    which tells it when an ``after`` query is fully covered.  Queries it
+    cannot answer exactly return None and go to the store.
+
+    The buffer only sees appends made through this process.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+        self._keys: List[SortKey] = []
+        self._events: List[Dict[str, Any]] = []
+        self._outside_max_position = 0
+        self._complete = False
+        self._seeded = False
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the buffer is configured and seeded."""
+        return self.capacity > 0 and self._seeded
+
+    def seed(
+        self, newest_first: List[Dict[str, Any]], max_position: int
+    ) -> None:
+        """Fill the buffer from the store's newest events."""
+        self._keys = []
+        self._events = []
+        for event in reversed(newest_first[:self.capacity]):
+            self._keys.append(_sort_key(event))
+            self._events.append(event)
+
+        held = {event['position'] for event in self._events}
+        # Anything at or below the store's max position that we do not
+        # hold may exist outside the buffer
+        self._complete = len(newest_first) < self.capacity
+        if self._complete:
+            self._outside_max_position = 0
+        elif max_position in held:
+            self._outside_max_position = max_position - 1
+        else:
+            self._outside_max_position = max_position
+        self._seeded = True
+        logger.info(
+            f"Recent event buffer seeded with {len(self._events)} events"
+        )
+
+    def add(self, events: List[Dict[str, Any]]) -> None:
+        """Insert freshly appended events, evicting the oldest."""
+        if not self.enabled:
+            return
+        for event in events:
+            key = _sort_key(event)
+            index = bisect.bisect_left(self._keys, key)
+            if index < len(self._keys) and self._keys[index] == key:
+                continue
+            self._keys.insert(index, key)
+            self._events.insert(index, event)
+
+        while len(self._events) > self.capacity:
+            self._keys.pop(0)
+            evicted = self._events.pop(0)
+            self._complete = False
+            self._outside_max_position = max(
+                self._outside_max_position, evicted['position']
+            )
+
+    def query(
+        self,
+        limit: int,
+        offset: int = 0,
+        aggregate_type: Optional[str] = None,
+        event_type: Optional[str] = None,
+        since: Optional[str] = None,
+        after: Optional[int] = None,
+        before: Optional[SortKey] = None,
+        index_filters: Optional[Dict[str, str]] = None,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Answer a query from memory, or return None to use the store."""
+        if not self.enabled:
+            return None
+
+        since_key = normalize_timestamp(since) if since else None
+
+        def matches(event: Dict[str, Any]) -> bool:
+            if aggregate_type and event['aggregate_type'] != aggregate_type:
+                return False
+            if event_type and event['event_type'] != event_type:
+                return False
+            if since_key and not (event.get('timestamp') or '') > since_key:
+                return False
+            for name, value in (index_filters or {}).items():
+                # Serialized events carry the resolved index fields
+                if event.get(name) is None or str(event[name]) != value:
+                    return False
+            return True
+
+        wanted = offset + limit
+
+        if after is not None:
+            if after < self._outside_max_position:
+                return None
+            found = sorted(
+                (
+                    e for e in self._events
+                    if e['position'] > after and matches(e)
+                ),
+                key=lambda e: e['position']
+            )
+            return found[offset:wanted]
+
+        end = len(self._events)
+        if before is not None:
+            end = bisect.bisect_left(self._keys, tuple(before))
+
+        found = []
+        for index in range(end - 1, -1, -1):
+            event = self._events[index]
+            if matches(event):
+                found.append(event)
+                if len(found) == wanted:
+                    return found[offset:]
+
+        # Ran out of buffered events before filling the page; that is
+        # still exact if nothing outside the buffer could match
+        exhaustive = self._complete or (
+            since_key is not None
+            and bool(self._keys)
+            and self._keys[0][0] <= since_key
+        )
+        if exhaustive:
+            return found[offset:]
+        return None
+
+
+class PositionedCache:
+    """Bounded LRU of results derived from the events up to a position.
+
+    Each entry is stored with the global position of the last event it
+    reflects.  A lookup with a different position is a miss, so an entry
+    is invalidated exactly when a new event lands on its key.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self._entries: OrderedDict[str, Tuple[int, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str, position: int) -> Optional[Any]:
+        """Return the value cached for ``key`` at ``position``, if any."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] != position:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def put(self, key: str, position: int, value: Any) -> None:
+        """Cache a value derived from the events up to ``position``."""
+        if self.max_size <= 0:
+            return
+        self._entries[key] = (position, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
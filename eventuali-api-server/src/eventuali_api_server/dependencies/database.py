@@ -2,12 +2,21 @@
 
 import asyncio
 import logging
+from datetime import date, datetime, timezone
 from pathlib import Path
-from typing import AsyncGenerator, List, Dict, Any, Optional
+from typing import AsyncGenerator, List, Dict, Any, Optional, Tuple
 
 from eventuali import EventStore, Event
 
 from ..config import get_config
+from .broadcast import event_broadcaster, status_broadcaster
+from .cache import PositionedCache, RecentEventBuffer
+from .export import EXPORT_PAGE_SIZE
+from .filters import AttributeFilter
+from .partitions import hot_cutoff
+from .reader import EventReader
+from .timeline import build_timeline
+from .writer import WriteCoalescer
 
 logger = logging.getLogger(__name__)
 
@@ -17,8 +26,14 @@ class DatabaseManager:
     
     def __init__(self) -> None:
         self._store: EventStore | None = None
+        self._reader: EventReader | None = None
+        self._writer: WriteCoalescer | None = None
         self._lock = asyncio.Lock()
         self.config = get_config()
+        self._recent = RecentEventBuffer(self.config.recent_buffer_size)
+        self._timelines = PositionedCache(self.config.timeline_cache_size)
+        self._partitioned_before: Optional[date] = None
+        self._sealing: Optional[asyncio.Task] = None
     
     async def get_store(self) -> EventStore:
         """Get or create EventStore instance."""
@@ -43,11 +58,57 @@ class DatabaseManager:
                     EventStore.register_event_class("SystemEvent", SystemEvent)
                     
                     logger.info("EventStore initialized and custom event classes registered")
+                    
+                    # Indexed read path over the same SQLite file
+                    partitions_dir = None
+                    if self.config.partition_period:
+                        partitions_dir = events_dir.absolute() / "partitions"
+                    self._reader = EventReader(
+                        db_path.absolute(),
+                        timeout=self.config.database_timeout,
+                        attribute_indexes=self.config.attribute_indexes,
+                        partitions_dir=partitions_dir
+                    )
+                    await self._reader.ensure_schema()
+                    await self.seal_partitions()
+                    
+                    # Seed the in-memory hot tail; read the max position
+                    # first so it bounds everything the seed may miss
+                    if self._recent.capacity > 0:
+                        max_position = await self._reader.max_position()
+                        newest = await self._reader.fetch_events(
+                            limit=self._recent.capacity
+                        )
+                        self._recent.seed(newest, max_position)
+                    
+                    # Group commit for concurrent emit requests
+                    self._writer = WriteCoalescer(
+                        self._store,
+                        window=self.config.write_batch_window,
+                        max_batch=self.config.write_batch_max_size,
+                        on_commit=self.publish_appended
+                    )
         
         return self._store
     
+    async def get_reader(self) -> EventReader:
+        """Get the SQLite reader, initializing the store if needed."""
+        await self.get_store()
+        return self._reader
+    
     async def close(self) -> None:
         """Close the EventStore connection."""
+        if self._sealing is not None:
+            # Let a running seal finish its transaction first
+            await asyncio.gather(self._sealing, return_exceptions=True)
+            self._sealing = None
+        self._partitioned_before = None
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+        self._writer = None
+        self._recent = RecentEventBuffer(self.config.recent_buffer_size)
+        self._timelines = PositionedCache(self.config.timeline_cache_size)
         if self._store is not None:
             # EventStore cleanup if needed
             self._store = None
@@ -59,160 +120,528 @@ class DatabaseManager:
         offset: int = 0,
         aggregate_type: Optional[str] = None,
         event_type: Optional[str] = None,
-        since: Optional[str] = None
+        since: Optional[str] = None,
+        after: Optional[int] = None,
+        before: Optional[Tuple[str, int]] = None,
+        index_filters: Optional[Dict[str, str]] = None,
+        attribute_filters: Optional[List[AttributeFilter]] = None
     ) -> List[Dict[str, Any]]:
-        """Get recent events from the event store."""
-        store = await self.get_store()
+        """Get a page of events, most recent first.
+        
+        Filtering, ordering and pagination run as indexed SQLite queries,
+        so the cost depends on the page size rather than the log size.
+        With ``after``, events past that global position are returned in
+        append order instead.  ``before`` continues a most-recent-first
+        listing from a (timestamp, position) keyset bound.
+        ``index_filters`` select by event name, correlation, causation,
+        agent id or agent name through the event_index read model.
+        ``attribute_filters`` compare attributes of the event payload.
+        
+        Pages that fall inside the in-memory window of recent events are
+        answered without touching the store.
+        """
+        reader = await self.get_reader()
+        
+        if not attribute_filters:
+            cached = self._recent.query(
+                limit=limit,
+                offset=offset,
+                aggregate_type=aggregate_type,
+                event_type=event_type,
+                since=since,
+                after=after,
+                before=before,
+                index_filters=index_filters
+            )
+            if cached is not None:
+                return cached
         
         try:
-            # Load events from specified aggregate types or all
-            if aggregate_type:
-                events = await asyncio.wait_for(
-                    store.load_events_by_type(aggregate_type), 
+            return await asyncio.wait_for(
+                reader.fetch_events(
+                    limit=limit,
+                    offset=offset,
+                    aggregate_type=aggregate_type,
+                    event_type=event_type,
+                    since=since,
+                    after=after,
+                    before=before,
+                    index_filters=index_filters,
+                    attribute_filters=attribute_filters
+                ),
+                timeout=self.config.database_timeout
+            )
+        except asyncio.TimeoutError:
+            logger.error("Timeout loading events")
+            return []
+        except Exception as e:
+            logger.error(f"Error retrieving events: {e}")
+            return []
+    
+    async def count_events(
+        self,
+        aggregate_type: Optional[str] = None,
+        event_type: Optional[str] = None,
+        since: Optional[str] = None,
+        after: Optional[int] = None,
+        index_filters: Optional[Dict[str, str]] = None,
+        attribute_filters: Optional[List[AttributeFilter]] = None
+    ) -> Tuple[Optional[int], bool]:
+        """Count the events matching a GET /events filter.
+        
+        Returns ``(count, estimated)``, or ``(None, False)`` if the count
+        could not be computed.
+        """
+        reader = await self.get_reader()
+        
+        try:
+            return await asyncio.wait_for(
+                reader.count_events(
+                    aggregate_type=aggregate_type,
+                    event_type=event_type,
+                    since=since,
+                    after=after,
+                    index_filters=index_filters,
+                    attribute_filters=attribute_filters
+                ),
+                timeout=self.config.database_timeout
+            )
+        except Exception as e:
+            logger.error(f"Error counting events: {e}")
+            return None, False
+    
+    async def search_events(
+        self,
+        query: str,
+        limit: int = 100,
+        aggregate_type: Optional[str] = None,
+        workflow_id: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        before: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Full-text search over events, newest first.
+        
+        Raises:
+            ValueError: If the query is not valid FTS5 syntax.
+        """
+        reader = await self.get_reader()
+        
+        return await asyncio.wait_for(
+            reader.search_events(
+                query,
+                limit=limit,
+                aggregate_type=aggregate_type,
+                workflow_id=workflow_id,
+                since=since,
+                until=until,
+                before=before
+            ),
+            timeout=self.config.database_timeout
+        )
+    
+    async def iter_events_after(
+        self,
+        position: int,
+        aggregate_type: Optional[str] = None,
+        event_type: Optional[str] = None,
+        page_size: int = 500
+    ) -> AsyncGenerator[List[Dict[str, Any]], None]:
+        """Yield every event past a global position, in append order.
+        
+        Pages are read until the store is exhausted.  Unlike
+        get_recent_events, read errors are raised rather than turned
+        into an empty page, so a replay never silently skips events.
+        """
+        reader = await self.get_reader()
+        
+        while True:
+            page = self._recent.query(
+                limit=page_size,
+                aggregate_type=aggregate_type,
+                event_type=event_type,
+                after=position
+            )
+            if page is None:
+                page = await asyncio.wait_for(
+                    reader.fetch_events(
+                        limit=page_size,
+                        aggregate_type=aggregate_type,
+                        event_type=event_type,
+                        after=position
+                    ),
                     timeout=self.config.database_timeout
                 )
-            else:
-                # Load from all aggregate types
-                tasks = [
-                    store.load_events_by_type("agent_aggregate"),
-                    store.load_events_by_type("workflow_aggregate"), 
-                    store.load_events_by_type("system_aggregate"),
-                    store.load_events_by_type("event_aggregate"),  # Legacy
-                ]
-                
-                try:
-                    results = await asyncio.wait_for(
-                        asyncio.gather(*tasks, return_exceptions=True),
-                        timeout=self.config.database_timeout
-                    )
-                    
-                    all_events = []
-                    for result in results:
-                        if isinstance(result, Exception):
-                            logger.warning(f"Failed to load events: {result}")
-                            continue
-                        all_events.extend(list(result))
-                    
-                    events = all_events
-                    
-                except asyncio.TimeoutError:
-                    logger.error("Timeout loading events")
-                    return []
+            if not page:
+                return
             
-            # Convert events to dictionaries
-            event_dicts = []
-            for event in events:
-                event_dict = event.to_dict()
-                
-                # Add metadata fields
-                event_dict.update({
-                    'event_id': str(event.event_id),
-                    'aggregate_id': event.aggregate_id,
-                    'aggregate_type': event.aggregate_type,
-                    'event_type': event.event_type,
-                    'aggregate_version': event.aggregate_version,
-                    'timestamp': event.timestamp.isoformat() if event.timestamp else None,
-                    'user_id': event.user_id,
-                    'causation_id': str(event.causation_id) if event.causation_id else None,
-                    'correlation_id': str(event.correlation_id) if event.correlation_id else None,
-                    'attributes': getattr(event, 'attributes', {}),
-                    'agent_name': getattr(event, 'agent_name', ''),
-                    'agent_id': getattr(event, 'agent_id', ''),
-                    'parent_agent_id': getattr(event, 'parent_agent_id', ''),
-                    'workflow_id': getattr(event, 'workflow_id', ''),
-                    'event_name': getattr(event, 'event_name', ''),
-                })
-                
-                # Override correlation/causation with agent-specific fields
-                if event_dict.get('workflow_id'):
-                    event_dict['correlation_id'] = event_dict['workflow_id']
-                if event_dict.get('parent_agent_id'):
-                    event_dict['causation_id'] = event_dict['parent_agent_id']
-                
-                # Filter by event type if specified
-                if event_type is None or event.event_type == event_type:
-                    event_dicts.append(event_dict)
+            yield page
+            position = page[-1]['position']
+            if len(page) < page_size:
+                return
+    
+    async def get_max_position(self) -> int:
+        """Get the global position of the last appended event."""
+        reader = await self.get_reader()
+        return await asyncio.wait_for(
+            reader.max_position(),
+            timeout=self.config.database_timeout
+        )
+    
+    async def iter_export(
+        self,
+        after: int = 0,
+        to_position: Optional[int] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        aggregate_type: Optional[str] = None,
+        event_type: Optional[str] = None,
+        page_size: int = EXPORT_PAGE_SIZE
+    ) -> AsyncGenerator[List[Dict[str, Any]], None]:
+        """Yield pages of export records from ``after`` to ``to_position``.
+        
+        Only one page is held at a time.  Like iter_events_after, read
+        errors are raised so an export is never silently truncated.
+        """
+        reader = await self.get_reader()
+        if to_position is None:
+            to_position = await reader.max_position()
+        
+        while True:
+            page = await asyncio.wait_for(
+                reader.fetch_export_page(
+                    after,
+                    to_position,
+                    since=since,
+                    until=until,
+                    aggregate_type=aggregate_type,
+                    event_type=event_type,
+                    page_size=page_size
+                ),
+                timeout=self.config.database_timeout
+            )
+            if page:
+                yield page
+            if len(page) < page_size:
+                return
+            after = page[-1]['position']
+    
+    async def append_events(self, events: List[Event]) -> None:
+        """Append events through the group-commit writer.
+        
+        Returns once the commit containing the events has completed;
+        subscribers are notified after that commit.
+        """
+        await self.get_store()
+        await self._writer.append(events)
+        
+        # Seal the periods that fell out of the hot window since the last
+        # run in the background; appends never wait for it
+        if (
+            self._partition_cutoff() != self._partitioned_before
+            and (self._sealing is None or self._sealing.done())
+        ):
+            self._sealing = asyncio.create_task(self.seal_partitions())
+    
+    def _partition_cutoff(self) -> Optional[date]:
+        """Start of the oldest period kept in events.db, if partitioned."""
+        if not self.config.partition_period:
+            return None
+        return hot_cutoff(
+            datetime.now(timezone.utc).date(),
+            self.config.partition_period,
+            self.config.partition_hot_periods
+        )
+    
+    async def seal_partitions(self) -> None:
+        """Move events older than the hot periods into partition files.
+        
+        Does nothing unless partitioning is configured.  Failures are
+        logged and retried on a later append.
+        """
+        cutoff = self._partition_cutoff()
+        if cutoff is None:
+            return
+        
+        try:
+            sealed = await self._reader.seal_partitions(
+                self.config.partition_period, cutoff
+            )
+            self._partitioned_before = cutoff
+            if sealed:
+                logger.info(
+                    f"Sealed {len(sealed)} partitions before {cutoff}"
+                )
+        except Exception as e:
+            logger.error(f"Error sealing partitions: {e}")
+    
+    async def publish_appended(self, events: List[Event]) -> None:
+        """Feed freshly appended events to the hot tail and subscribers.
+        
+        Events are read back once by primary key so the recent buffer and
+        every subscriber share the stored representation, however many
+        clients are connected.  Agent status changes made by the commit
+        are published to status subscribers.
+        """
+        if not events:
+            return
+        if (
+            not self._recent.enabled
+            and event_broadcaster.subscriber_count == 0
+            and status_broadcaster.subscriber_count == 0
+        ):
+            return
+        
+        reader = await self.get_reader()
+        
+        try:
+            event_dicts = await reader.fetch_events_by_ids(
+                [str(event.event_id) for event in events]
+            )
+            self._recent.add(event_dicts)
+            event_broadcaster.publish(event_dicts)
             
-            # Filter by timestamp if specified
-            if since:
-                event_dicts = [
-                    e for e in event_dicts 
-                    if e.get('timestamp', '') > since
+            if status_broadcaster.subscriber_count:
+                agent_events = [
+                    event for event in event_dicts
+                    if event['aggregate_type'] == 'agent_aggregate'
                 ]
-            
-            # Sort by timestamp (most recent first)
-            event_dicts.sort(
-                key=lambda x: x.get('timestamp', ''), 
-                reverse=True
+                transitions = await reader.fetch_status_transitions(
+                    list({event['aggregate_id'] for event in agent_events}),
+                    [event['position'] for event in agent_events]
+                )
+                status_broadcaster.publish(transitions)
+        except Exception as e:
+            logger.error(f"Error publishing appended events: {e}")
+    
+    async def get_aggregate_events(
+        self,
+        aggregate_id: str,
+        aggregate_type: str,
+        limit: int = 100,
+        from_version: Optional[int] = None,
+        to_version: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Get one aggregate's events in version order."""
+        reader = await self.get_reader()
+        
+        try:
+            return await asyncio.wait_for(
+                reader.fetch_aggregate_events(
+                    aggregate_id,
+                    aggregate_type=aggregate_type,
+                    from_version=from_version,
+                    to_version=to_version,
+                    limit=limit
+                ),
+                timeout=self.config.database_timeout
             )
-            
-            # Apply pagination
-            start_idx = offset
-            end_idx = offset + limit
-            return event_dicts[start_idx:end_idx]
-            
+        except asyncio.TimeoutError:
+            logger.error(f"Timeout loading events for {aggregate_id}")
+            return []
         except Exception as e:
-            logger.error(f"Error retrieving events: {e}")
+            logger.error(f"Error retrieving events for {aggregate_id}: {e}")
             return []
     
-    async def get_agent_events(self, agent_id: str, limit: int = 100) -> List[Dict[str, Any]]:
+    async def get_agent_events(
+        self,
+        agent_id: str,
+        limit: int = 100,
+        from_version: Optional[int] = None,
+        to_version: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
         """Get all events for a specific agent aggregate."""
-        return await self.get_recent_events(
+        return await self.get_aggregate_events(
+            agent_id,
+            "agent_aggregate",
             limit=limit,
-            aggregate_type="agent_aggregate"
+            from_version=from_version,
+            to_version=to_version
         )
     
-    async def get_workflow_events(self, workflow_id: str, limit: int = 100) -> List[Dict[str, Any]]:
+    async def get_workflow_events(
+        self,
+        workflow_id: str,
+        limit: int = 100,
+        from_version: Optional[int] = None,
+        to_version: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
         """Get all events for a specific workflow aggregate."""
-        return await self.get_recent_events(
+        return await self.get_aggregate_events(
+            workflow_id,
+            "workflow_aggregate",
             limit=limit,
-            aggregate_type="workflow_aggregate"
+            from_version=from_version,
+            to_version=to_version
         )
     
-    async def get_system_events(self, session_id: str, limit: int = 100) -> List[Dict[str, Any]]:
+    async def get_system_events(
+        self,
+        session_id: str,
+        limit: int = 100,
+        from_version: Optional[int] = None,
+        to_version: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
         """Get all events for a specific system/session aggregate."""
-        return await self.get_recent_events(
+        return await self.get_aggregate_events(
+            session_id,
+            "system_aggregate",
             limit=limit,
-            aggregate_type="system_aggregate"
+            from_version=from_version,
+            to_version=to_version
         )
     
     async def get_workflow_agents(self, workflow_id: str) -> List[Dict[str, Any]]:
-        """Get all agents that participated in a specific workflow."""
-        store = await self.get_store()
+        """Get all agents that participated in a specific workflow.
+        
+        Served from the workflow_agents projection, one row per agent
+        with its first/last event time, parent, status and event count.
+        """
+        reader = await self.get_reader()
         
         try:
-            events = await store.load_events_by_type("agent_aggregate")
-            
-            workflow_agents = []
-            seen_agents = set()
-            
-            for event in events:
-                event_dict = event.to_dict()
-                
-                correlation_id = event_dict.get('correlation_id')
-                if correlation_id == workflow_id:
-                    agent_id = event_dict.get('aggregate_id')
-                    
-                    if agent_id and agent_id not in seen_agents:
-                        seen_agents.add(agent_id)
-                        
-                        agent_name = agent_id.split('-')[0] if '-' in agent_id else 'unknown'
-                        
-                        workflow_agents.append({
-                            'agent_id': agent_id,
-                            'agent_name': agent_name,
-                            'workflow_id': workflow_id,
-                            'first_event_time': event_dict.get('timestamp'),
-                            'event_type': event_dict.get('event_type')
-                        })
-            
-            workflow_agents.sort(key=lambda x: x.get('first_event_time', ''))
-            return workflow_agents
-            
+            return await asyncio.wait_for(
+                reader.fetch_workflow_agents(workflow_id),
+                timeout=self.config.database_timeout
+            )
         except Exception as e:
             logger.error(f"Error retrieving workflow agents: {e}")
             return []
-
+    
+    async def get_agent_statuses(
+        self,
+        status: Optional[str] = None,
+        workflow_id: Optional[str] = None,
+        agent_name: Optional[str] = None,
+        limit: int = 100
+    ) -> List[Dict[str, Any]]:
+        """Get current agent statuses from the agent_status projection."""
+        reader = await self.get_reader()
+        
+        try:
+            return await asyncio.wait_for(
+                reader.fetch_agent_statuses(
+                    status=status,
+                    workflow_id=workflow_id,
+                    agent_name=agent_name,
+                    limit=limit
+                ),
+                timeout=self.config.database_timeout
+            )
+        except Exception as e:
+            logger.error(f"Error retrieving agent statuses: {e}")
+            return []
+    
+    async def get_workflow_summaries(
+        self,
+        status: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        min_duration_ms: Optional[int] = None,
+        before: Optional[Tuple[str, int]] = None,
+        limit: int = 100,
+        slowest: int = 3
+    ) -> List[Dict[str, Any]]:
+        """Get a page of workflow summaries, most recently started first.
+        
+        Raises:
+            Exception: If the query fails, so callers can tell an empty
+            page from an error.
+        """
+        reader = await self.get_reader()
+        
+        return await asyncio.wait_for(
+            reader.fetch_workflow_summaries(
+                status=status,
+                since=since,
+                until=until,
+                min_duration_ms=min_duration_ms,
+                before=before,
+                limit=limit,
+                slowest=slowest
+            ),
+            timeout=self.config.database_timeout
+        )
+    
+    async def get_workflow_summary(
+        self, workflow_id: str, slowest: int = 3
+    ) -> Optional[Dict[str, Any]]:
+        """Get the summary of one workflow, or None if it is unknown."""
+        reader = await self.get_reader()
+        
+        return await asyncio.wait_for(
+            reader.fetch_workflow_summary(workflow_id, slowest),
+            timeout=self.config.database_timeout
+        )
+    
+    async def get_descendants(
+        self, agent_id: str, max_depth: int = 100, limit: int = 1000
+    ) -> List[Dict[str, Any]]:
+        """Get every agent descended from an agent via causation edges."""
+        reader = await self.get_reader()
+        
+        return await asyncio.wait_for(
+            reader.fetch_descendants(agent_id, max_depth, limit),
+            timeout=self.config.database_timeout
+        )
+    
+    async def get_ancestry(
+        self, event_id: str, max_depth: int = 100
+    ) -> Optional[Dict[str, Any]]:
+        """Get an event and its chain of causing agents, or None."""
+        reader = await self.get_reader()
+        
+        return await asyncio.wait_for(
+            reader.fetch_ancestry(event_id, max_depth),
+            timeout=self.config.database_timeout
+        )
+    
+    async def get_workflow_tree(
+        self, workflow_id: str
+    ) -> List[Dict[str, Any]]:
+        """Get a workflow's agents as a causation tree."""
+        reader = await self.get_reader()
+        
+        return await asyncio.wait_for(
+            reader.fetch_workflow_tree(workflow_id),
+            timeout=self.config.database_timeout
+        )
+    
+    async def get_workflow_timeline(
+        self, workflow_id: str
+    ) -> Optional[Dict[str, Any]]:
+        """Get the critical path and timeline of a workflow, or None.
+        
+        Timelines of completed or failed workflows are cached against the
+        position of the workflow's last event, so they are recomputed
+        only when another event lands on the workflow.
+        """
+        reader = await self.get_reader()
+        
+        summary = await asyncio.wait_for(
+            reader.fetch_workflow_row(workflow_id),
+            timeout=self.config.database_timeout
+        )
+        if summary is None:
+            return None
+        
+        cached = self._timelines.get(workflow_id, summary["last_position"])
+        if cached is not None:
+            return cached
+        
+        agents, edges = await asyncio.wait_for(
+            reader.fetch_timeline_inputs(workflow_id),
+            timeout=self.config.database_timeout
+        )
+        timeline = await asyncio.to_thread(
+            build_timeline, summary, agents, edges
+        )
+        if summary["status"] in ("completed", "failed"):
+            self._timelines.put(
+                workflow_id, summary["last_position"], timeline
+            )
+        return timeline
+    
     async def health_check(self) -> bool:
         """Check if database connection is healthy."""
         try:
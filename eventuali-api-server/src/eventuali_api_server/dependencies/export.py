@@ -0,0 +1,136 @@
+"""NDJSON export of the raw event log.
+
+Each exported line is one row of the events table with its global
+position and its JSON columns decoded, so an export can be analysed
+offline or loaded into another store with ids, versions and timestamps
+intact.  Rows are read in position order, one keyset page at a time, so
+an export of any size runs in constant memory and can be resumed after
+the last position received.
+"""
+
+import heapq
+import json
+import sqlite3
+from operator import itemgetter
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .read_models import MAX_POSITION_SQL, POSITIONED_EVENTS
+from .reader import normalize_timestamp
+
+EXPORT_COLUMNS = (
+    "p.position AS position, events.id, events.aggregate_id, "
+    "events.aggregate_type, events.event_type, events.event_version, "
+    "events.aggregate_version, events.event_data, events.event_data_type, "
+    "events.metadata, events.timestamp"
+)
+
+EXPORT_PAGE_SIZE = 1000
+
+
+def _decode(value: Optional[str]) -> Any:
+    if value is None:
+        return None
+    try:
+        return json.loads(value)
+    except ValueError:
+        return value
+
+
+def row_to_record(row: sqlite3.Row) -> Dict[str, Any]:
+    """Convert an events row to an export record."""
+    record = dict(row)
+    if record["event_data_type"] == "json":
+        record["event_data"] = _decode(record["event_data"])
+    record["metadata"] = _decode(record["metadata"])
+    return record
+
+
+def export_filters(
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    aggregate_type: Optional[str] = None,
+    event_type: Optional[str] = None,
+) -> Tuple[List[str], List[Any]]:
+    """WHERE clauses for an export's time range and type filters."""
+    clauses: List[str] = []
+    params: List[Any] = []
+    if since:
+        clauses.append("p.timestamp >= ?")
+        params.append(normalize_timestamp(since))
+    if until:
+        clauses.append("p.timestamp < ?")
+        params.append(normalize_timestamp(until))
+    if aggregate_type:
+        clauses.append("p.aggregate_type = ?")
+        params.append(aggregate_type)
+    if event_type:
+        clauses.append("p.event_type = ?")
+        params.append(event_type)
+    return clauses, params
+
+
+def fetch_export_page(
+    conn: sqlite3.Connection,
+    after: int,
+    to_position: int,
+    clauses: List[str],
+    params: List[Any],
+    page_size: int = EXPORT_PAGE_SIZE,
+) -> List[Dict[str, Any]]:
+    """Fetch the next records after ``after``, up to ``to_position``."""
+    where = " AND ".join(["p.position > ?", "p.position <= ?", *clauses])
+    rows = conn.execute(
+        f"SELECT {EXPORT_COLUMNS} FROM {POSITIONED_EVENTS} WHERE {where} "
+        "ORDER BY p.position ASC LIMIT ?",
+        [after, to_position, *params, page_size]
+    ).fetchall()
+    return [row_to_record(row) for row in rows]
+
+
+def merge_pages(
+    pages: Sequence[List[Dict[str, Any]]], page_size: int
+) -> List[Dict[str, Any]]:
+    """Merge pages read from several stores into one, by position."""
+    return list(heapq.merge(*pages, key=itemgetter("position")))[:page_size]
+
+
+def iter_export(
+    conn: sqlite3.Connection,
+    after: int = 0,
+    to_position: Optional[int] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    aggregate_type: Optional[str] = None,
+    event_type: Optional[str] = None,
+    page_size: int = EXPORT_PAGE_SIZE,
+    partitions: Sequence[sqlite3.Connection] = (),
+) -> Iterator[Dict[str, Any]]:
+    """Yield export records in position order, one page in memory.
+
+    ``to_position`` defaults to the last position when the export
+    starts, so events appended meanwhile are left for the next export.
+    Events of ``partitions`` are merged in.
+    """
+    if to_position is None:
+        to_position = conn.execute(MAX_POSITION_SQL).fetchone()[0]
+    clauses, params = export_filters(since, until, aggregate_type, event_type)
+    while True:
+        page = merge_pages(
+            [
+                fetch_export_page(
+                    source, after, to_position, clauses, params, page_size
+                )
+                for source in (conn, *partitions)
+            ],
+            page_size,
+        )
+        yield from page
+        if len(page) < page_size:
+            return
+        after = page[-1]["position"]
+
+
+def ndjson_line(record: Dict[str, Any]) -> bytes:
+    """Serialize one record as an NDJSON line."""
+    line = json.dumps(record, separators=(",", ":"), default=str)
+    return (line + "\n").encode()
@@ -0,0 +1,139 @@
+"""Attribute predicate filters over the stored event payload.
+
+GET /events accepts query parameters of the form ``attr.<path><op><value>``
+such as ``attr.success=false`` or ``attr.return_code!=0``.  Each one
+compiles to a predicate on the JSON path ``$.attributes.<path>`` of the
+event payload.  Hot paths can be declared in ``ATTRIBUTE_INDEXES`` to get
+an expression index, which SQLite uses because the index and the
+predicates share the exact same expression.
+"""
+
+import json
+import re
+from dataclasses import dataclass
+from typing import Any, Iterable, List, Tuple
+
+ATTRIBUTE_PREFIX = "attr."
+
+MAX_ATTRIBUTE_FILTERS = 10
+
+# Name prefix of the expression indexes managed from ATTRIBUTE_INDEXES
+ATTRIBUTE_INDEX_PREFIX = "idx_events_attr_"
+
+_PATH = re.compile(r"[A-Za-z0-9_]+(\.[A-Za-z0-9_]+)*")
+
+# Operators as they survive query-string parsing: ``attr.a!=1`` arrives
+# as key ``attr.a!`` and value ``1``, ``attr.a>1`` as key ``attr.a>1``
+# with an empty value.  Longer suffixes are tried first.
+_KEY_SUFFIX_OPERATORS = (("!", "!="), (">", ">="), ("<", "<="))
+_INLINE_OPERATORS = (">", "<")
+
+
+def attribute_expression(path: str) -> str:
+    """SQL for an attribute of the event payload.
+
+    Index definitions and query predicates must both use this exact
+    expression for SQLite to match them.
+    """
+    return (
+        "(CASE WHEN json_valid(event_data) "
+        f"THEN json_extract(event_data, '$.attributes.{path}') END)"
+    )
+
+
+def _parse_value(raw: str) -> Any:
+    """Read a JSON scalar, falling back to the raw text."""
+    try:
+        value = json.loads(raw)
+    except ValueError:
+        return raw
+    if isinstance(value, bool):
+        # json_extract returns JSON booleans as 1 and 0
+        return int(value)
+    if value is None or isinstance(value, (int, float, str)):
+        return value
+    return raw
+
+
+def validate_path(path: str) -> str:
+    """Check an attribute path is a dotted run of identifiers.
+
+    Raises:
+        ValueError: If the path could not be embedded in a JSON path.
+    """
+    if not _PATH.fullmatch(path):
+        raise ValueError(f"Invalid attribute path: {path!r}")
+    return path
+
+
+@dataclass(frozen=True)
+class AttributeFilter:
+    """A comparison between one payload attribute and a JSON scalar."""
+
+    path: str
+    op: str
+    value: Any
+
+    def to_sql(self) -> Tuple[str, List[Any]]:
+        """Return the predicate and its parameters."""
+        expression = attribute_expression(self.path)
+        if self.value is None:
+            negate = "NOT " if self.op == "!=" else ""
+            return f"{expression} IS {negate}NULL", []
+        return f"{expression} {self.op} ?", [self.value]
+
+
+def parse_attribute_filters(
+    items: Iterable[Tuple[str, str]]
+) -> List[AttributeFilter]:
+    """Build filters from the ``attr.`` entries of a query string.
+
+    Other keys are ignored.
+
+    Raises:
+        ValueError: If a filter is malformed or there are too many.
+    """
+    filters = []
+    for key, raw in items:
+        if not key.startswith(ATTRIBUTE_PREFIX):
+            continue
+        path, op = key[len(ATTRIBUTE_PREFIX):], "="
+        for suffix, suffix_op in _KEY_SUFFIX_OPERATORS:
+            if path.endswith(suffix):
+                path, op = path[:-len(suffix)], suffix_op
+                break
+        else:
+            for inline_op in _INLINE_OPERATORS:
+                if inline_op in path and raw == "":
+                    path, raw = path.split(inline_op, 1)
+                    op = inline_op
+                    break
+
+        validate_path(path)
+        value = _parse_value(raw)
+        if value is None and op not in ("=", "!="):
+            raise ValueError(f"Cannot compare attr.{path} {op} null")
+        filters.append(AttributeFilter(path, op, value))
+
+    if len(filters) > MAX_ATTRIBUTE_FILTERS:
+        raise ValueError(
+            f"At most {MAX_ATTRIBUTE_FILTERS} attribute filters are allowed"
+        )
+    return filters
+
+
+def attribute_index_name(path: str) -> str:
+    """Name of the expression index for an attribute path."""
+    return ATTRIBUTE_INDEX_PREFIX + validate_path(path).replace(".", "__")
+
+
+def attribute_index_sql(path: str) -> str:
+    """DDL for an expression index serving filters on ``path``.
+
+    The timestamp column lets a filtered listing walk the index in time
+    order; only events sharing a timestamp are sorted by position.
+    """
+    return (
+        f"CREATE INDEX IF NOT EXISTS {attribute_index_name(path)} "
+        f"ON events ({attribute_expression(path)}, timestamp)"
+    )
@@ -0,0 +1,194 @@
+"""Bulk import of NDJSON event logs straight into the store.
+
+Reads the records written by the export, keeping each event's id,
+versions and timestamp, and inserts them in large transactions with the
+read-model triggers and secondary indexes out of the way.  Maintaining
+those row by row is what makes appends through the API slow; rebuilding
+them once over the loaded log is far cheaper.  Imports must not run
+alongside a server writing to the same store, whose appends would not
+be projected while the triggers are dropped.
+"""
+
+import gzip
+import json
+import sqlite3
+from typing import IO, Any, Dict, Iterable, Iterator, List, Tuple
+
+from .read_models import (
+    READ_MODELS,
+    install_event_positions,
+    install_read_models,
+)
+from .reader import SCHEMA_STATEMENTS
+
+IMPORT_BATCH_SIZE = 50000
+
+# Skips an event whose id is already stored; any other constraint
+# violation, such as a taken aggregate version, still fails the insert
+INSERT_EVENT = (
+    "INSERT INTO events (id, aggregate_id, aggregate_type, "
+    "event_type, event_version, aggregate_version, event_data, "
+    "event_data_type, metadata, timestamp) "
+    "SELECT ?, ?, ?, ?, ?, ?, ?, ?, ?, ? "
+    "WHERE NOT EXISTS (SELECT 1 FROM events WHERE id = ?1)"
+)
+
+
+def open_archive(raw: IO[bytes]) -> IO[bytes]:
+    """Wrap a binary stream in a decompressor if it is gzip-compressed."""
+    if raw.peek(2)[:2] == b"\x1f\x8b":
+        return gzip.GzipFile(fileobj=raw, mode="rb")
+    return raw
+
+
+def read_ndjson(stream: IO[bytes]) -> Iterator[Dict[str, Any]]:
+    """Yield the records of an NDJSON stream, skipping blank lines.
+
+    Raises:
+        ValueError: If a line is not a JSON object.
+    """
+    for line_number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            raise ValueError(f"Line {line_number}: invalid JSON ({e})")
+        if not isinstance(record, dict):
+            raise ValueError(f"Line {line_number}: expected a JSON object")
+        yield record
+
+
+def _encode(value: Any) -> str:
+    if isinstance(value, str):
+        return value
+    return json.dumps(value, separators=(",", ":"))
+
+
+def record_to_row(record: Dict[str, Any]) -> Tuple[Any, ...]:
+    """Convert an export record to an events row.
+
+    Raises:
+        ValueError: If a required field is missing.
+    """
+    try:
+        return (
+            record["id"],
+            record["aggregate_id"],
+            record["aggregate_type"],
+            record["event_type"],
+            record.get("event_version", 1),
+            record["aggregate_version"],
+            _encode(record["event_data"]),
+            record.get("event_data_type", "json"),
+            _encode(record.get("metadata") or {}),
+            record["timestamp"],
+        )
+    except KeyError as e:
+        raise ValueError(f"Event record is missing {e}")
+
+
+def suspend_maintenance(conn: sqlite3.Connection) -> List[str]:
+    """Drop the read-model triggers and the secondary event indexes.
+
+    Events keep getting their positions as they are inserted.  Returns
+    the DDL of the dropped indexes for resume_maintenance.
+    """
+    with conn:
+        install_event_positions(conn)
+    for model in READ_MODELS:
+        conn.execute(f"DROP TRIGGER IF EXISTS {model.trigger_name}")
+    # Indexes backing constraints have no DDL and cannot be dropped
+    indexes = conn.execute(
+        "SELECT name, sql FROM sqlite_master "
+        "WHERE type = 'index' AND tbl_name IN ('events', 'event_positions') "
+        "AND sql IS NOT NULL"
+    ).fetchall()
+    for name, _ in indexes:
+        conn.execute(f'DROP INDEX IF EXISTS "{name}"')
+    return [sql for _, sql in indexes]
+
+
+def resume_maintenance(
+    conn: sqlite3.Connection, index_ddl: Iterable[str], rebuild: bool = True
+) -> List[str]:
+    """Recreate the dropped indexes and triggers.
+
+    Every read model is rebuilt from the log unless ``rebuild`` is false,
+    which is only safe if no event was inserted meanwhile.  Returns the
+    names of the rebuilt read models.
+    """
+    for statement in [*index_ddl, *SCHEMA_STATEMENTS]:
+        conn.execute(statement)
+    return install_read_models(conn, rebuild=rebuild)
+
+
+def _version_conflict(
+    conn: sqlite3.Connection, batch: List[Tuple[Any, ...]]
+) -> str:
+    """Describe the first event of a failed batch that takes a version.
+
+    Looks for a stored event, or an earlier event of the batch, with the
+    same aggregate version but another id.
+    """
+    seen: Dict[Tuple[Any, Any], Any] = {}
+    for row in batch:
+        event_id, aggregate_id, version = row[0], row[1], row[5]
+        stored = conn.execute(
+            "SELECT id FROM events "
+            "WHERE aggregate_id = ? AND aggregate_version = ?",
+            (aggregate_id, version)
+        ).fetchone()
+        other = stored[0] if stored else seen.get((aggregate_id, version))
+        if other is not None and other != event_id:
+            return (
+                f"Event {event_id} conflicts with event {other}: both are "
+                f"version {version} of aggregate {aggregate_id}"
+            )
+        seen.setdefault((aggregate_id, version), event_id)
+    return "Event conflicts with a stored event"
+
+
+def insert_events(
+    conn: sqlite3.Connection,
+    records: Iterable[Dict[str, Any]],
+    batch_size: int = IMPORT_BATCH_SIZE,
+) -> Iterator[Tuple[int, int]]:
+    """Insert records in transactions of ``batch_size`` events.
+
+    Events whose id is already in the store are skipped, so an
+    interrupted import can be rerun.  Yields the running
+    ``(imported, skipped)`` totals after each commit.
+
+    Raises:
+        ValueError: If an event takes the version of another event of
+            its aggregate.  Batches committed before it are kept.
+    """
+    imported = skipped = 0
+    batch: List[Tuple[Any, ...]] = []
+
+    def flush() -> None:
+        nonlocal imported, skipped
+        conn.execute("BEGIN")
+        try:
+            # Row counts of the statements alone, not of their triggers
+            inserted = conn.executemany(INSERT_EVENT, batch).rowcount
+            conn.execute("COMMIT")
+        except sqlite3.IntegrityError:
+            conn.execute("ROLLBACK")
+            raise ValueError(_version_conflict(conn, batch))
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        imported += inserted
+        skipped += len(batch) - inserted
+        batch.clear()
+
+    for record in records:
+        batch.append(record_to_row(record))
+        if len(batch) >= batch_size:
+            flush()
+            yield imported, skipped
+    if batch:
+        flush()
+        yield imported, skipped
@@ -0,0 +1,294 @@
+"""Time partitions of the event log in per-day or per-week SQLite files.
+
+The EventStore appends to a single ``events.db``.  With partitioning on,
+events older than the newest few periods are moved out of it into
+``partitions/events-<start>_<end>.db``, one file per day or week, which
+is never written again except to take more events of the same period.
+Reads bounded in time are routed to the partitions that overlap them,
+and whole files can be archived or deleted to drop a period.
+
+Three rules keep the live store consistent with the files:
+
+* An aggregate is only moved once its whole stream is older than the
+  cutoff, and its latest event is never moved.  The store looks up the
+  next version of an aggregate as MAX(aggregate_version) over its own
+  events table, so deleting older versions from it is harmless, and an
+  append to a sealed aggregate continues its version sequence.  Stream
+  reads through the EventReader merge the partitions back in; the
+  store's own loads only see the events still in events.db.
+* Events move with their event_positions rows.  The table's
+  AUTOINCREMENT never hands out a position again once it was used, so
+  new events never take a position that a partition already holds.
+* The event_counts read model, the event_index rows and the search
+  index entries of moved events are updated in the same transaction.
+  Each partition carries its own event_counts table, but no search
+  index, so full-text search covers only the events left in events.db.
+  Other read models keep their history.
+
+Period bounds are compared with the stored timestamp strings, as every
+other time filter is, so a partition's rows all sort within its bounds.
+"""
+
+import logging
+import re
+import sqlite3
+from contextlib import closing
+from dataclasses import dataclass
+from datetime import date, timedelta
+from pathlib import Path
+from typing import List, Optional
+
+from .read_models import EVENT_COUNTS, EVENT_NAME, EVENT_SEARCH_DELETE
+
+logger = logging.getLogger(__name__)
+
+PARTITION_PERIODS = ("day", "week")
+
+_PARTITION_FILE = re.compile(
+    r"events-(\d{4}-\d{2}-\d{2})_(\d{4}-\d{2}-\d{2})\.db"
+)
+
+# Period start of an event, from the date prefix of its timestamp;
+# NULL when the timestamp does not start with a date
+_PERIOD_START_SQL = {
+    "day": "date(substr(timestamp, 1, 10))",
+    "week": "date(substr(timestamp, 1, 10), '-6 days', 'weekday 1')",
+}
+
+
+@dataclass(frozen=True)
+class Partition:
+    """A partition file holding events with ``start <= timestamp < end``."""
+
+    path: Path
+    start: str
+    end: str
+
+    def overlaps(
+        self, since: Optional[str] = None, until: Optional[str] = None
+    ) -> bool:
+        """Whether the partition may hold events in since..until."""
+        if since is not None and self.end <= since:
+            return False
+        if until is not None and self.start >= until:
+            return False
+        return True
+
+    def connect(self, timeout: float = 10.0) -> sqlite3.Connection:
+        """Open the partition read-only."""
+        conn = sqlite3.connect(
+            f"{self.path.absolute().as_uri()}?mode=ro",
+            uri=True,
+            timeout=timeout,
+        )
+        conn.row_factory = sqlite3.Row
+        return conn
+
+
+def list_partitions(directory: Path) -> List[Partition]:
+    """The partition files in ``directory``, oldest first."""
+    if not directory.is_dir():
+        return []
+    partitions = []
+    for path in directory.iterdir():
+        match = _PARTITION_FILE.fullmatch(path.name)
+        if match:
+            partitions.append(Partition(path, *match.groups()))
+    return sorted(partitions, key=lambda partition: partition.start)
+
+
+def period_start(day: date, period: str) -> date:
+    """First day of the day or ISO week containing ``day``."""
+    if period == "week":
+        return day - timedelta(days=day.weekday())
+    return day
+
+
+def period_end(start: date, period: str) -> date:
+    """First day after the period beginning at ``start``."""
+    return start + timedelta(days=7 if period == "week" else 1)
+
+
+def hot_cutoff(today: date, period: str, hot_periods: int) -> date:
+    """Start of the oldest period kept in the live store."""
+    cutoff = period_start(today, period)
+    for _ in range(max(hot_periods, 1) - 1):
+        cutoff = period_start(cutoff - timedelta(days=1), period)
+    return cutoff
+
+
+def _create_partition_file(conn: sqlite3.Connection, path: Path) -> None:
+    """Lay out a new partition file like the live events tables."""
+    # Tables first, then their indexes
+    schema_sql = [
+        row[0] for row in conn.execute(
+            "SELECT sql FROM main.sqlite_master "
+            "WHERE type IN ('table', 'index') "
+            "AND tbl_name IN ('events', 'event_positions') "
+            "AND sql IS NOT NULL ORDER BY type = 'index'"
+        )
+    ]
+    with closing(sqlite3.connect(path)) as partition:
+        with partition:
+            exists = partition.execute(
+                "SELECT 1 FROM sqlite_master "
+                "WHERE type = 'table' AND name = 'events'"
+            ).fetchone()
+            if not exists:
+                for statement in schema_sql:
+                    partition.execute(statement)
+            for statement in EVENT_COUNTS.schema:
+                partition.execute(statement)
+
+
+def _seal_period(
+    conn: sqlite3.Connection,
+    path: Path,
+    start: str,
+    end: str,
+    cutoff: str,
+) -> int:
+    """Move one period's sealable events into its partition file."""
+    _create_partition_file(conn, path)
+    columns = ", ".join(
+        row[1] for row in conn.execute("PRAGMA main.table_info(events)")
+    )
+    conn.execute("ATTACH DATABASE ? AS part", (str(path),))
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute(
+                "CREATE TEMP TABLE IF NOT EXISTS sealing "
+                "(position INTEGER PRIMARY KEY)"
+            )
+            conn.execute("DELETE FROM temp.sealing")
+            conn.execute(
+                "INSERT INTO temp.sealing "
+                "SELECT p.position FROM main.event_positions AS p "
+                "JOIN main.events AS e ON e.id = p.id "
+                "WHERE p.timestamp >= ? AND p.timestamp < ? "
+                "AND e.aggregate_version < ("
+                "SELECT MAX(latest.aggregate_version) "
+                "FROM main.events AS latest "
+                "WHERE latest.aggregate_id = e.aggregate_id) "
+                "AND e.aggregate_id NOT IN ("
+                "SELECT hot.aggregate_id FROM main.event_positions AS hp "
+                "JOIN main.events AS hot ON hot.id = hp.id "
+                "WHERE hp.timestamp >= ?)",
+                (start, end, cutoff)
+            )
+            moved = conn.execute(
+                "SELECT COUNT(*) FROM temp.sealing"
+            ).fetchone()[0]
+            if moved:
+                _move_sealed(conn, columns)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+    finally:
+        conn.execute("DETACH DATABASE part")
+    return moved
+
+
+def _move_sealed(conn: sqlite3.Connection, columns: str) -> None:
+    """Copy the events in temp.sealing to the partition and delete them."""
+    sealed = "SELECT position FROM temp.sealing"
+    sealed_ids = (
+        f"SELECT id FROM main.event_positions WHERE position IN ({sealed})"
+    )
+
+    # Count before copying: a rerun after a partial commit may find some
+    # events already in the partition, which must not be counted twice
+    conn.execute(
+        "CREATE TEMP TABLE IF NOT EXISTS sealed_counts "
+        "(aggregate_type, event_type, event_name, added, removed)"
+    )
+    conn.execute("DELETE FROM temp.sealed_counts")
+    conn.execute(
+        "INSERT INTO temp.sealed_counts "
+        "SELECT e.aggregate_type, e.event_type, "
+        f"COALESCE({EVENT_NAME}, ''), "
+        "SUM(p.position NOT IN (SELECT position FROM part.event_positions)), "
+        "COUNT(*) FROM main.event_positions AS p "
+        "JOIN main.events AS e ON e.id = p.id "
+        f"WHERE p.position IN ({sealed}) GROUP BY 1, 2, 3"
+    )
+    conn.execute(
+        "INSERT INTO part.event_counts "
+        "SELECT aggregate_type, event_type, event_name, added "
+        "FROM temp.sealed_counts WHERE added > 0 "
+        "ON CONFLICT (aggregate_type, event_type, event_name) DO UPDATE SET "
+        "count = count + excluded.count"
+    )
+    conn.execute(
+        "UPDATE main.event_counts SET count = event_counts.count - s.removed "
+        "FROM temp.sealed_counts AS s "
+        "WHERE s.aggregate_type = event_counts.aggregate_type "
+        "AND s.event_type = event_counts.event_type "
+        "AND s.event_name = event_counts.event_name"
+    )
+    conn.execute("DELETE FROM main.event_counts WHERE count <= 0")
+
+    conn.execute(
+        f"INSERT OR IGNORE INTO part.events ({columns}) "
+        f"SELECT {columns} FROM main.events WHERE id IN ({sealed_ids})"
+    )
+    conn.execute(
+        "INSERT OR IGNORE INTO part.event_positions "
+        "SELECT * FROM main.event_positions "
+        f"WHERE position IN ({sealed})"
+    )
+    conn.execute(f"DELETE FROM main.event_index WHERE position IN ({sealed})")
+    # Search entries can only be deleted while their events still exist
+    conn.execute(EVENT_SEARCH_DELETE.format(source=(
+        "(SELECT p.position AS position, e.event_data AS event_data "
+        "FROM main.event_positions AS p "
+        "JOIN main.events AS e ON e.id = p.id "
+        f"WHERE p.position IN ({sealed}))"
+    )))
+    conn.execute(f"DELETE FROM main.events WHERE id IN ({sealed_ids})")
+    conn.execute(
+        f"DELETE FROM main.event_positions WHERE position IN ({sealed})"
+    )
+
+
+def seal_partitions(
+    conn: sqlite3.Connection,
+    directory: Path,
+    period: str,
+    cutoff: date,
+) -> List[Partition]:
+    """Move events older than ``cutoff`` into their period's partition.
+
+    Each period is moved in its own transaction, and moving is
+    idempotent, so an interrupted run is completed by the next one.
+    Returns the partitions that received events.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    cutoff_text = cutoff.isoformat()
+    starts = [
+        row[0] for row in conn.execute(
+            f"SELECT DISTINCT {_PERIOD_START_SQL[period]} "
+            "FROM event_positions "
+            "WHERE timestamp < ? ORDER BY 1",
+            (cutoff_text,)
+        )
+        if row[0]
+    ]
+
+    sealed = []
+    for start_text in starts:
+        end_text = period_end(date.fromisoformat(start_text), period)
+        partition = Partition(
+            directory / f"events-{start_text}_{end_text.isoformat()}.db",
+            start_text,
+            end_text.isoformat(),
+        )
+        moved = _seal_period(
+            conn, partition.path, partition.start, partition.end, cutoff_text
+        )
+        if moved:
+            logger.info(f"Moved {moved} events to {partition.path.name}")
+            sealed.append(partition)
+    return sealed
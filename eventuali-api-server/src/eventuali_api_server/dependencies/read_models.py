@@ -0,0 +1,669 @@
+"""Read-model tables maintained inside the append transaction.
+
+The EventStore owns the ``events`` table and its writes.  A trigger on
+that table gives every appended event its global position in
+``event_positions``, and read models are kept current by triggers on
+that table in turn, so every row they derive from an event is written
+in the same transaction as the event itself: a committed event is always
+visible in its read models and a rolled-back append never leaves
+anything behind.  Each model can also be rebuilt from the full log,
+which is how it is first populated.
+"""
+
+import logging
+import sqlite3
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Global event positions.  AUTOINCREMENT hands them out in commit order
+# and never reuses one, even after the newest event is deleted, and an
+# INTEGER PRIMARY KEY keeps its values through VACUUM, neither of which
+# holds for the events table's implicit rowid.  Read models, cursors,
+# SSE ids and export resume points are all keyed on this position.  The
+# listing columns are copied here so that time-ordered pages are walks
+# of these indexes, whose implicit last column is the position.
+EVENT_POSITIONS_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS event_positions (
+        position INTEGER PRIMARY KEY AUTOINCREMENT,
+        id TEXT NOT NULL UNIQUE,
+        aggregate_type TEXT NOT NULL,
+        event_type TEXT NOT NULL,
+        timestamp TEXT NOT NULL
+    )
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_event_positions_timestamp
+    ON event_positions (timestamp)
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_event_positions_type_timestamp
+    ON event_positions (aggregate_type, timestamp)
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_event_positions_event_type_timestamp
+    ON event_positions (event_type, timestamp)
+    """,
+)
+
+EVENT_POSITIONS_TRIGGER = "trg_event_positions_on_append"
+
+_POSITION_COLUMNS = "id, aggregate_type, event_type, timestamp"
+
+# Every position row joined to its event, as read queries select it
+POSITIONED_EVENTS = "event_positions AS p JOIN events ON events.id = p.id"
+
+# The highest position ever assigned, including those of events since
+# moved out of the store
+MAX_POSITION_SQL = (
+    "SELECT COALESCE((SELECT seq FROM sqlite_sequence "
+    "WHERE name = 'event_positions'), 0)"
+)
+
+# Row sources for projection SQL: the event just given a position
+# (inside a trigger) or the whole log in position order (for rebuilds).
+# Triggers cannot use CTEs, so projections select from these as ``e``.
+_SOURCE_COLUMNS = (
+    "events.id AS id, events.aggregate_id AS aggregate_id, "
+    "events.aggregate_type AS aggregate_type, "
+    "events.event_type AS event_type, "
+    "events.aggregate_version AS aggregate_version, "
+    "events.event_data AS event_data, events.metadata AS metadata, "
+    "events.timestamp AS timestamp"
+)
+NEW_EVENT = (
+    f"(SELECT NEW.position AS position, {_SOURCE_COLUMNS} "
+    "FROM events WHERE events.id = NEW.id)"
+)
+ALL_EVENTS = (
+    f"(SELECT p.position AS position, {_SOURCE_COLUMNS} "
+    f"FROM {POSITIONED_EVENTS} ORDER BY p.position)"
+)
+
+
+def data_field(path: str) -> str:
+    """SQL for a text field of the event payload, NULL when empty."""
+    return (
+        "NULLIF(CAST(CASE WHEN json_valid(e.event_data) "
+        f"THEN json_extract(e.event_data, '$.{path}') END AS TEXT), '')"
+    )
+
+
+def metadata_field(path: str) -> str:
+    """SQL for a text field of the event metadata, NULL when empty."""
+    return (
+        "NULLIF(CAST(CASE WHEN json_valid(e.metadata) "
+        f"THEN json_extract(e.metadata, '$.{path}') END AS TEXT), '')"
+    )
+
+
+# Relationship fields resolved the way finalize_event_dict resolves them
+CORRELATION_ID = (
+    f"COALESCE({data_field('workflow_id')}, "
+    f"{metadata_field('correlation_id')})"
+)
+CAUSATION_ID = (
+    f"COALESCE({data_field('parent_agent_id')}, "
+    f"{metadata_field('causation_id')})"
+)
+
+EVENT_NAME = data_field("event_name")
+
+# Agent events are named ``agent.<status>`` or ``agent.<name>.<action>``;
+# prefer the payload's agent_name, then the name segment
+_NAME_TAIL = f"substr({EVENT_NAME}, instr({EVENT_NAME}, '.') + 1)"
+AGENT_NAME = (
+    f"COALESCE({data_field('agent_name')}, "
+    f"CASE WHEN instr({_NAME_TAIL}, '.') > 0 "
+    f"THEN substr({_NAME_TAIL}, 1, instr({_NAME_TAIL}, '.') - 1) END)"
+)
+
+# The lifecycle status an agent event sets, or NULL for other activity
+AGENT_STATUS_EVENT = (
+    f"CASE WHEN {EVENT_NAME} LIKE '%.started' THEN 'started' "
+    f"WHEN {EVENT_NAME} LIKE '%.completed' THEN 'completed' "
+    f"WHEN {EVENT_NAME} LIKE '%.failed' THEN 'failed' END"
+)
+
+
+def next_agent_status(current: str, status_event: str) -> str:
+    """SQL for an agent's status after an event, as AgentAggregate does.
+
+    Lifecycle events set the status; any other activity moves a live
+    agent to running and leaves a finished one as it is.
+    """
+    return (
+        f"CASE WHEN {status_event} IS NOT NULL THEN {status_event} "
+        f"WHEN {current} IN ('completed', 'failed') THEN {current} "
+        "ELSE 'running' END"
+    )
+
+
+# GET /events filters answered from the event_index table, mapped to the
+# SQL that derives each value from an event
+INDEXED_FIELDS = {
+    "event_name": data_field("event_name"),
+    "correlation_id": CORRELATION_ID,
+    "causation_id": CAUSATION_ID,
+    "agent_id": data_field("agent_id"),
+    "agent_name": data_field("agent_name"),
+}
+
+
+@dataclass(frozen=True)
+class ReadModel:
+    """Tables plus the triggers and rebuild SQL that keep them current.
+
+    ``project`` statements are templates over ``{source}``; they are run
+    once per appended event by the triggers and once over the whole log
+    on rebuild.  Triggers fire as each event is given its position in
+    event_positions.  Bump ``version`` whenever the tables or projection
+    change so existing databases are rebuilt on startup.  An optional
+    ``check`` query returns a true value when the model has drifted from
+    the log, which also triggers a rebuild on startup.
+    """
+
+    name: str
+    version: int
+    tables: Tuple[str, ...]
+    schema: Tuple[str, ...]
+    project: Tuple[str, ...]
+    check: Optional[str] = None
+
+    @property
+    def trigger_name(self) -> str:
+        return f"trg_{self.name}_on_append"
+
+    def create_trigger_sql(self) -> str:
+        body = ";\n".join(
+            statement.format(source=NEW_EVENT) for statement in self.project
+        )
+        return (
+            f"CREATE TRIGGER IF NOT EXISTS {self.trigger_name} "
+            f"AFTER INSERT ON event_positions BEGIN\n{body};\nEND"
+        )
+
+
+def _event_index_projection() -> str:
+    selects = " UNION ALL ".join(
+        f"SELECT '{name}' AS field, {expression} AS value, "
+        "e.timestamp AS timestamp, e.position AS position "
+        "FROM {source} AS e"
+        for name, expression in INDEXED_FIELDS.items()
+    )
+    return (
+        "INSERT OR IGNORE INTO event_index "
+        "(field, value, timestamp, position) "
+        f"SELECT field, value, timestamp, position FROM ({selects}) "
+        "WHERE value IS NOT NULL"
+    )
+
+
+EVENT_INDEX = ReadModel(
+    name="event_index",
+    version=2,
+    tables=("event_index",),
+    schema=(
+        """
+        CREATE TABLE IF NOT EXISTS event_index (
+            field TEXT NOT NULL,
+            value TEXT NOT NULL,
+            timestamp TEXT NOT NULL,
+            position INTEGER NOT NULL,
+            PRIMARY KEY (field, value, timestamp, position)
+        ) WITHOUT ROWID
+        """,
+        """
+        CREATE INDEX IF NOT EXISTS idx_event_index_position
+        ON event_index (field, value, position)
+        """,
+    ),
+    project=(_event_index_projection(),),
+)
+
+# Upsert form of next_agent_status: excluded.status holds the event's
+# lifecycle status, or 'running' for other activity
+_NEXT_STATUS = next_agent_status(
+    "status", "NULLIF(excluded.status, 'running')"
+)
+
+WORKFLOW_AGENTS = ReadModel(
+    name="workflow_agents",
+    version=2,
+    tables=("workflow_agents",),
+    schema=(
+        """
+        CREATE TABLE IF NOT EXISTS workflow_agents (
+            workflow_id TEXT NOT NULL,
+            agent_id TEXT NOT NULL,
+            agent_name TEXT,
+            parent_agent_id TEXT,
+            status TEXT NOT NULL,
+            first_event_time TEXT NOT NULL,
+            last_event_time TEXT NOT NULL,
+            first_event_type TEXT NOT NULL,
+            event_count INTEGER NOT NULL,
+            PRIMARY KEY (workflow_id, agent_id)
+        ) WITHOUT ROWID
+        """,
+    ),
+    project=(
+        f"""
+        INSERT INTO workflow_agents (
+            workflow_id, agent_id, agent_name, parent_agent_id, status,
+            first_event_time, last_event_time, first_event_type, event_count
+        )
+        SELECT
+            {CORRELATION_ID}, e.aggregate_id, {AGENT_NAME}, {CAUSATION_ID},
+            COALESCE({AGENT_STATUS_EVENT}, 'running'),
+            e.timestamp, e.timestamp, e.event_type, 1
+        FROM {{source}} AS e
+        WHERE e.aggregate_type = 'agent_aggregate'
+            AND {CORRELATION_ID} IS NOT NULL
+        ORDER BY e.position
+        ON CONFLICT (workflow_id, agent_id) DO UPDATE SET
+            agent_name = COALESCE(excluded.agent_name, agent_name),
+            parent_agent_id = COALESCE(
+                excluded.parent_agent_id, parent_agent_id
+            ),
+            status = {_NEXT_STATUS},
+            first_event_type = CASE
+                WHEN excluded.first_event_time < first_event_time
+                THEN excluded.first_event_type ELSE first_event_type END,
+            first_event_time = MIN(
+                first_event_time, excluded.first_event_time
+            ),
+            last_event_time = MAX(last_event_time, excluded.last_event_time),
+            event_count = event_count + 1
+        """,
+    ),
+)
+
+AGENT_STATUS = ReadModel(
+    name="agent_status",
+    version=2,
+    tables=("agent_status",),
+    schema=(
+        """
+        CREATE TABLE IF NOT EXISTS agent_status (
+            agent_id TEXT PRIMARY KEY,
+            agent_name TEXT,
+            workflow_id TEXT,
+            parent_agent_id TEXT,
+            status TEXT NOT NULL,
+            previous_status TEXT,
+            status_position INTEGER NOT NULL,
+            first_event_time TEXT NOT NULL,
+            last_event_time TEXT NOT NULL,
+            last_event_name TEXT,
+            last_position INTEGER NOT NULL,
+            event_count INTEGER NOT NULL
+        ) WITHOUT ROWID
+        """,
+        """
+        CREATE INDEX IF NOT EXISTS idx_agent_status_status
+        ON agent_status (status, last_event_time)
+        """,
+        """
+        CREATE INDEX IF NOT EXISTS idx_agent_status_workflow
+        ON agent_status (workflow_id, status, last_event_time)
+        """,
+        """
+        CREATE INDEX IF NOT EXISTS idx_agent_status_name
+        ON agent_status (agent_name, status, last_event_time)
+        """,
+    ),
+    project=(
+        f"""
+        INSERT INTO agent_status (
+            agent_id, agent_name, workflow_id, parent_agent_id, status,
+            previous_status, status_position, first_event_time,
+            last_event_time, last_event_name, last_position, event_count
+        )
+        SELECT
+            e.aggregate_id, {AGENT_NAME}, {CORRELATION_ID}, {CAUSATION_ID},
+            COALESCE({AGENT_STATUS_EVENT}, 'running'), NULL, e.position,
+            e.timestamp, e.timestamp, {EVENT_NAME}, e.position, 1
+        FROM {{source}} AS e
+        WHERE e.aggregate_type = 'agent_aggregate'
+        ORDER BY e.position
+        ON CONFLICT (agent_id) DO UPDATE SET
+            agent_name = COALESCE(excluded.agent_name, agent_name),
+            workflow_id = COALESCE(excluded.workflow_id, workflow_id),
+            parent_agent_id = COALESCE(
+                excluded.parent_agent_id, parent_agent_id
+            ),
+            status = {_NEXT_STATUS},
+            previous_status = CASE WHEN {_NEXT_STATUS} != status
+                THEN status ELSE previous_status END,
+            status_position = CASE WHEN {_NEXT_STATUS} != status
+                THEN excluded.status_position ELSE status_position END,
+            first_event_time = MIN(
+                first_event_time, excluded.first_event_time
+            ),
+            last_event_time = MAX(last_event_time, excluded.last_event_time),
+            last_event_name = excluded.last_event_name,
+            last_position = excluded.last_position,
+            event_count = event_count + 1
+        """,
+    ),
+)
+
+
+def duration_ms(start: str, end: str) -> str:
+    """SQL for the milliseconds between two ISO timestamps."""
+    return (
+        f"CAST(ROUND((julianday({end}) - julianday({start})) * 86400000) "
+        "AS INTEGER)"
+    )
+
+
+# A workflow's own lifecycle events drive its status, as they do an
+# agent's; events of its agents only move a started workflow to running
+WORKFLOW_SUMMARY = ReadModel(
+    name="workflow_summary",
+    version=2,
+    tables=("workflow_summary",),
+    schema=(
+        """
+        CREATE TABLE IF NOT EXISTS workflow_summary (
+            workflow_id TEXT PRIMARY KEY,
+            user_prompt TEXT,
+            status TEXT NOT NULL,
+            started_at TEXT NOT NULL,
+            ended_at TEXT,
+            duration_ms INTEGER,
+            last_event_time TEXT NOT NULL,
+            event_count INTEGER NOT NULL,
+            start_position INTEGER NOT NULL,
+            last_position INTEGER NOT NULL
+        ) WITHOUT ROWID
+        """,
+        """
+        CREATE INDEX IF NOT EXISTS idx_workflow_summary_started
+        ON workflow_summary (started_at, start_position)
+        """,
+        """
+        CREATE INDEX IF NOT EXISTS idx_workflow_summary_status
+        ON workflow_summary (status, started_at, start_position)
+        """,
+    ),
+    project=(
+        f"""
+        INSERT INTO workflow_summary (
+            workflow_id, user_prompt, status, started_at, ended_at,
+            last_event_time, event_count, start_position, last_position
+        )
+        SELECT
+            e.aggregate_id, {data_field('user_prompt')},
+            COALESCE({AGENT_STATUS_EVENT}, 'running'), e.timestamp,
+            CASE WHEN {AGENT_STATUS_EVENT} IN ('completed', 'failed')
+                THEN e.timestamp END,
+            e.timestamp, 1, e.position, e.position
+        FROM {{source}} AS e
+        WHERE e.aggregate_type = 'workflow_aggregate'
+        ORDER BY e.position
+        ON CONFLICT (workflow_id) DO UPDATE SET
+            user_prompt = COALESCE(user_prompt, excluded.user_prompt),
+            status = {_NEXT_STATUS},
+            started_at = MIN(started_at, excluded.started_at),
+            ended_at = COALESCE(excluded.ended_at, ended_at),
+            last_event_time = MAX(last_event_time, excluded.last_event_time),
+            event_count = event_count + 1,
+            last_position = excluded.last_position
+        """,
+        f"""
+        INSERT INTO workflow_summary (
+            workflow_id, status, started_at, last_event_time, event_count,
+            start_position, last_position
+        )
+        SELECT
+            {CORRELATION_ID}, 'running', e.timestamp, e.timestamp, 1,
+            e.position, e.position
+        FROM {{source}} AS e
+        WHERE e.aggregate_type = 'agent_aggregate'
+            AND {CORRELATION_ID} IS NOT NULL
+        ORDER BY e.position
+        ON CONFLICT (workflow_id) DO UPDATE SET
+            status = {next_agent_status("status", "NULL")},
+            started_at = MIN(started_at, excluded.started_at),
+            last_event_time = MAX(last_event_time, excluded.last_event_time),
+            event_count = event_count + 1,
+            last_position = excluded.last_position
+        """,
+        f"""
+        UPDATE workflow_summary
+        SET duration_ms = {duration_ms("started_at", "ended_at")}
+        WHERE ended_at IS NOT NULL AND workflow_id IN (
+            SELECT CASE WHEN e.aggregate_type = 'workflow_aggregate'
+                THEN e.aggregate_id ELSE {CORRELATION_ID} END
+            FROM {{source}} AS e
+        )
+        """,
+    ),
+)
+
+# Parent -> child agent edges; the reverse index serves ancestry walks
+CAUSATION_EDGES = ReadModel(
+    name="causation_edges",
+    version=2,
+    tables=("causation_edges",),
+    schema=(
+        """
+        CREATE TABLE IF NOT EXISTS causation_edges (
+            parent_id TEXT NOT NULL,
+            child_id TEXT NOT NULL,
+            workflow_id TEXT,
+            position INTEGER NOT NULL,
+            PRIMARY KEY (parent_id, child_id)
+        ) WITHOUT ROWID
+        """,
+        """
+        CREATE INDEX IF NOT EXISTS idx_causation_edges_child
+        ON causation_edges (child_id, parent_id)
+        """,
+        """
+        CREATE INDEX IF NOT EXISTS idx_causation_edges_workflow
+        ON causation_edges (workflow_id, position)
+        """,
+    ),
+    project=(
+        f"""
+        INSERT OR IGNORE INTO causation_edges (
+            parent_id, child_id, workflow_id, position
+        )
+        SELECT {CAUSATION_ID}, e.aggregate_id, {CORRELATION_ID}, e.position
+        FROM {{source}} AS e
+        WHERE e.aggregate_type = 'agent_aggregate'
+            AND {CAUSATION_ID} IS NOT NULL
+            AND {CAUSATION_ID} != e.aggregate_id
+        ORDER BY e.position
+        """,
+    ),
+)
+
+# Contentless full-text index keyed by event position: the text lives
+# in the events table, so the index only stores its postings.  Every
+# scalar of the payload is indexed, attributes included.
+_PAYLOAD_TEXT = (
+    "(SELECT group_concat(value, ' ') FROM json_tree("
+    "CASE WHEN json_valid(e.event_data) THEN e.event_data "
+    "ELSE json_object() END) "
+    "WHERE type IN ('text', 'integer', 'real'))"
+)
+
+EVENT_SEARCH = ReadModel(
+    name="event_search",
+    version=2,
+    tables=("event_search",),
+    schema=(
+        """
+        CREATE VIRTUAL TABLE IF NOT EXISTS event_search USING fts5 (
+            event_name, payload,
+            content = '',
+            tokenize = 'unicode61 remove_diacritics 2'
+        )
+        """,
+    ),
+    project=(
+        f"""
+        INSERT INTO event_search (rowid, event_name, payload)
+        SELECT e.position, {EVENT_NAME}, {_PAYLOAD_TEXT}
+        FROM {{source}} AS e
+        """,
+    ),
+)
+
+# Removes the search entries of the events in ``{source}``.  The index is
+# contentless, so an entry is deleted by repeating the values it indexed.
+EVENT_SEARCH_DELETE = (
+    "INSERT INTO event_search (event_search, rowid, event_name, payload) "
+    f"SELECT 'delete', e.position, {EVENT_NAME}, {_PAYLOAD_TEXT} "
+    "FROM {source} AS e"
+)
+
+# Event counts per (aggregate_type, event_type, event_name), for exact
+# totals of the common GET /events filters
+EVENT_COUNTS = ReadModel(
+    name="event_counts",
+    version=2,
+    tables=("event_counts",),
+    schema=(
+        """
+        CREATE TABLE IF NOT EXISTS event_counts (
+            aggregate_type TEXT NOT NULL,
+            event_type TEXT NOT NULL,
+            event_name TEXT NOT NULL,
+            count INTEGER NOT NULL,
+            PRIMARY KEY (aggregate_type, event_type, event_name)
+        ) WITHOUT ROWID
+        """,
+    ),
+    project=(
+        f"""
+        INSERT INTO event_counts
+            (aggregate_type, event_type, event_name, count)
+        SELECT e.aggregate_type, e.event_type, COALESCE({EVENT_NAME}, ''),
+            COUNT(*)
+        FROM {{source}} AS e
+        GROUP BY 1, 2, 3
+        ON CONFLICT (aggregate_type, event_type, event_name) DO UPDATE SET
+            count = count + excluded.count
+        """,
+    ),
+    check=(
+        "SELECT (SELECT COALESCE(SUM(count), 0) FROM event_counts) "
+        "!= (SELECT COUNT(*) FROM events)"
+    ),
+)
+
+READ_MODELS: List[ReadModel] = [
+    EVENT_INDEX,
+    WORKFLOW_AGENTS,
+    AGENT_STATUS,
+    WORKFLOW_SUMMARY,
+    CAUSATION_EDGES,
+    EVENT_SEARCH,
+    EVENT_COUNTS,
+]
+
+READ_MODEL_VERSIONS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS read_model_versions (
+    name TEXT PRIMARY KEY,
+    version INTEGER NOT NULL
+)
+"""
+
+
+def install_event_positions(conn: sqlite3.Connection) -> int:
+    """Create event_positions and its trigger, positioning any stragglers.
+
+    Events without a position (all of them when the table is new) are
+    given one in rowid order.  Returns how many were.
+    """
+    for statement in EVENT_POSITIONS_SCHEMA:
+        conn.execute(statement)
+    conn.execute(
+        f"CREATE TRIGGER IF NOT EXISTS {EVENT_POSITIONS_TRIGGER} "
+        "AFTER INSERT ON events BEGIN\n"
+        f"INSERT INTO event_positions ({_POSITION_COLUMNS}) "
+        "VALUES (NEW.id, NEW.aggregate_type, NEW.event_type, NEW.timestamp);"
+        "\nEND"
+    )
+    events = conn.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+    positioned = conn.execute(
+        "SELECT COUNT(*) FROM event_positions"
+    ).fetchone()[0]
+    if events == positioned:
+        return 0
+    return conn.execute(
+        f"INSERT INTO event_positions ({_POSITION_COLUMNS}) "
+        f"SELECT {_POSITION_COLUMNS} FROM events "
+        "WHERE id NOT IN (SELECT id FROM event_positions) ORDER BY rowid"
+    ).rowcount
+
+
+def _rebuild(conn: sqlite3.Connection, model: ReadModel) -> None:
+    conn.execute(f"DROP TRIGGER IF EXISTS {model.trigger_name}")
+    for table in model.tables:
+        conn.execute(f"DROP TABLE IF EXISTS {table}")
+    for statement in model.schema:
+        conn.execute(statement)
+    for statement in model.project:
+        conn.execute(statement.format(source=ALL_EVENTS))
+    conn.execute(
+        "INSERT OR REPLACE INTO read_model_versions (name, version) "
+        "VALUES (?, ?)",
+        (model.name, model.version),
+    )
+
+
+def install_read_models(
+    conn: sqlite3.Connection, rebuild: bool = False
+) -> List[str]:
+    """Create read models and their triggers, rebuilding stale ones.
+
+    Runs in one immediate transaction, so no append can slip in between
+    a rebuild and the trigger that takes over from it.  Events found
+    without a position are positioned first, and every model is then
+    rebuilt, as none of them has seen those events.  Returns the names
+    of the models that were rebuilt.
+    """
+    rebuilt = []
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        positioned = install_event_positions(conn)
+        if positioned:
+            logger.info(f"Assigned positions to {positioned} events")
+        conn.execute(READ_MODEL_VERSIONS_SCHEMA)
+        versions = dict(
+            conn.execute("SELECT name, version FROM read_model_versions")
+        )
+        for model in READ_MODELS:
+            if (
+                rebuild
+                or positioned
+                or versions.get(model.name) != model.version
+            ):
+                _rebuild(conn, model)
+                rebuilt.append(model.name)
+            else:
+                for statement in model.schema:
+                    conn.execute(statement)
+                if model.check and conn.execute(model.check).fetchone()[0]:
+                    logger.warning(
+                        f"Read model {model.name} disagrees with the log"
+                    )
+                    _rebuild(conn, model)
+                    rebuilt.append(model.name)
+            conn.execute(model.create_trigger_sql())
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+
+    if rebuilt:
+        logger.info(f"Rebuilt read models: {', '.join(rebuilt)}")
+    return rebuilt
@@ -0,0 +1,1368 @@
+"""Direct SQLite read path over the eventuali events table."""
+
+import asyncio
+import base64
+import binascii
+import heapq
+import json
+import logging
+import sqlite3
+import threading
+from contextlib import closing
+from datetime import date, datetime, timezone
+from operator import itemgetter
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .filters import (
+    ATTRIBUTE_INDEX_PREFIX,
+    AttributeFilter,
+    attribute_index_name,
+    attribute_index_sql,
+)
+from .partitions import Partition, list_partitions, seal_partitions
+from .read_models import (
+    INDEXED_FIELDS,
+    MAX_POSITION_SQL,
+    POSITIONED_EVENTS,
+    duration_ms,
+    install_read_models,
+)
+
+logger = logging.getLogger(__name__)
+
+# Time-ordered pages are range scans of the event_positions indexes
+# (see read_models.py), which superseded these indexes on events
+SCHEMA_STATEMENTS = [
+    "DROP INDEX IF EXISTS idx_events_timestamp",
+    "DROP INDEX IF EXISTS idx_events_type_timestamp",
+    "DROP INDEX IF EXISTS idx_events_event_type_timestamp",
+]
+
+# Events examined when estimating a count with attribute predicates
+COUNT_SAMPLE_SIZE = 10000
+
+# Selected from POSITIONED_EVENTS; the position comes from event_positions.
+# Columns are qualified so the same list works when joining read models.
+EVENT_COLUMNS = (
+    "p.position AS position, events.id, events.aggregate_id, "
+    "events.aggregate_type, events.event_type, events.aggregate_version, "
+    "events.event_data, events.event_data_type, events.metadata, "
+    "events.timestamp"
+)
+
+
+def _load_json(value: Optional[str]) -> Dict[str, Any]:
+    """Decode a JSON column, tolerating empty or non-JSON payloads."""
+    if not value:
+        return {}
+    try:
+        decoded = json.loads(value)
+    except (TypeError, ValueError):
+        return {}
+    return decoded if isinstance(decoded, dict) else {}
+
+
+def normalize_timestamp(value: str) -> str:
+    """Convert an ISO timestamp to the UTC form used for comparisons."""
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return value
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc).isoformat()
+
+
+def encode_cursor(position: int, timestamp: Optional[str] = None) -> str:
+    """Build an opaque continuation token for keyset pagination."""
+    payload = {"p": position}
+    if timestamp is not None:
+        payload["t"] = timestamp
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[int, Optional[str]]:
+    """Decode a continuation token into (position, timestamp).
+
+    Raises:
+        ValueError: If the token is malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded))
+        position = payload["p"]
+        timestamp = payload.get("t")
+    except (binascii.Error, ValueError, TypeError, KeyError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+    if not isinstance(position, int) or not (
+        timestamp is None or isinstance(timestamp, str)
+    ):
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return position, timestamp
+
+
+# Agent details joined onto causation graph nodes from agent_status
+AGENT_NODE_COLUMNS = (
+    "s.agent_name, s.status, s.workflow_id, "
+    "s.first_event_time, s.last_event_time"
+)
+
+
+def _creates_cycle(parents: Dict[str, str], agent_id: str) -> bool:
+    """Whether following parent links from ``agent_id`` loops back to it."""
+    seen = set()
+    current = parents.get(agent_id)
+    while current is not None and current not in seen:
+        if current == agent_id:
+            return True
+        seen.add(current)
+        current = parents.get(current)
+    return False
+
+
+# Messages SQLite uses for MATCH expressions it cannot parse
+FTS_QUERY_ERRORS = (
+    "fts5", "unterminated string", "syntax error", "no such column"
+)
+
+
+def terms_query(text: str) -> str:
+    """Turn plain search terms into an FTS5 query matching all of them.
+
+    Each term is quoted, so punctuation such as ``agent.tool_used`` or
+    ``--verbose`` is searched literally; a trailing ``*`` keeps prefix
+    matching.
+
+    Raises:
+        ValueError: If the text contains no terms.
+    """
+    terms = []
+    for token in text.split():
+        prefix = token.endswith("*")
+        token = token.rstrip("*")
+        if token:
+            quoted = '"' + token.replace('"', '""') + '"'
+            terms.append(quoted + ("*" if prefix else ""))
+    if not terms:
+        raise ValueError("Empty search query")
+    return " ".join(terms)
+
+
+def finalize_event_dict(event_dict: Dict[str, Any]) -> Dict[str, Any]:
+    """Prefer agent-specific relationship fields over event metadata."""
+    if event_dict.get('workflow_id'):
+        event_dict['correlation_id'] = event_dict['workflow_id']
+    if event_dict.get('parent_agent_id'):
+        event_dict['causation_id'] = event_dict['parent_agent_id']
+    return event_dict
+
+
+def row_to_event_dict(row: sqlite3.Row) -> Dict[str, Any]:
+    """Convert an events table row to the API event dictionary."""
+    data = {}
+    if row["event_data_type"] == "json":
+        data = _load_json(row["event_data"])
+    metadata = _load_json(row["metadata"])
+
+    event_dict = dict(data)
+    event_dict.update({
+        'event_id': row["id"],
+        'position': row["position"],
+        'aggregate_id': row["aggregate_id"],
+        'aggregate_type': row["aggregate_type"],
+        'event_type': row["event_type"],
+        'aggregate_version': row["aggregate_version"],
+        'timestamp': row["timestamp"],
+        'user_id': metadata.get('user_id'),
+        'causation_id': metadata.get('causation_id'),
+        'correlation_id': metadata.get('correlation_id'),
+        'attributes': data.get('attributes') or {},
+        'agent_name': data.get('agent_name') or '',
+        'agent_id': data.get('agent_id') or '',
+        'parent_agent_id': data.get('parent_agent_id') or '',
+        'workflow_id': data.get('workflow_id') or '',
+        'event_name': data.get('event_name') or '',
+    })
+    return finalize_event_dict(event_dict)
+
+
+class EventReader:
+    """Runs indexed read queries against the event store's SQLite file.
+
+    The EventStore owns all writes; this reader opens its own connections
+    to the same database so that filtering, ordering and pagination happen
+    inside SQLite instead of over fully materialized event lists.
+
+    With ``partitions_dir`` set, event listings, counts, aggregate streams
+    and exports also read the partition files there (see partitions.py),
+    opening only those that overlap the requested time range.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        timeout: float = 10.0,
+        attribute_indexes: Sequence[str] = (),
+        partitions_dir: Optional[Path] = None,
+    ) -> None:
+        self.db_path = db_path
+        self.timeout = timeout
+        self.attribute_indexes = list(attribute_indexes)
+        self.partitions_dir = partitions_dir
+        # Partition path -> ((mtime, size), highest position, counters)
+        self._partition_summaries: Dict[
+            Path, Tuple[Any, int, List[Dict[str, Any]]]
+        ] = {}
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        """Get the calling thread's connection, opening it if needed."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                str(self.db_path),
+                timeout=self.timeout,
+                check_same_thread=False,
+            )
+            conn.row_factory = sqlite3.Row
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    def _partitions(
+        self, since: Optional[str] = None, until: Optional[str] = None
+    ) -> List[Partition]:
+        """The partitions that may hold events in since..until."""
+        if self.partitions_dir is None:
+            return []
+        since = normalize_timestamp(since) if since else None
+        until = normalize_timestamp(until) if until else None
+        return [
+            partition for partition in list_partitions(self.partitions_dir)
+            if partition.overlaps(since, until)
+        ]
+
+    def _partition_summary(
+        self, partition: Partition
+    ) -> Tuple[int, List[Dict[str, Any]]]:
+        """A partition's highest position and event_counts rows.
+
+        Sealed partitions only change when a seal adds to them, so both
+        are cached until the file's size or modification time changes.
+        """
+        stat = partition.path.stat()
+        version = (stat.st_mtime_ns, stat.st_size)
+        cached = self._partition_summaries.get(partition.path)
+        if cached is None or cached[0] != version:
+            with closing(partition.connect(self.timeout)) as conn:
+                position = conn.execute(
+                    "SELECT COALESCE(MAX(position), 0) FROM event_positions"
+                ).fetchone()[0]
+                counters = [
+                    dict(row) for row in conn.execute(
+                        "SELECT * FROM event_counts"
+                    )
+                ]
+            cached = (version, position, counters)
+            self._partition_summaries[partition.path] = cached
+        return cached[1], cached[2]
+
+    def _partition_max_position(self, partition: Partition) -> int:
+        """Highest position in a partition."""
+        return self._partition_summary(partition)[0]
+
+    def _ensure_schema(self) -> None:
+        conn = self._connection()
+        with conn:
+            for statement in SCHEMA_STATEMENTS:
+                conn.execute(statement)
+            self._sync_attribute_indexes(conn)
+        install_read_models(conn)
+
+    def _sync_attribute_indexes(self, conn: sqlite3.Connection) -> None:
+        """Create the declared attribute indexes and drop undeclared ones."""
+        wanted = {
+            attribute_index_name(path): path for path in self.attribute_indexes
+        }
+        existing = {
+            row[0] for row in conn.execute(
+                "SELECT name FROM sqlite_master "
+                "WHERE type = 'index' AND tbl_name = 'events'"
+            )
+            if row[0].startswith(ATTRIBUTE_INDEX_PREFIX)
+        }
+        for name in existing - set(wanted):
+            conn.execute(f"DROP INDEX IF EXISTS {name}")
+            logger.info(f"Dropped attribute index {name}")
+        for name, path in wanted.items():
+            if name not in existing:
+                conn.execute(attribute_index_sql(path))
+                logger.info(f"Created attribute index {name}")
+
+    async def ensure_schema(self) -> None:
+        """Create the read-side indexes and read models if needed."""
+        await asyncio.to_thread(self._ensure_schema)
+        logger.info("Event read indexes ensured")
+
+    def _event_filters(
+        self,
+        aggregate_type: Optional[str],
+        event_type: Optional[str],
+        since: Optional[str],
+        after: Optional[int],
+        before: Optional[Tuple[str, int]],
+        index_filters: Optional[Dict[str, str]],
+        attribute_filters: Optional[List[AttributeFilter]],
+        indexed: bool = True,
+        payload: bool = True,
+    ) -> Tuple[str, List[str], List[Any], str, str]:
+        """Build the source, WHERE clauses and parameters of an events query.
+
+        Also returns the timestamp and position columns to order by.
+        Without ``indexed`` (partitions have no event_index), index
+        filters are evaluated on the payload instead.  Without
+        ``payload``, the events table is only joined if a filter needs it.
+        """
+        clauses: List[str] = []
+        params: List[Any] = []
+        payload = payload or bool(
+            attribute_filters or (index_filters and not indexed)
+        )
+        events = " JOIN events ON events.id = p.id" if payload else ""
+        source = f"event_positions AS p{events}"
+        timestamp, position = "p.timestamp", "p.position"
+
+        if index_filters and not indexed:
+            for name, value in index_filters.items():
+                clauses.append(
+                    "events.id IN (SELECT e.id FROM events AS e "
+                    f"WHERE {INDEXED_FIELDS[name]} = ?)"
+                )
+                params.append(value)
+        elif index_filters:
+            # Drive the query from one secondary index range and check
+            # any further index filters by point lookups on the others
+            filters = list(index_filters.items())
+            name, value = filters[0]
+            source = (
+                "event_index AS ix JOIN event_positions AS p "
+                f"ON p.position = ix.position{events}"
+            )
+            timestamp, position = "ix.timestamp", "ix.position"
+            clauses.append("ix.field = ? AND ix.value = ?")
+            params.extend([name, value])
+            for name, value in filters[1:]:
+                clauses.append(
+                    "EXISTS (SELECT 1 FROM event_index AS other "
+                    "WHERE other.field = ? AND other.value = ? "
+                    "AND other.position = ix.position)"
+                )
+                params.extend([name, value])
+        elif attribute_filters:
+            # Walk a declared attribute index, which is in time order
+            timestamp = "events.timestamp"
+
+        if aggregate_type:
+            clauses.append("p.aggregate_type = ?")
+            params.append(aggregate_type)
+        if event_type:
+            clauses.append("p.event_type = ?")
+            params.append(event_type)
+        if since:
+            clauses.append(f"{timestamp} > ?")
+            params.append(normalize_timestamp(since))
+        if after is not None:
+            clauses.append(f"{position} > ?")
+            params.append(after)
+        if before is not None:
+            # Keyset continuation; a range seek on the timestamp indexes
+            clauses.append(f"({timestamp}, {position}) < (?, ?)")
+            params.extend(before)
+        for attribute_filter in attribute_filters or ():
+            clause, values = attribute_filter.to_sql()
+            clauses.append(clause)
+            params.extend(values)
+        return source, clauses, params, timestamp, position
+
+    def _query_events(
+        self,
+        conn: sqlite3.Connection,
+        limit: int,
+        offset: int,
+        aggregate_type: Optional[str],
+        event_type: Optional[str],
+        since: Optional[str],
+        after: Optional[int],
+        before: Optional[Tuple[str, int]],
+        index_filters: Optional[Dict[str, str]],
+        attribute_filters: Optional[List[AttributeFilter]],
+        indexed: bool = True,
+    ) -> List[Dict[str, Any]]:
+        source, clauses, params, timestamp, position = self._event_filters(
+            aggregate_type,
+            event_type,
+            since,
+            after,
+            before,
+            index_filters,
+            attribute_filters,
+            indexed,
+        )
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        if after is not None:
+            # Position reads walk forward from a known point in the log
+            order = f"ORDER BY {position} ASC"
+        else:
+            order = f"ORDER BY {timestamp} DESC, {position} DESC"
+        sql = (
+            f"SELECT {EVENT_COLUMNS} FROM {source} {where} "
+            f"{order} LIMIT ? OFFSET ?"
+        )
+        params.extend([limit, offset])
+
+        rows = conn.execute(sql, params).fetchall()
+        return [row_to_event_dict(row) for row in rows]
+
+    def _fetch_events(
+        self,
+        limit: int,
+        offset: int,
+        aggregate_type: Optional[str],
+        event_type: Optional[str],
+        since: Optional[str],
+        after: Optional[int],
+        before: Optional[Tuple[str, int]],
+        index_filters: Optional[Dict[str, str]],
+        attribute_filters: Optional[List[AttributeFilter]],
+    ) -> List[Dict[str, Any]]:
+        filters = (
+            aggregate_type,
+            event_type,
+            since,
+            after,
+            before,
+            index_filters,
+            attribute_filters,
+        )
+        partitions = [
+            partition for partition in self._partitions(since=since)
+            if before is None or partition.start <= before[0]
+            if after is None
+            or self._partition_max_position(partition) > after
+        ]
+        if not partitions:
+            return self._query_events(
+                self._connection(), limit, offset, *filters
+            )
+
+        # Take the first limit + offset events of every source and merge;
+        # newest-first listings stop at the first partition that ends
+        # before the oldest event already in the page
+        wanted = limit + offset
+        newest_first = after is None
+        if newest_first:
+            key = itemgetter("timestamp", "position")
+            partitions.sort(key=lambda p: p.end, reverse=True)
+        else:
+            key = itemgetter("position")
+
+        page = self._query_events(self._connection(), wanted, 0, *filters)
+        for partition in partitions:
+            if (
+                newest_first
+                and len(page) == wanted
+                and page[-1]["timestamp"] >= partition.end
+            ):
+                break
+            with closing(partition.connect(self.timeout)) as conn:
+                rows = self._query_events(
+                    conn, wanted, 0, *filters, indexed=False
+                )
+            page = list(heapq.merge(page, rows, key=key, reverse=newest_first))
+            page = page[:wanted]
+        return page[offset:]
+
+    async def fetch_events(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        aggregate_type: Optional[str] = None,
+        event_type: Optional[str] = None,
+        since: Optional[str] = None,
+        after: Optional[int] = None,
+        before: Optional[Tuple[str, int]] = None,
+        index_filters: Optional[Dict[str, str]] = None,
+        attribute_filters: Optional[List[AttributeFilter]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Fetch one page of events.
+
+        Pages are most recent first, except when ``after`` is given: then
+        events with a greater position are returned in append order.
+        ``before`` is a (timestamp, position) keyset bound that continues a
+        most-recent-first listing without re-scanning earlier pages.
+        ``index_filters`` maps fields of ``INDEXED_FIELDS`` to exact values
+        and is answered from the event_index read model.
+        ``attribute_filters`` compare payload attributes; declared
+        attribute indexes serve them.
+        """
+        unknown = set(index_filters or {}) - set(INDEXED_FIELDS)
+        if unknown:
+            raise ValueError(f"Not indexed: {', '.join(sorted(unknown))}")
+        return await asyncio.to_thread(
+            self._fetch_events,
+            limit,
+            offset,
+            aggregate_type,
+            event_type,
+            since,
+            after,
+            before,
+            index_filters,
+            attribute_filters,
+        )
+
+    def _search_events(
+        self,
+        query: str,
+        limit: int,
+        aggregate_type: Optional[str],
+        workflow_id: Optional[str],
+        since: Optional[str],
+        until: Optional[str],
+        before: Optional[int],
+    ) -> List[Dict[str, Any]]:
+        clauses = ["event_search MATCH ?"]
+        params: List[Any] = [query]
+
+        if aggregate_type:
+            clauses.append("p.aggregate_type = ?")
+            params.append(aggregate_type)
+        if workflow_id:
+            clauses.append(
+                "EXISTS (SELECT 1 FROM event_index AS ix "
+                "WHERE ix.field = 'correlation_id' AND ix.value = ? "
+                "AND ix.position = p.position)"
+            )
+            params.append(workflow_id)
+        if since:
+            clauses.append("p.timestamp > ?")
+            params.append(normalize_timestamp(since))
+        if until:
+            clauses.append("p.timestamp < ?")
+            params.append(normalize_timestamp(until))
+        if before is not None:
+            clauses.append("event_search.rowid < ?")
+            params.append(before)
+
+        sql = (
+            f"SELECT {EVENT_COLUMNS} FROM event_search "
+            "JOIN event_positions AS p ON p.position = event_search.rowid "
+            "JOIN events ON events.id = p.id "
+            f"WHERE {' AND '.join(clauses)} "
+            "ORDER BY event_search.rowid DESC LIMIT ?"
+        )
+        params.append(limit)
+
+        try:
+            rows = self._connection().execute(sql, params).fetchall()
+        except sqlite3.OperationalError as e:
+            # FTS5 reports malformed MATCH expressions as operational errors
+            if any(marker in str(e) for marker in FTS_QUERY_ERRORS):
+                raise ValueError(f"Invalid search query: {e}") from e
+            raise
+        return [row_to_event_dict(row) for row in rows]
+
+    async def search_events(
+        self,
+        query: str,
+        limit: int = 100,
+        aggregate_type: Optional[str] = None,
+        workflow_id: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        before: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Full-text search over event names and payloads, newest first.
+
+        ``query`` is an SQLite FTS5 expression; see ``terms_query`` for
+        building one from plain terms.  ``before`` continues a previous
+        page below that position.
+
+        Raises:
+            ValueError: If the query is not valid FTS5 syntax.
+        """
+        return await asyncio.to_thread(
+            self._search_events,
+            query,
+            limit,
+            aggregate_type,
+            workflow_id,
+            since,
+            until,
+            before,
+        )
+
+    def _count_events(
+        self,
+        aggregate_type: Optional[str],
+        event_type: Optional[str],
+        since: Optional[str],
+        after: Optional[int],
+        index_filters: Optional[Dict[str, str]],
+        attribute_filters: Optional[List[AttributeFilter]],
+    ) -> Tuple[int, bool]:
+        index_filters = index_filters or {}
+        if (
+            since is None
+            and after is None
+            and not attribute_filters
+            and set(index_filters) <= {"event_name"}
+        ):
+            counters = {
+                "aggregate_type": aggregate_type,
+                "event_type": event_type,
+                "event_name": index_filters.get("event_name"),
+            }
+            return self._sum_counters(counters), False
+
+        window = (aggregate_type, event_type, since, after, index_filters)
+        total = self._count_matching(*window, None)
+        if not attribute_filters:
+            return total, False
+        if total <= COUNT_SAMPLE_SIZE:
+            return self._count_matching(*window, attribute_filters), False
+
+        # Test the attribute predicates on the newest events of the
+        # window, which are in the live store unless it was just sealed
+        predicates = [f.to_sql() for f in attribute_filters]
+        matches = " AND ".join(clause for clause, _ in predicates)
+        match_params = [value for _, values in predicates for value in values]
+        sampled = matched = 0
+        sources = [(self._connection(), True)]
+        sources += [
+            (partition, False)
+            for partition in sorted(
+                self._partitions(since=since),
+                key=lambda partition: partition.end,
+                reverse=True,
+            )
+        ]
+        for source_db, indexed in sources:
+            if sampled >= COUNT_SAMPLE_SIZE:
+                break
+            source, clauses, params, timestamp, position = (
+                self._event_filters(
+                    aggregate_type,
+                    event_type,
+                    since,
+                    after,
+                    None,
+                    index_filters,
+                    None,
+                    indexed,
+                )
+            )
+            where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+            sql = (
+                f"SELECT COUNT(*), COALESCE(SUM({matches}), 0) FROM ("
+                f"SELECT events.event_data FROM {source} {where} "
+                f"ORDER BY {timestamp} DESC, {position} DESC LIMIT ?)"
+            )
+            params = match_params + params + [COUNT_SAMPLE_SIZE - sampled]
+            if indexed:
+                row = source_db.execute(sql, params).fetchone()
+            else:
+                with closing(source_db.connect(self.timeout)) as conn:
+                    row = conn.execute(sql, params).fetchone()
+            sampled += row[0]
+            matched += row[1]
+        return round(matched * total / sampled), True
+
+    def _count_matching(
+        self,
+        aggregate_type: Optional[str],
+        event_type: Optional[str],
+        since: Optional[str],
+        after: Optional[int],
+        index_filters: Dict[str, str],
+        attribute_filters: Optional[List[AttributeFilter]],
+    ) -> int:
+        """Count the matching events in the store and its partitions."""
+        filters = (
+            aggregate_type,
+            event_type,
+            since,
+            after,
+            None,
+            index_filters,
+            attribute_filters,
+        )
+        source, clauses, params, _, _ = self._event_filters(
+            *filters, payload=False
+        )
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        count = self._connection().execute(
+            f"SELECT COUNT(*) FROM {source} {where}", params
+        ).fetchone()[0]
+
+        for partition in self._partitions(since=since):
+            if after is not None and (
+                self._partition_max_position(partition) <= after
+            ):
+                continue
+            source, clauses, params, _, _ = self._event_filters(
+                *filters, indexed=False, payload=False
+            )
+            where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+            with closing(partition.connect(self.timeout)) as conn:
+                count += conn.execute(
+                    f"SELECT COUNT(*) FROM {source} {where}", params
+                ).fetchone()[0]
+        return count
+
+    def _sum_counters(self, counters: Dict[str, Optional[str]]) -> int:
+        """Sum the event_counts rows matching ``counters`` in every source.
+
+        Partition counters come from the cached partition summaries.
+        """
+        filters = {
+            column: value for column, value in counters.items() if value
+        }
+        clauses = [f"{column} = ?" for column in filters]
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        count = self._connection().execute(
+            f"SELECT COALESCE(SUM(count), 0) FROM event_counts {where}",
+            list(filters.values()),
+        ).fetchone()[0]
+        for partition in self._partitions():
+            _, rows = self._partition_summary(partition)
+            count += sum(
+                row["count"] for row in rows
+                if all(row[column] == filters[column] for column in filters)
+            )
+        return count
+
+    async def count_events(
+        self,
+        aggregate_type: Optional[str] = None,
+        event_type: Optional[str] = None,
+        since: Optional[str] = None,
+        after: Optional[int] = None,
+        index_filters: Optional[Dict[str, str]] = None,
+        attribute_filters: Optional[List[AttributeFilter]] = None,
+    ) -> Tuple[int, bool]:
+        """Count the events matching a GET /events filter.
+
+        Returns ``(count, estimated)``.  Filters on aggregate type, event
+        type and event name are answered exactly from the event_counts
+        read model, and time, position and index filters by an index
+        range count.  Attribute predicates are counted exactly when at
+        most ``COUNT_SAMPLE_SIZE`` events match the other filters;
+        otherwise they are tested on the newest ``COUNT_SAMPLE_SIZE`` of
+        those events and the share that matched is scaled to all of them.
+        """
+        return await asyncio.to_thread(
+            self._count_events,
+            aggregate_type,
+            event_type,
+            since,
+            after,
+            index_filters,
+            attribute_filters,
+        )
+
+    def _fetch_aggregate_events(
+        self,
+        aggregate_id: str,
+        aggregate_type: Optional[str],
+        from_version: Optional[int],
+        to_version: Optional[int],
+        limit: int,
+    ) -> List[Dict[str, Any]]:
+        clauses = ["events.aggregate_id = ?"]
+        params: List[Any] = [aggregate_id]
+
+        if aggregate_type:
+            clauses.append("events.aggregate_type = ?")
+            params.append(aggregate_type)
+        if from_version is not None:
+            clauses.append("aggregate_version >= ?")
+            params.append(from_version)
+        if to_version is not None:
+            clauses.append("aggregate_version <= ?")
+            params.append(to_version)
+
+        # Served by the store's UNIQUE(aggregate_id, aggregate_version) index
+        sql = (
+            f"SELECT {EVENT_COLUMNS} FROM {POSITIONED_EVENTS} "
+            f"WHERE {' AND '.join(clauses)} "
+            "ORDER BY aggregate_version ASC LIMIT ?"
+        )
+        params.append(limit)
+
+        rows = self._connection().execute(sql, params).fetchall()
+        first = from_version or 1
+        if not rows or rows[0]["aggregate_version"] > first:
+            # The start of the stream may have been sealed; the store
+            # keeps every aggregate's latest event, never its first
+            streams = [rows]
+            for partition in self._partitions():
+                with closing(partition.connect(self.timeout)) as conn:
+                    streams.append(conn.execute(sql, params).fetchall())
+            rows = list(heapq.merge(
+                *streams, key=itemgetter("aggregate_version")
+            ))[:limit]
+        return [row_to_event_dict(row) for row in rows]
+
+    async def fetch_aggregate_events(
+        self,
+        aggregate_id: str,
+        aggregate_type: Optional[str] = None,
+        from_version: Optional[int] = None,
+        to_version: Optional[int] = None,
+        limit: int = 100,
+    ) -> List[Dict[str, Any]]:
+        """Fetch one aggregate's stream in version order.
+
+        The cost is proportional to that aggregate's own history, not to
+        the number of events of its type.  The streams of partitioned
+        aggregates are read from every partition.
+        """
+        return await asyncio.to_thread(
+            self._fetch_aggregate_events,
+            aggregate_id,
+            aggregate_type,
+            from_version,
+            to_version,
+            limit,
+        )
+
+    def _fetch_events_by_ids(
+        self, event_ids: List[str]
+    ) -> List[Dict[str, Any]]:
+        if not event_ids:
+            return []
+        placeholders = ", ".join("?" for _ in event_ids)
+        sql = (
+            f"SELECT {EVENT_COLUMNS} FROM {POSITIONED_EVENTS} "
+            f"WHERE events.id IN ({placeholders}) ORDER BY p.position ASC"
+        )
+        rows = self._connection().execute(sql, event_ids).fetchall()
+        return [row_to_event_dict(row) for row in rows]
+
+    async def fetch_events_by_ids(
+        self, event_ids: List[str]
+    ) -> List[Dict[str, Any]]:
+        """Fetch specific events by ID in append order."""
+        return await asyncio.to_thread(self._fetch_events_by_ids, event_ids)
+
+    def _fetch_workflow_agents(self, workflow_id: str) -> List[Dict[str, Any]]:
+        rows = self._connection().execute(
+            "SELECT * FROM workflow_agents WHERE workflow_id = ? "
+            "ORDER BY first_event_time ASC, agent_id ASC",
+            (workflow_id,)
+        ).fetchall()
+
+        agents = []
+        for row in rows:
+            agent_id = row["agent_id"]
+            agent_name = row["agent_name"] or (
+                agent_id.split('-')[0] if '-' in agent_id else 'unknown'
+            )
+            agents.append({
+                'agent_id': agent_id,
+                'agent_name': agent_name,
+                'workflow_id': row["workflow_id"],
+                'parent_agent_id': row["parent_agent_id"],
+                'status': row["status"],
+                'first_event_time': row["first_event_time"],
+                'last_event_time': row["last_event_time"],
+                'event_type': row["first_event_type"],
+                'event_count': row["event_count"],
+            })
+        return agents
+
+    async def fetch_workflow_agents(
+        self, workflow_id: str
+    ) -> List[Dict[str, Any]]:
+        """Fetch the agents of one workflow from its projection.
+
+        A primary-key range lookup, independent of how many agents and
+        events exist overall.
+        """
+        return await asyncio.to_thread(
+            self._fetch_workflow_agents, workflow_id
+        )
+
+    def _fetch_agent_statuses(
+        self,
+        status: Optional[str],
+        workflow_id: Optional[str],
+        agent_name: Optional[str],
+        limit: int,
+    ) -> List[Dict[str, Any]]:
+        clauses: List[str] = []
+        params: List[Any] = []
+
+        # Each filter combination is a range on one of the table's indexes
+        if workflow_id:
+            clauses.append("workflow_id = ?")
+            params.append(workflow_id)
+        if agent_name:
+            clauses.append("agent_name = ?")
+            params.append(agent_name)
+        if status:
+            clauses.append("status = ?")
+            params.append(status)
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        sql = (
+            f"SELECT * FROM agent_status {where} "
+            "ORDER BY last_event_time DESC, agent_id ASC LIMIT ?"
+        )
+        params.append(limit)
+
+        rows = self._connection().execute(sql, params).fetchall()
+        return [dict(row) for row in rows]
+
+    async def fetch_agent_statuses(
+        self,
+        status: Optional[str] = None,
+        workflow_id: Optional[str] = None,
+        agent_name: Optional[str] = None,
+        limit: int = 100,
+    ) -> List[Dict[str, Any]]:
+        """Fetch current agent statuses, most recently active first."""
+        return await asyncio.to_thread(
+            self._fetch_agent_statuses, status, workflow_id, agent_name, limit
+        )
+
+    def _fetch_status_transitions(
+        self, agent_ids: List[str], positions: List[int]
+    ) -> List[Dict[str, Any]]:
+        if not agent_ids or not positions:
+            return []
+        agent_placeholders = ", ".join("?" for _ in agent_ids)
+        position_placeholders = ", ".join("?" for _ in positions)
+        sql = (
+            f"SELECT * FROM agent_status "
+            f"WHERE agent_id IN ({agent_placeholders}) "
+            f"AND status_position IN ({position_placeholders}) "
+            "ORDER BY status_position ASC"
+        )
+        rows = self._connection().execute(
+            sql, [*agent_ids, *positions]
+        ).fetchall()
+        return [dict(row) for row in rows]
+
+    async def fetch_status_transitions(
+        self, agent_ids: List[str], positions: List[int]
+    ) -> List[Dict[str, Any]]:
+        """Fetch agents whose status was last set by one of ``positions``."""
+        return await asyncio.to_thread(
+            self._fetch_status_transitions, agent_ids, positions
+        )
+
+    def _attach_agent_stats(
+        self, workflows: List[Dict[str, Any]], slowest: int
+    ) -> List[Dict[str, Any]]:
+        # Agent counts and the slowest agents come from workflow_agents,
+        # two primary-key range lookups for the whole page
+        if not workflows:
+            return workflows
+        ids = [workflow["workflow_id"] for workflow in workflows]
+        placeholders = ", ".join("?" for _ in ids)
+        conn = self._connection()
+
+        counts = {
+            row["workflow_id"]: row
+            for row in conn.execute(
+                "SELECT workflow_id, COUNT(*) AS agent_count, "
+                "SUM(status = 'completed') AS agents_completed, "
+                "SUM(status = 'failed') AS agents_failed "
+                f"FROM workflow_agents WHERE workflow_id IN ({placeholders}) "
+                "GROUP BY workflow_id",
+                ids
+            )
+        }
+
+        slowest_agents: Dict[str, List[Dict[str, Any]]] = {}
+        if slowest > 0:
+            agent_duration = duration_ms("first_event_time", "last_event_time")
+            rows = conn.execute(
+                "SELECT workflow_id, agent_id, agent_name, status, "
+                "duration_ms FROM ("
+                "SELECT *, ROW_NUMBER() OVER ("
+                "PARTITION BY workflow_id "
+                "ORDER BY duration_ms DESC, agent_id ASC) AS rank "
+                f"FROM (SELECT *, {agent_duration} AS duration_ms "
+                "FROM workflow_agents "
+                f"WHERE workflow_id IN ({placeholders}))"
+                ") WHERE rank <= ? ORDER BY workflow_id, rank",
+                [*ids, slowest]
+            ).fetchall()
+            for row in rows:
+                agent = dict(row)
+                slowest_agents.setdefault(agent.pop("workflow_id"), []).append(
+                    agent
+                )
+
+        for workflow in workflows:
+            row = counts.get(workflow["workflow_id"])
+            workflow["agent_count"] = row["agent_count"] if row else 0
+            workflow["agents_completed"] = (
+                row["agents_completed"] if row else 0
+            )
+            workflow["agents_failed"] = row["agents_failed"] if row else 0
+            workflow["slowest_agents"] = slowest_agents.get(
+                workflow["workflow_id"], []
+            )
+        return workflows
+
+    def _fetch_workflow_summaries(
+        self,
+        status: Optional[str],
+        since: Optional[str],
+        until: Optional[str],
+        min_duration_ms: Optional[int],
+        before: Optional[Tuple[str, int]],
+        limit: int,
+        slowest: int,
+    ) -> List[Dict[str, Any]]:
+        clauses: List[str] = []
+        params: List[Any] = []
+
+        if status:
+            clauses.append("status = ?")
+            params.append(status)
+        if since:
+            clauses.append("started_at >= ?")
+            params.append(normalize_timestamp(since))
+        if until:
+            clauses.append("started_at < ?")
+            params.append(normalize_timestamp(until))
+        if min_duration_ms is not None:
+            clauses.append("duration_ms >= ?")
+            params.append(min_duration_ms)
+        if before is not None:
+            clauses.append("(started_at, start_position) < (?, ?)")
+            params.extend(before)
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        sql = (
+            f"SELECT * FROM workflow_summary {where} "
+            "ORDER BY started_at DESC, start_position DESC LIMIT ?"
+        )
+        params.append(limit)
+
+        rows = self._connection().execute(sql, params).fetchall()
+        return self._attach_agent_stats([dict(row) for row in rows], slowest)
+
+    async def fetch_workflow_summaries(
+        self,
+        status: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        min_duration_ms: Optional[int] = None,
+        before: Optional[Tuple[str, int]] = None,
+        limit: int = 100,
+        slowest: int = 3,
+    ) -> List[Dict[str, Any]]:
+        """Fetch one page of workflow summaries, most recently started first.
+
+        ``before`` is a (started_at, start_position) keyset bound that
+        continues a previous page.  Each summary carries its agent counts
+        and its ``slowest`` longest-running agents.
+        """
+        return await asyncio.to_thread(
+            self._fetch_workflow_summaries,
+            status,
+            since,
+            until,
+            min_duration_ms,
+            before,
+            limit,
+            slowest,
+        )
+
+    def _fetch_workflow_row(
+        self, workflow_id: str
+    ) -> Optional[Dict[str, Any]]:
+        row = self._connection().execute(
+            "SELECT * FROM workflow_summary WHERE workflow_id = ?",
+            (workflow_id,)
+        ).fetchone()
+        return dict(row) if row is not None else None
+
+    async def fetch_workflow_row(
+        self, workflow_id: str
+    ) -> Optional[Dict[str, Any]]:
+        """Fetch a workflow's workflow_summary row alone, or None."""
+        return await asyncio.to_thread(self._fetch_workflow_row, workflow_id)
+
+    def _fetch_workflow_summary(
+        self, workflow_id: str, slowest: int
+    ) -> Optional[Dict[str, Any]]:
+        summary = self._fetch_workflow_row(workflow_id)
+        if summary is None:
+            return None
+        return self._attach_agent_stats([summary], slowest)[0]
+
+    async def fetch_workflow_summary(
+        self, workflow_id: str, slowest: int = 3
+    ) -> Optional[Dict[str, Any]]:
+        """Fetch the summary of one workflow, or None if it is unknown."""
+        return await asyncio.to_thread(
+            self._fetch_workflow_summary, workflow_id, slowest
+        )
+
+    def _fetch_descendants(
+        self, agent_id: str, max_depth: int, limit: int
+    ) -> List[Dict[str, Any]]:
+        # Each step is a range seek on the (parent_id, child_id) key; the
+        # depth bound also stops walks around a malformed cycle
+        rows = self._connection().execute(
+            f"""
+            WITH RECURSIVE tree (agent_id, parent_agent_id, depth) AS (
+                SELECT child_id, parent_id, 1 FROM causation_edges
+                WHERE parent_id = ?
+                UNION
+                SELECT edge.child_id, edge.parent_id, tree.depth + 1
+                FROM causation_edges AS edge
+                JOIN tree ON edge.parent_id = tree.agent_id
+                WHERE tree.depth < ?
+            )
+            SELECT tree.agent_id, tree.parent_agent_id,
+                MIN(tree.depth) AS depth, {AGENT_NODE_COLUMNS}
+            FROM tree LEFT JOIN agent_status AS s USING (agent_id)
+            WHERE tree.agent_id != ?
+            GROUP BY tree.agent_id
+            ORDER BY depth ASC, s.first_event_time ASC, tree.agent_id ASC
+            LIMIT ?
+            """,
+            (agent_id, max_depth, agent_id, limit)
+        ).fetchall()
+        return [dict(row) for row in rows]
+
+    async def fetch_descendants(
+        self, agent_id: str, max_depth: int = 100, limit: int = 1000
+    ) -> List[Dict[str, Any]]:
+        """Fetch every agent caused, directly or not, by ``agent_id``.
+
+        Agents come back nearest first, each with the parent it was
+        reached through and its depth below ``agent_id``.
+        """
+        return await asyncio.to_thread(
+            self._fetch_descendants, agent_id, max_depth, limit
+        )
+
+    def _fetch_ancestry(
+        self, event_id: str, max_depth: int
+    ) -> Optional[Dict[str, Any]]:
+        conn = self._connection()
+        row = conn.execute(
+            f"SELECT {EVENT_COLUMNS} FROM {POSITIONED_EVENTS} "
+            "WHERE events.id = ?",
+            (event_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        event = row_to_event_dict(row)
+
+        # The agent that emitted the event, or the agent that caused it
+        if event["aggregate_type"] == "agent_aggregate":
+            agent_id, start_depth = event["aggregate_id"], 0
+        else:
+            agent_id, start_depth = event["causation_id"], 1
+
+        ancestors: List[Dict[str, Any]] = []
+        if agent_id:
+            rows = conn.execute(
+                f"""
+                WITH RECURSIVE chain (agent_id, child_agent_id, depth) AS (
+                    SELECT ?, NULL, ?
+                    UNION
+                    SELECT edge.parent_id, edge.child_id, chain.depth + 1
+                    FROM causation_edges AS edge
+                    JOIN chain ON edge.child_id = chain.agent_id
+                    WHERE chain.depth < ?
+                )
+                SELECT chain.agent_id, chain.child_agent_id,
+                    MIN(chain.depth) AS depth, {AGENT_NODE_COLUMNS}
+                FROM chain LEFT JOIN agent_status AS s USING (agent_id)
+                GROUP BY chain.agent_id
+                ORDER BY depth ASC, chain.agent_id ASC
+                """,
+                (agent_id, start_depth, max_depth)
+            ).fetchall()
+            ancestors = [dict(row) for row in rows]
+        return {"event": event, "ancestors": ancestors}
+
+    async def fetch_ancestry(
+        self, event_id: str, max_depth: int = 100
+    ) -> Optional[Dict[str, Any]]:
+        """Fetch an event and the chain of agents that led to it.
+
+        The chain starts at the emitting agent (depth 0), or at the agent
+        that caused a non-agent event (depth 1), and walks parent edges
+        up to the root.  Returns None if the event does not exist.
+        """
+        return await asyncio.to_thread(
+            self._fetch_ancestry, event_id, max_depth
+        )
+
+    def _fetch_workflow_tree(self, workflow_id: str) -> List[Dict[str, Any]]:
+        conn = self._connection()
+        nodes = {
+            row["agent_id"]: dict(row, children=[])
+            for row in conn.execute(
+                "SELECT agent_id, agent_name, status, first_event_time, "
+                "last_event_time, event_count FROM workflow_agents "
+                "WHERE workflow_id = ? "
+                "ORDER BY first_event_time ASC, agent_id ASC",
+                (workflow_id,)
+            )
+        }
+        parents: Dict[str, str] = {}
+        for row in conn.execute(
+            "SELECT parent_id, child_id FROM causation_edges "
+            "WHERE workflow_id = ? ORDER BY position ASC",
+            (workflow_id,)
+        ):
+            if row["child_id"] in nodes and row["parent_id"] in nodes:
+                parents.setdefault(row["child_id"], row["parent_id"])
+
+        roots = []
+        for agent_id, node in nodes.items():
+            node["parent_agent_id"] = parents.get(agent_id)
+            if agent_id in parents and not _creates_cycle(parents, agent_id):
+                nodes[parents[agent_id]]["children"].append(node)
+            else:
+                roots.append(node)
+        return roots
+
+    async def fetch_workflow_tree(
+        self, workflow_id: str
+    ) -> List[Dict[str, Any]]:
+        """Fetch a workflow's agents nested under the agents that caused them.
+
+        Agents whose parent is outside the workflow are roots.  Siblings
+        are ordered by their first event.
+        """
+        return await asyncio.to_thread(self._fetch_workflow_tree, workflow_id)
+
+    def _fetch_timeline_inputs(
+        self, workflow_id: str
+    ) -> Tuple[List[Dict[str, Any]], List[Tuple[str, str]]]:
+        conn = self._connection()
+        agents = [
+            dict(row) for row in conn.execute(
+                "SELECT * FROM workflow_agents WHERE workflow_id = ? "
+                "ORDER BY first_event_time ASC, agent_id ASC",
+                (workflow_id,)
+            )
+        ]
+        edges = [
+            (row["parent_id"], row["child_id"]) for row in conn.execute(
+                "SELECT parent_id, child_id FROM causation_edges "
+                "WHERE workflow_id = ? ORDER BY position ASC",
+                (workflow_id,)
+            )
+        ]
+        return agents, edges
+
+    async def fetch_timeline_inputs(
+        self, workflow_id: str
+    ) -> Tuple[List[Dict[str, Any]], List[Tuple[str, str]]]:
+        """Fetch a workflow's agents and (parent, child) causation edges."""
+        return await asyncio.to_thread(
+            self._fetch_timeline_inputs, workflow_id
+        )
+
+    def _fetch_export_page(
+        self,
+        after: int,
+        to_position: int,
+        since: Optional[str],
+        until: Optional[str],
+        aggregate_type: Optional[str],
+        event_type: Optional[str],
+        page_size: int,
+    ) -> List[Dict[str, Any]]:
+        # Imported here as the export module builds on this one
+        from .export import export_filters, fetch_export_page, merge_pages
+
+        clauses, params = export_filters(
+            since, until, aggregate_type, event_type
+        )
+        pages = [fetch_export_page(
+            self._connection(), after, to_position, clauses, params, page_size
+        )]
+        for partition in self._partitions(since=since, until=until):
+            if self._partition_max_position(partition) <= after:
+                continue
+            with closing(partition.connect(self.timeout)) as conn:
+                pages.append(fetch_export_page(
+                    conn, after, to_position, clauses, params, page_size
+                ))
+        return merge_pages(pages, page_size)
+
+    async def fetch_export_page(
+        self,
+        after: int,
+        to_position: int,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        aggregate_type: Optional[str] = None,
+        event_type: Optional[str] = None,
+        page_size: int = 1000,
+    ) -> List[Dict[str, Any]]:
+        """Fetch the next page of raw export records, in position order.
+
+        ``since`` is inclusive and ``until`` exclusive.
+        """
+        return await asyncio.to_thread(
+            self._fetch_export_page,
+            after,
+            to_position,
+            since,
+            until,
+            aggregate_type,
+            event_type,
+            page_size,
+        )
+
+    def _seal_partitions(self, period: str, cutoff: date) -> List[Partition]:
+        return seal_partitions(
+            self._connection(), self.partitions_dir, period, cutoff
+        )
+
+    async def seal_partitions(
+        self, period: str, cutoff: date
+    ) -> List[Partition]:
+        """Move events older than ``cutoff`` into per-period partitions.
+
+        Returns the partitions that received events.
+        """
+        return await asyncio.to_thread(self._seal_partitions, period, cutoff)
+
+    def _max_position(self) -> int:
+        return self._connection().execute(MAX_POSITION_SQL).fetchone()[0]
+
+    async def max_position(self) -> int:
+        """Get the highest global position in the store."""
+        return await asyncio.to_thread(self._max_position)
+
+    def close(self) -> None:
+        """Close every connection opened by this reader."""
+        with self._connections_lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+        self._local = threading.local()
@@ -0,0 +1,136 @@
+"""Critical path and timeline analysis of a workflow's agents."""
+
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+Interval = Tuple[datetime, datetime]
+
+
+def _parse(timestamp: str) -> datetime:
+    parsed = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def _ms(start: datetime, end: datetime) -> int:
+    return round((end - start).total_seconds() * 1000)
+
+
+def _merge(intervals: List[Interval]) -> List[Interval]:
+    """Union of intervals as a sorted list of disjoint intervals."""
+    merged: List[Interval] = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def _clip(
+    intervals: List[Interval], start: datetime, end: datetime
+) -> List[Interval]:
+    """The parts of ``intervals`` inside ``start``..``end``, merged."""
+    return _merge([
+        (max(a, start), min(b, end))
+        for a, b in intervals
+        if a <= end and b >= start
+    ])
+
+
+def build_timeline(
+    summary: Dict[str, Any],
+    agents: List[Dict[str, Any]],
+    edges: List[Tuple[str, str]],
+) -> Dict[str, Any]:
+    """Analyse where a workflow's time went.
+
+    ``agents`` are workflow_agents rows and ``edges`` (parent, child)
+    causation pairs in append order.  Each agent runs from its first to
+    its last event.  Its child time is the part of that span covered by
+    the agents it caused, and the rest is self time.  The critical path
+    follows the last agent to finish from the root down, i.e. the chain
+    that set the end-to-end latency.  Idle gaps are stretches of the
+    workflow during which no agent was active.
+    """
+    spans: Dict[str, Interval] = {
+        agent["agent_id"]: (
+            _parse(agent["first_event_time"]),
+            _parse(agent["last_event_time"]),
+        )
+        for agent in agents
+    }
+
+    parents: Dict[str, str] = {}
+    children: Dict[str, List[str]] = {agent_id: [] for agent_id in spans}
+    for parent_id, child_id in edges:
+        if child_id in parents or parent_id not in spans:
+            continue
+        if child_id in spans:
+            parents[child_id] = parent_id
+            children[parent_id].append(child_id)
+
+    timeline_agents = []
+    for agent in agents:
+        agent_id = agent["agent_id"]
+        start, end = spans[agent_id]
+        child_ms = sum(
+            _ms(a, b)
+            for a, b in _clip(
+                [spans[child_id] for child_id in children[agent_id]],
+                start,
+                end,
+            )
+        )
+        timeline_agents.append({
+            "agent_id": agent_id,
+            "agent_name": agent["agent_name"],
+            "parent_agent_id": parents.get(agent_id),
+            "status": agent["status"],
+            "start": agent["first_event_time"],
+            "end": agent["last_event_time"],
+            "duration_ms": _ms(start, end),
+            "self_ms": _ms(start, end) - child_ms,
+            "child_ms": child_ms,
+        })
+
+    def last_to_finish(candidates: List[str]) -> Optional[str]:
+        if not candidates:
+            return None
+        return max(candidates, key=lambda agent_id: spans[agent_id][1])
+
+    by_id = {agent["agent_id"]: agent for agent in timeline_agents}
+    critical_path: List[Dict[str, Any]] = []
+    visited: Set[str] = set()
+    current = last_to_finish([a for a in spans if a not in parents])
+    while current is not None and current not in visited:
+        visited.add(current)
+        critical_path.append(by_id[current])
+        current = last_to_finish(children[current])
+
+    workflow_start = _parse(summary["started_at"])
+    workflow_end = _parse(summary["ended_at"] or summary["last_event_time"])
+    active = _clip(list(spans.values()), workflow_start, workflow_end)
+    idle_gaps = []
+    cursor = workflow_start
+    for start, end in active + [(workflow_end, workflow_end)]:
+        if start > cursor:
+            idle_gaps.append({
+                "start": cursor.isoformat(),
+                "end": start.isoformat(),
+                "duration_ms": _ms(cursor, start),
+            })
+        cursor = max(cursor, end)
+
+    return {
+        "workflow_id": summary["workflow_id"],
+        "status": summary["status"],
+        "started_at": summary["started_at"],
+        "ended_at": summary["ended_at"],
+        "duration_ms": _ms(workflow_start, workflow_end),
+        "critical_path": critical_path,
+        "agents": timeline_agents,
+        "idle_gaps": idle_gaps,
+        "idle_ms": sum(gap["duration_ms"] for gap in idle_gaps),
+    }
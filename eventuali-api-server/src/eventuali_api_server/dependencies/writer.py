@@ -0,0 +1,130 @@
+"""Group commit for concurrent appends to the event store."""
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, List, Optional, Tuple
+
+from eventuali import Event, EventStore
+
+logger = logging.getLogger(__name__)
+
+CommitCallback = Callable[[List[Event]], Awaitable[None]]
+
+
+class WriteCoalescer:
+    """Coalesces appends that arrive close together into one commit.
+
+    The first append of a group waits up to ``window`` seconds (or until
+    ``max_batch`` events are pending) before the whole group is written
+    with a single ``append_events`` call.  Appends that arrive while a
+    commit is in flight are flushed together right after it, so commit
+    cost is shared as concurrency grows.  Every caller is released only
+    once the commit containing its events has completed.
+    """
+
+    def __init__(
+        self,
+        store: EventStore,
+        window: float = 0.002,
+        max_batch: int = 500,
+        on_commit: Optional[CommitCallback] = None,
+    ) -> None:
+        self.store = store
+        self.window = window
+        self.max_batch = max_batch
+        self.on_commit = on_commit
+        self._pending: List[Tuple[List[Event], asyncio.Future]] = []
+        self._pending_count = 0
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def append(self, events: List[Event]) -> None:
+        """Append events as part of the next group commit."""
+        if not events:
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((events, future))
+        self._pending_count += len(events)
+
+        if self._task is None or self._task.done():
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+        if self._pending_count >= self.max_batch:
+            self._wakeup.set()
+
+        await future
+
+    async def _run(self) -> None:
+        batch: List[Tuple[List[Event], asyncio.Future]] = []
+        try:
+            if self._pending_count < self.max_batch and self.window > 0:
+                try:
+                    await asyncio.wait_for(
+                        self._wakeup.wait(), timeout=self.window
+                    )
+                except asyncio.TimeoutError:
+                    pass
+
+            while self._pending:
+                batch = self._pending
+                self._pending = []
+                self._pending_count = 0
+                await self._commit(batch)
+        except BaseException as e:
+            # Never leave callers waiting on a flush that died
+            for _, future in batch + self._pending:
+                self._resolve(future, e)
+            self._pending = []
+            self._pending_count = 0
+            raise
+
+    async def _commit(
+        self, batch: List[Tuple[List[Event], asyncio.Future]]
+    ) -> None:
+        events = [event for group, _ in batch for event in group]
+
+        try:
+            await self.store.append_events(events)
+        except Exception as e:
+            if len(batch) == 1:
+                self._resolve(batch[0][1], e)
+                return
+            # Retry each caller's events alone so one bad request does
+            # not fail everyone it happened to share a commit with
+            logger.warning(
+                f"Group commit of {len(events)} events failed ({e}); "
+                "retrying individually"
+            )
+            for group, future in batch:
+                try:
+                    await self.store.append_events(group)
+                except Exception as group_error:
+                    self._resolve(future, group_error)
+                    continue
+                await self._notify(group)
+                self._resolve(future)
+            return
+
+        await self._notify(events)
+        for _, future in batch:
+            self._resolve(future)
+
+    async def _notify(self, events: List[Event]) -> None:
+        if self.on_commit is None:
+            return
+        try:
+            await self.on_commit(events)
+        except Exception as e:
+            logger.error(f"Commit callback failed: {e}")
+
+    @staticmethod
+    def _resolve(
+        future: asyncio.Future, error: Optional[BaseException] = None
+    ) -> None:
+        if future.done():
+            return
+        if error is None:
+            future.set_result(None)
+        else:
+            future.set_exception(error)
@@ -8,7 +8,7 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from .config import get_config
 from .dependencies.database import db_manager
-from .routes import events
+from .routes import agents, events, workflows
 from .routes.health import router as health_router
 
 logger = logging.getLogger(__name__)
@@ -57,6 +57,8 @@ def create_app() -> FastAPI:
     
     # Include routers
     app.include_router(events.router)
+    app.include_router(agents.router)
+    app.include_router(workflows.router)
     app.include_router(health_router)
     
     # Root endpoint
@@ -69,6 +71,8 @@ def create_app() -> FastAPI:
             "description": config.description,
             "endpoints": {
                 "events": "/events",
+                "agents": "/agents",
+                "workflows": "/workflows",
                 "health": "/health",
                 "docs": "/docs",
                 "openapi": "/openapi.json"
@@ -1,7 +1,7 @@
 """Event models for the API server."""
 
 from datetime import datetime
-from typing import Any, Dict, Optional, List
+from typing import Any, Dict, Literal, Optional, List
 from uuid import uuid4
 
 from pydantic import BaseModel, Field
@@ -28,6 +28,48 @@ class EventRequest(BaseModel):
     )
 
 
+class BatchEventItem(EventRequest):
+    """A single event inside a batch emit request."""
+    
+    type: Literal["agent", "workflow", "system"] = Field(
+        ..., description="Aggregate kind the event belongs to"
+    )
+
+
+class BatchEventRequest(BaseModel):
+    """Request model for emitting a batch of events."""
+    
+    events: List[Dict[str, Any]] = Field(
+        ...,
+        description="Batch items, each validated as a BatchEventItem",
+        min_length=1,
+        max_length=1000
+    )
+
+
+class BatchItemResult(BaseModel):
+    """Outcome for one item of a batch emit request."""
+    
+    index: int = Field(..., description="Position of the item in the batch")
+    success: bool = Field(..., description="Whether the item was appended")
+    event_id: Optional[str] = Field(None, description="Generated event ID")
+    message: str = Field(..., description="Result or validation error")
+    timestamp: Optional[datetime] = Field(
+        None, description="Event timestamp (UTC)"
+    )
+
+
+class BatchEventResponse(BaseModel):
+    """Response model for batch emit operations."""
+    
+    success: bool = Field(..., description="True if every item was appended")
+    appended: int = Field(..., description="Number of events appended")
+    failed: int = Field(..., description="Number of rejected items")
+    results: List[BatchItemResult] = Field(
+        ..., description="Per-item results in request order"
+    )
+
+
 class EventResponse(BaseModel):
     """Response model for event operations."""
     
@@ -41,6 +83,9 @@ class EventItem(BaseModel):
     """Model for individual event items."""
     
     event_id: str = Field(..., description="Unique event ID")
+    position: Optional[int] = Field(
+        None, description="Global append position (dense, increasing)"
+    )
     aggregate_id: str = Field(..., description="Aggregate ID")
     aggregate_type: str = Field(..., description="Type of aggregate")
     event_type: str = Field(..., description="Type of event")
@@ -70,8 +115,14 @@ class EventsResponse(BaseModel):
     
     events: List[EventItem] = Field(..., description="List of events")
     total: Optional[int] = Field(None, description="Total count if available")
+    total_estimated: bool = Field(
+        False, description="Whether total is an estimate"
+    )
     limit: int = Field(..., description="Query limit")
     offset: int = Field(..., description="Query offset")
+    next_cursor: Optional[str] = Field(
+        None, description="Opaque token for the next page, if any"
+    )
 
 
 class GetEventsRequest(BaseModel):
@@ -82,6 +133,227 @@ class GetEventsRequest(BaseModel):
     event_type: Optional[str] = Field(None, description="Filter by event type")
     aggregate_type: Optional[str] = Field(None, description="Filter by aggregate type")
     since: Optional[str] = Field(None, description="ISO timestamp for filtering")
+    after: Optional[int] = Field(
+        None, description="Only events after this global position", ge=0
+    )
+    cursor: Optional[str] = Field(
+        None, description="Continuation token from a previous page"
+    )
+    event_name: Optional[str] = Field(None, description="Filter by event name")
+    correlation_id: Optional[str] = Field(
+        None, description="Filter by correlation (workflow) ID"
+    )
+    causation_id: Optional[str] = Field(
+        None, description="Filter by causation (parent agent) ID"
+    )
+    agent_id: Optional[str] = Field(None, description="Filter by agent ID")
+    agent_name: Optional[str] = Field(None, description="Filter by agent name")
+
+
+class AgentStatusItem(BaseModel):
+    """Current status of one agent, from the agent_status projection."""
+    
+    agent_id: str = Field(..., description="Agent ID")
+    agent_name: Optional[str] = Field(None, description="Agent name")
+    workflow_id: Optional[str] = Field(None, description="Workflow ID")
+    parent_agent_id: Optional[str] = Field(None, description="Parent agent ID")
+    status: str = Field(
+        ..., description="One of started, running, completed or failed"
+    )
+    previous_status: Optional[str] = Field(
+        None, description="Status before the latest transition"
+    )
+    status_position: int = Field(
+        ..., description="Global position of the event that set the status"
+    )
+    first_event_time: datetime = Field(
+        ..., description="First event timestamp"
+    )
+    last_event_time: datetime = Field(
+        ..., description="Latest event timestamp"
+    )
+    last_event_name: Optional[str] = Field(
+        None, description="Latest event name"
+    )
+    last_position: int = Field(
+        ..., description="Global position of latest event"
+    )
+    event_count: int = Field(..., description="Number of events for the agent")
+
+
+class AgentStatusResponse(BaseModel):
+    """Response model for agent status listing."""
+    
+    agents: List[AgentStatusItem] = Field(..., description="Agent statuses")
+    limit: int = Field(..., description="Query limit")
+
+
+class SlowAgentItem(BaseModel):
+    """One of a workflow's longest-running agents."""
+    
+    agent_id: str = Field(..., description="Agent ID")
+    agent_name: Optional[str] = Field(None, description="Agent name")
+    status: str = Field(..., description="Current agent status")
+    duration_ms: Optional[int] = Field(
+        None, description="Time from the agent's first to last event"
+    )
+
+
+class WorkflowSummaryItem(BaseModel):
+    """Summary of one workflow, from the workflow_summary projection."""
+    
+    workflow_id: str = Field(..., description="Workflow ID")
+    user_prompt: Optional[str] = Field(None, description="User prompt")
+    status: str = Field(
+        ..., description="One of started, running, completed or failed"
+    )
+    started_at: datetime = Field(..., description="First event timestamp")
+    ended_at: Optional[datetime] = Field(
+        None, description="Completion or failure timestamp"
+    )
+    duration_ms: Optional[int] = Field(
+        None, description="Time from start to end, once ended"
+    )
+    last_event_time: datetime = Field(
+        ..., description="Latest event timestamp"
+    )
+    event_count: int = Field(..., description="Workflow and agent events")
+    agent_count: int = Field(..., description="Agents in the workflow")
+    agents_completed: int = Field(..., description="Agents that completed")
+    agents_failed: int = Field(..., description="Agents that failed")
+    slowest_agents: List[SlowAgentItem] = Field(
+        default_factory=list, description="Longest-running agents first"
+    )
+
+
+class WorkflowsResponse(BaseModel):
+    """Response model for workflow summary listing."""
+    
+    workflows: List[WorkflowSummaryItem] = Field(
+        ..., description="Workflow summaries, most recently started first"
+    )
+    limit: int = Field(..., description="Query limit")
+    next_cursor: Optional[str] = Field(
+        None, description="Opaque token for the next page, if any"
+    )
+
+
+class CausationNode(BaseModel):
+    """An agent reached by walking causation edges."""
+    
+    agent_id: str = Field(..., description="Agent ID")
+    depth: int = Field(..., description="Edges from the starting point")
+    parent_agent_id: Optional[str] = Field(
+        None, description="Parent the agent was reached from (descendants)"
+    )
+    child_agent_id: Optional[str] = Field(
+        None, description="Child the agent was reached from (ancestry)"
+    )
+    agent_name: Optional[str] = Field(None, description="Agent name")
+    status: Optional[str] = Field(None, description="Current agent status")
+    workflow_id: Optional[str] = Field(None, description="Workflow ID")
+    first_event_time: Optional[datetime] = Field(
+        None, description="First event timestamp"
+    )
+    last_event_time: Optional[datetime] = Field(
+        None, description="Latest event timestamp"
+    )
+
+
+class DescendantsResponse(BaseModel):
+    """Response model for an agent's descendants."""
+    
+    agent_id: str = Field(..., description="Agent whose subtree was walked")
+    descendants: List[CausationNode] = Field(
+        ..., description="Descendant agents, nearest first"
+    )
+
+
+class AncestryResponse(BaseModel):
+    """Response model for an event's causation ancestry."""
+    
+    event: EventItem = Field(..., description="The event")
+    ancestors: List[CausationNode] = Field(
+        ..., description="Emitting agent first, then its causing agents"
+    )
+
+
+class AgentTreeNode(BaseModel):
+    """An agent of a workflow with the agents it caused."""
+    
+    agent_id: str = Field(..., description="Agent ID")
+    agent_name: Optional[str] = Field(None, description="Agent name")
+    parent_agent_id: Optional[str] = Field(None, description="Parent agent ID")
+    status: str = Field(..., description="Current agent status")
+    first_event_time: datetime = Field(
+        ..., description="First event timestamp"
+    )
+    last_event_time: datetime = Field(
+        ..., description="Latest event timestamp"
+    )
+    event_count: int = Field(..., description="Number of events for the agent")
+    children: List["AgentTreeNode"] = Field(
+        default_factory=list, description="Agents caused by this agent"
+    )
+
+
+class WorkflowTreeResponse(BaseModel):
+    """Response model for a workflow's causation tree."""
+    
+    workflow_id: str = Field(..., description="Workflow ID")
+    roots: List[AgentTreeNode] = Field(
+        ..., description="Agents without a parent in the workflow"
+    )
+
+
+class TimelineAgent(BaseModel):
+    """One agent's span within a workflow timeline."""
+    
+    agent_id: str = Field(..., description="Agent ID")
+    agent_name: Optional[str] = Field(None, description="Agent name")
+    parent_agent_id: Optional[str] = Field(None, description="Parent agent ID")
+    status: str = Field(..., description="Current agent status")
+    start: datetime = Field(..., description="First event timestamp")
+    end: datetime = Field(..., description="Latest event timestamp")
+    duration_ms: int = Field(..., description="Time from start to end")
+    self_ms: int = Field(
+        ..., description="Part of the span not covered by child agents"
+    )
+    child_ms: int = Field(
+        ..., description="Part of the span covered by child agents"
+    )
+
+
+class IdleGap(BaseModel):
+    """A stretch of a workflow during which no agent was active."""
+    
+    start: datetime = Field(..., description="Gap start")
+    end: datetime = Field(..., description="Gap end")
+    duration_ms: int = Field(..., description="Gap length")
+
+
+class WorkflowTimelineResponse(BaseModel):
+    """Response model for a workflow's critical path and timeline."""
+    
+    workflow_id: str = Field(..., description="Workflow ID")
+    status: str = Field(..., description="Workflow status")
+    started_at: datetime = Field(..., description="First event timestamp")
+    ended_at: Optional[datetime] = Field(
+        None, description="Completion or failure timestamp"
+    )
+    duration_ms: int = Field(
+        ..., description="Time from start to end, or to the latest event"
+    )
+    critical_path: List[TimelineAgent] = Field(
+        ..., description="Chain of last-finishing agents, root first"
+    )
+    agents: List[TimelineAgent] = Field(
+        ..., description="Every agent, in order of first event"
+    )
+    idle_gaps: List[IdleGap] = Field(
+        ..., description="Periods with no active agent"
+    )
+    idle_ms: int = Field(..., description="Total idle time")
 
 
 class HealthResponse(BaseModel):
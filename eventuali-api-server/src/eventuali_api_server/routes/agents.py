@@ -0,0 +1,134 @@
+"""Agent status routes for the API server."""
+
+import json
+import logging
+from typing import Any, Dict, Literal, Optional
+
+from fastapi import APIRouter, HTTPException, Query
+from sse_starlette.sse import EventSourceResponse
+
+from ..dependencies.broadcast import status_broadcaster
+from ..dependencies.database import db_manager
+from ..models.events import (
+    AgentStatusItem,
+    AgentStatusResponse,
+    CausationNode,
+    DescendantsResponse,
+)
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/agents", tags=["agents"])
+
+AgentStatus = Literal["started", "running", "completed", "failed"]
+
+
+@router.get("/status", response_model=AgentStatusResponse)
+async def get_agent_statuses(
+    status: Optional[AgentStatus] = Query(None),
+    workflow_id: Optional[str] = Query(None, min_length=1),
+    agent_name: Optional[str] = Query(None, min_length=1),
+    limit: int = Query(100, ge=1, le=1000)
+):
+    """Get the current status of agents, most recently active first.
+    
+    Answered from the agent_status projection, which is kept current by
+    the append transaction, so no events are scanned or replayed.
+    """
+    try:
+        agents = await db_manager.get_agent_statuses(
+            status=status,
+            workflow_id=workflow_id,
+            agent_name=agent_name,
+            limit=limit
+        )
+        return AgentStatusResponse(
+            agents=[AgentStatusItem(**agent) for agent in agents],
+            limit=limit
+        )
+    except Exception as e:
+        logger.error(f"Error retrieving agent statuses: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+def _matches_status_filters(
+    agent: Dict[str, Any],
+    status: Optional[str],
+    workflow_id: Optional[str],
+    agent_name: Optional[str]
+) -> bool:
+    if status and agent.get("status") != status:
+        return False
+    if workflow_id and agent.get("workflow_id") != workflow_id:
+        return False
+    if agent_name and agent.get("agent_name") != agent_name:
+        return False
+    return True
+
+
+@router.get("/status/stream")
+async def stream_agent_statuses(
+    status: Optional[AgentStatus] = Query(None),
+    workflow_id: Optional[str] = Query(None, min_length=1),
+    agent_name: Optional[str] = Query(None, min_length=1)
+):
+    """Stream agent status transitions using Server-Sent Events.
+    
+    One ``status`` message is sent each time an agent appears or its
+    status changes, carrying the agent's updated projection row.  Its
+    SSE id is the global position of the event that caused it.
+    """
+    async def status_generator():
+        subscription = status_broadcaster.subscribe()
+        
+        try:
+            while True:
+                agent = await subscription.get()
+                
+                if agent is None:
+                    logger.warning("Status stream subscriber fell behind")
+                    yield {
+                        "event": "error",
+                        "data": json.dumps({"error": "Subscriber lagged"})
+                    }
+                    break
+                
+                if not _matches_status_filters(
+                    agent, status, workflow_id, agent_name
+                ):
+                    continue
+                
+                yield {
+                    "event": "status",
+                    "id": str(agent["status_position"]),
+                    "data": json.dumps(agent, default=str)
+                }
+        finally:
+            status_broadcaster.unsubscribe(subscription)
+    
+    return EventSourceResponse(status_generator())
+
+
+@router.get("/{agent_id}/descendants", response_model=DescendantsResponse)
+async def get_agent_descendants(
+    agent_id: str,
+    max_depth: int = Query(100, ge=1, le=1000),
+    limit: int = Query(1000, ge=1, le=10000)
+) -> DescendantsResponse:
+    """Get every agent caused, directly or transitively, by an agent.
+    
+    Walked over the causation edge index, so the cost follows the size
+    of the subtree rather than the size of the log.
+    """
+    try:
+        descendants = await db_manager.get_descendants(
+            agent_id, max_depth=max_depth, limit=limit
+        )
+    except Exception as e:
+        logger.error(f"Error retrieving agent descendants: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+    
+    return DescendantsResponse(
+        agent_id=agent_id,
+        descendants=[CausationNode(**node) for node in descendants]
+    )
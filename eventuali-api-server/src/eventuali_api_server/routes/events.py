@@ -1,17 +1,29 @@
 """Event routes for the API server."""
 
-import asyncio
+import json
 import logging
-from datetime import datetime
+import zlib
+from datetime import datetime, timezone
 from typing import Dict, Any, List, Optional
 from uuid import uuid4
 
 from eventuali import Event
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Header, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 from sse_starlette.sse import EventSourceResponse
 
-from ..dependencies.database import get_event_store, db_manager
+from ..dependencies.broadcast import event_broadcaster
+from ..dependencies.database import db_manager
+from ..dependencies.export import ndjson_line
+from ..dependencies.filters import parse_attribute_filters
+from ..dependencies.reader import decode_cursor, encode_cursor, terms_query
 from ..models.events import (
+    AncestryResponse,
+    BatchEventItem,
+    BatchEventRequest,
+    BatchEventResponse,
+    BatchItemResult,
+    CausationNode,
     EventRequest,
     EventResponse,
     EventsResponse,
@@ -96,24 +108,56 @@ class SystemEvent(Event):
         self.attributes = attributes or {}
 
 
+def build_agent_event(request: EventRequest) -> AgentEvent:
+    """Build an agent event from an emit request."""
+    return AgentEvent(
+        event_name=request.name,
+        agent_name=request.attributes.get("agent_name", ""),
+        agent_id=request.aggregate_id or str(uuid4()),
+        workflow_id=request.correlation_id,
+        parent_agent_id=request.causation_id,
+        attributes=request.attributes,
+        timestamp=request.timestamp or datetime.now(timezone.utc)
+    )
+
+
+def build_workflow_event(request: EventRequest) -> WorkflowEvent:
+    """Build a workflow event from an emit request."""
+    return WorkflowEvent(
+        event_name=request.name,
+        workflow_id=request.aggregate_id or str(uuid4()),
+        user_prompt=request.attributes.get("user_prompt"),
+        attributes=request.attributes,
+        timestamp=request.timestamp or datetime.now(timezone.utc)
+    )
+
+
+def build_system_event(request: EventRequest) -> SystemEvent:
+    """Build a system event from an emit request."""
+    return SystemEvent(
+        event_name=request.name,
+        session_id=request.aggregate_id,
+        attributes=request.attributes,
+        timestamp=request.timestamp or datetime.now(timezone.utc)
+    )
+
+
+EVENT_BUILDERS = {
+    "agent": build_agent_event,
+    "workflow": build_workflow_event,
+    "system": build_system_event,
+}
+
+
 @router.post("/emit/agent", response_model=EventResponse)
 async def emit_agent_event(
-    request: EventRequest,
-    store=Depends(get_event_store)
+    request: EventRequest
 ) -> EventResponse:
     """Emit an agent event."""
     try:
-        event = AgentEvent(
-            event_name=request.name,
-            agent_name=request.attributes.get("agent_name", ""),
-            agent_id=request.aggregate_id or str(uuid4()),
-            workflow_id=request.correlation_id,
-            parent_agent_id=request.causation_id,
-            attributes=request.attributes,
-            timestamp=request.timestamp or datetime.utcnow()
-        )
+        event = build_agent_event(request)
         
-        await store.append_events([event])
+        await db_manager.append_events([event])
         
         return EventResponse(
             success=True,
@@ -129,20 +173,13 @@ async def emit_agent_event(
 
 @router.post("/emit/workflow", response_model=EventResponse)
 async def emit_workflow_event(
-    request: EventRequest,
-    store=Depends(get_event_store)
+    request: EventRequest
 ) -> EventResponse:
     """Emit a workflow event."""
     try:
-        event = WorkflowEvent(
-            event_name=request.name,
-            workflow_id=request.aggregate_id or str(uuid4()),
-            user_prompt=request.attributes.get("user_prompt"),
-            attributes=request.attributes,
-            timestamp=request.timestamp or datetime.utcnow()
-        )
+        event = build_workflow_event(request)
         
-        await store.append_events([event])
+        await db_manager.append_events([event])
         
         return EventResponse(
             success=True,
@@ -158,19 +195,13 @@ async def emit_workflow_event(
 
 @router.post("/emit/system", response_model=EventResponse)
 async def emit_system_event(
-    request: EventRequest,
-    store=Depends(get_event_store)
+    request: EventRequest
 ) -> EventResponse:
     """Emit a system event."""
     try:
-        event = SystemEvent(
-            event_name=request.name,
-            session_id=request.aggregate_id,
-            attributes=request.attributes,
-            timestamp=request.timestamp or datetime.utcnow()
-        )
+        event = build_system_event(request)
         
-        await store.append_events([event])
+        await db_manager.append_events([event])
         
         return EventResponse(
             success=True,
@@ -184,31 +215,174 @@ async def emit_system_event(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/batch", response_model=BatchEventResponse)
+async def emit_event_batch(
+    request: BatchEventRequest
+) -> BatchEventResponse:
+    """Emit a batch of agent, workflow and system events.
+    
+    Each item is validated on its own; every valid item is appended in a
+    single store transaction, so the batch pays for one commit.
+    """
+    results: List[BatchItemResult] = []
+    events = []
+    
+    for index, item in enumerate(request.events):
+        try:
+            event_request = BatchEventItem.model_validate(item)
+            event = EVENT_BUILDERS[event_request.type](event_request)
+        except Exception as e:
+            results.append(BatchItemResult(
+                index=index,
+                success=False,
+                message=str(e)
+            ))
+            continue
+        
+        events.append(event)
+        results.append(BatchItemResult(
+            index=index,
+            success=True,
+            event_id=str(event.event_id),
+            message=f"Event '{event_request.name}' emitted successfully",
+            timestamp=event.timestamp
+        ))
+    
+    try:
+        if events:
+            await db_manager.append_events(events)
+    except Exception as e:
+        logger.error(f"Error emitting event batch: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+    
+    return BatchEventResponse(
+        success=len(events) == len(results),
+        appended=len(events),
+        failed=len(results) - len(events),
+        results=results
+    )
+
+
 @router.get("/", response_model=EventsResponse)
 async def get_events(
+    request: Request,
     limit: int = Query(100, ge=1, le=1000),
     offset: int = Query(0, ge=0),
     event_type: Optional[str] = Query(None),
     aggregate_type: Optional[str] = Query(None),
-    since: Optional[str] = Query(None)
+    since: Optional[str] = Query(None),
+    after: Optional[int] = Query(None, ge=0),
+    cursor: Optional[str] = Query(None),
+    event_name: Optional[str] = Query(None, min_length=1),
+    correlation_id: Optional[str] = Query(None, min_length=1),
+    causation_id: Optional[str] = Query(None, min_length=1),
+    agent_id: Optional[str] = Query(None, min_length=1),
+    agent_name: Optional[str] = Query(None, min_length=1),
+    include_total: bool = Query(True)
 ) -> EventsResponse:
-    """Get recent events."""
+    """Get recent events.
+    
+    Pass ``after`` with the last seen ``position`` to read newer events in
+    append order without duplicates or gaps.  Pass the ``next_cursor`` of
+    a previous response as ``cursor`` to fetch the following page; unlike
+    ``offset``, cursor pages cost the same at any depth and do not shift
+    when new events arrive.  ``offset`` cannot be combined with ``cursor``.
+    
+    ``event_name``, ``correlation_id`` (workflow id), ``causation_id``
+    (parent agent id), ``agent_id`` and ``agent_name`` are answered from
+    secondary indexes, so their cost follows the number of matches.
+    
+    Payload attributes are filtered with ``attr.<path><op><value>``
+    parameters, e.g. ``attr.success=false`` or ``attr.return_code!=0``;
+    ``op`` is one of ``=``, ``!=``, ``>``, ``>=``, ``<`` and ``<=``.
+    Values are read as JSON scalars, so quote them (``attr.id="42"``)
+    to compare as text.  Paths listed in ``ATTRIBUTE_INDEXES`` are
+    served by an expression index.
+    
+    ``total`` counts every event matching the filters.  It is exact
+    unless attribute predicates are combined with a large window of
+    events; they are then tested on the newest events of the window and
+    ``total_estimated`` is set.
+    """
+    try:
+        attribute_filters = parse_attribute_filters(
+            request.query_params.multi_items()
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    index_filters = {
+        name: value
+        for name, value in (
+            ("event_name", event_name),
+            ("correlation_id", correlation_id),
+            ("causation_id", causation_id),
+            ("agent_id", agent_id),
+            ("agent_name", agent_name),
+        )
+        if value is not None
+    }
+    
+    before = None
+    if cursor:
+        if offset:
+            # A cursor already fixes where the page starts
+            raise HTTPException(
+                status_code=400,
+                detail="offset cannot be combined with cursor"
+            )
+        try:
+            position, timestamp = decode_cursor(cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        if timestamp is None:
+            after = position
+        else:
+            before = (timestamp, position)
+    
     try:
         events_data = await db_manager.get_recent_events(
             limit=limit,
             offset=offset,
             aggregate_type=aggregate_type,
             event_type=event_type,
-            since=since
+            since=since,
+            after=after,
+            before=before,
+            index_filters=index_filters,
+            attribute_filters=attribute_filters
         )
         
         events = [EventItem(**event_data) for event_data in events_data]
         
+        total, total_estimated = None, False
+        if include_total:
+            total, total_estimated = await db_manager.count_events(
+                aggregate_type=aggregate_type,
+                event_type=event_type,
+                since=since,
+                after=after,
+                index_filters=index_filters,
+                attribute_filters=attribute_filters
+            )
+        
+        next_cursor = None
+        if len(events_data) == limit:
+            last = events_data[-1]
+            if after is not None:
+                next_cursor = encode_cursor(last["position"])
+            else:
+                next_cursor = encode_cursor(
+                    last["position"], last["timestamp"]
+                )
+        
         return EventsResponse(
             events=events,
-            total=None,
+            total=total,
+            total_estimated=total_estimated,
             limit=limit,
-            offset=offset
+            offset=offset,
+            next_cursor=next_cursor
         )
         
     except Exception as e:
@@ -216,14 +390,160 @@ async def get_events(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/search", response_model=EventsResponse)
+async def search_events(
+    q: str = Query(..., min_length=1, description="Search terms"),
+    raw: bool = Query(False, description="Treat q as an FTS5 expression"),
+    aggregate_type: Optional[str] = Query(None),
+    workflow_id: Optional[str] = Query(None, min_length=1),
+    since: Optional[str] = Query(None),
+    until: Optional[str] = Query(None),
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = Query(None)
+) -> EventsResponse:
+    """Full-text search over event names and payloads, newest first.
+    
+    Answered from an FTS5 index maintained in the append transaction,
+    so attribute values such as tool inputs, prompts and error output
+    can be searched without listing events.  Events must contain every
+    term of ``q``; a trailing ``*`` matches a prefix.  With ``raw=true``,
+    ``q`` is passed through as an FTS5 expression (phrases, ``OR``,
+    ``NOT``, ``NEAR``).  Pass ``next_cursor`` back as ``cursor`` for the
+    following page.  With partitioning on, only events not yet moved
+    to a partition are searched.
+    """
+    before = None
+    try:
+        if cursor:
+            before, _ = decode_cursor(cursor)
+        query = q if raw else terms_query(q)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    try:
+        events_data = await db_manager.search_events(
+            query,
+            limit=limit,
+            aggregate_type=aggregate_type,
+            workflow_id=workflow_id,
+            since=since,
+            until=until,
+            before=before
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error searching events: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+    
+    next_cursor = None
+    if len(events_data) == limit:
+        next_cursor = encode_cursor(events_data[-1]["position"])
+    
+    return EventsResponse(
+        events=[EventItem(**event_data) for event_data in events_data],
+        total=None,
+        limit=limit,
+        offset=0,
+        next_cursor=next_cursor
+    )
+
+
+@router.get("/export")
+async def export_events(
+    after: int = Query(
+        0, ge=0, description="Export events after this global position"
+    ),
+    to_position: Optional[int] = Query(
+        None, ge=0,
+        description="Last position to export (default: the current end)"
+    ),
+    since: Optional[str] = Query(None, description="Inclusive start time"),
+    until: Optional[str] = Query(None, description="Exclusive end time"),
+    aggregate_type: Optional[str] = Query(None),
+    event_type: Optional[str] = Query(None),
+    gzip: bool = Query(False, description="Gzip-compress the stream")
+) -> StreamingResponse:
+    """Stream the raw event log as NDJSON, in append order.
+    
+    Each line is one stored event with its global position, id, versions
+    and timestamp, so the export can be re-imported losslessly.  Rows
+    are read one page at a time, so memory stays constant however large
+    the log.  The range ends at the position in the
+    ``X-Export-To-Position`` header; a client that stops early resumes
+    by passing the last position it received as ``after`` (and the same
+    ``to_position``).  If reading fails mid-stream, the body ends with
+    an ``{"error": ...}`` line, and a gzip body is left without its
+    trailer.
+    """
+    try:
+        if to_position is None:
+            to_position = await db_manager.get_max_position()
+    except Exception as e:
+        logger.error(f"Error starting export: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+    
+    failed = False
+    
+    async def ndjson_generator():
+        nonlocal failed
+        try:
+            async for page in db_manager.iter_export(
+                after=after,
+                to_position=to_position,
+                since=since,
+                until=until,
+                aggregate_type=aggregate_type,
+                event_type=event_type
+            ):
+                yield b"".join(ndjson_line(record) for record in page)
+        except Exception as e:
+            # Headers are already sent, so report the failure in-band
+            logger.error(f"Error exporting events: {e}")
+            failed = True
+            yield ndjson_line({"error": str(e)})
+    
+    async def gzip_generator():
+        compressor = zlib.compressobj(wbits=31)
+        async for chunk in ndjson_generator():
+            compressed = compressor.compress(chunk)
+            if compressed:
+                yield compressed
+        if failed:
+            # Send the error record but no trailer, so gzip readers also
+            # see the export as truncated
+            yield compressor.flush(zlib.Z_SYNC_FLUSH)
+        else:
+            yield compressor.flush()
+    
+    headers = {"X-Export-To-Position": str(to_position)}
+    if gzip:
+        headers["Content-Disposition"] = (
+            'attachment; filename="events.ndjson.gz"'
+        )
+        return StreamingResponse(
+            gzip_generator(), media_type="application/gzip", headers=headers
+        )
+    return StreamingResponse(
+        ndjson_generator(), media_type="application/x-ndjson", headers=headers
+    )
+
+
 @router.get("/agents/{agent_id}")
 async def get_agent_events(
     agent_id: str,
-    limit: int = Query(100, ge=1, le=1000)
+    limit: int = Query(100, ge=1, le=1000),
+    from_version: Optional[int] = Query(None, ge=1),
+    to_version: Optional[int] = Query(None, ge=1)
 ):
-    """Get events for a specific agent."""
+    """Get events for a specific agent, in version order."""
     try:
-        events = await db_manager.get_agent_events(agent_id, limit)
+        events = await db_manager.get_agent_events(
+            agent_id,
+            limit,
+            from_version=from_version,
+            to_version=to_version
+        )
         return {"events": events}
     except Exception as e:
         logger.error(f"Error retrieving agent events: {e}")
@@ -233,11 +553,18 @@ async def get_agent_events(
 @router.get("/workflows/{workflow_id}")
 async def get_workflow_events(
     workflow_id: str,
-    limit: int = Query(100, ge=1, le=1000)
+    limit: int = Query(100, ge=1, le=1000),
+    from_version: Optional[int] = Query(None, ge=1),
+    to_version: Optional[int] = Query(None, ge=1)
 ):
-    """Get events for a specific workflow."""
+    """Get events for a specific workflow, in version order."""
     try:
-        events = await db_manager.get_workflow_events(workflow_id, limit)
+        events = await db_manager.get_workflow_events(
+            workflow_id,
+            limit,
+            from_version=from_version,
+            to_version=to_version
+        )
         return {"events": events}
     except Exception as e:
         logger.error(f"Error retrieving workflow events: {e}")
@@ -255,40 +582,122 @@ async def get_workflow_agents(workflow_id: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/{event_id}/ancestry", response_model=AncestryResponse)
+async def get_event_ancestry(
+    event_id: str,
+    max_depth: int = Query(100, ge=1, le=1000)
+) -> AncestryResponse:
+    """Get an event and the chain of agents that caused it."""
+    try:
+        ancestry = await db_manager.get_ancestry(event_id, max_depth)
+    except Exception as e:
+        logger.error(f"Error retrieving event ancestry: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+    
+    if ancestry is None:
+        raise HTTPException(status_code=404, detail="Event not found")
+    return AncestryResponse(
+        event=EventItem(**ancestry["event"]),
+        ancestors=[CausationNode(**node) for node in ancestry["ancestors"]]
+    )
+
+
+def _matches_stream_filters(
+    event: Dict[str, Any],
+    event_type: Optional[str],
+    aggregate_type: Optional[str]
+) -> bool:
+    if event_type and event.get("event_type") != event_type:
+        return False
+    if aggregate_type and event.get("aggregate_type") != aggregate_type:
+        return False
+    return True
+
+
+def _stream_message(event: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "event": "event",
+        "id": str(event["position"]),
+        "data": json.dumps(event, default=str)
+    }
+
+
 @router.get("/stream")
 async def stream_events(
     event_type: Optional[str] = Query(None),
-    aggregate_type: Optional[str] = Query(None)
+    aggregate_type: Optional[str] = Query(None),
+    from_position: Optional[int] = Query(
+        None, alias="from", ge=0,
+        description="Replay events after this global position first"
+    ),
+    last_event_id: Optional[str] = Header(None, alias="Last-Event-ID")
 ):
-    """Stream events using Server-Sent Events."""
+    """Stream events using Server-Sent Events.
+    
+    Events are pushed from the in-process broadcaster as they are
+    appended, so open streams never poll the database.  Each message
+    carries the event's global position as its SSE id.  A reconnecting
+    client that sends ``Last-Event-ID`` (or passes ``from``) first
+    receives everything it missed from the store, then continues live
+    without gaps or duplicates.
+    """
+    resume_from = from_position
+    if last_event_id:
+        try:
+            resume_from = int(last_event_id)
+        except ValueError:
+            raise HTTPException(
+                status_code=400, detail="Invalid Last-Event-ID"
+            )
     
     async def event_generator():
-        last_check = datetime.utcnow().isoformat()
+        # Subscribe before replaying so nothing appended during the
+        # replay is missed; live events already replayed are skipped
+        subscription = event_broadcaster.subscribe()
+        last_position = resume_from
         
-        while True:
-            try:
-                events = await db_manager.get_recent_events(
-                    limit=50,
-                    since=last_check,
-                    event_type=event_type,
-                    aggregate_type=aggregate_type
-                )
+        try:
+            if resume_from is not None:
+                try:
+                    async for page in db_manager.iter_events_after(
+                        resume_from,
+                        aggregate_type=aggregate_type,
+                        event_type=event_type
+                    ):
+                        for event in page:
+                            yield _stream_message(event)
+                        last_position = page[-1]["position"]
+                except Exception as e:
+                    logger.error(f"Error replaying events: {e}")
+                    yield {
+                        "event": "error",
+                        "data": json.dumps({"error": "Replay failed"})
+                    }
+                    return
+            
+            while True:
+                event = await subscription.get()
                 
-                for event in events:
+                if event is None:
+                    logger.warning("Event stream subscriber fell behind")
                     yield {
-                        "event": "event",
-                        "data": event
+                        "event": "error",
+                        "data": json.dumps({"error": "Subscriber lagged"})
                     }
+                    break
                 
-                last_check = datetime.utcnow().isoformat()
-                await asyncio.sleep(1)
+                if (
+                    last_position is not None
+                    and event["position"] <= last_position
+                ):
+                    continue
+                if not _matches_stream_filters(
+                    event, event_type, aggregate_type
+                ):
+                    continue
                 
-            except Exception as e:
-                logger.error(f"Error in event stream: {e}")
-                yield {
-                    "event": "error",
-                    "data": {"error": str(e)}
-                }
-                await asyncio.sleep(5)
+                yield _stream_message(event)
+        finally:
+            event_broadcaster.unsubscribe(subscription)
     
-    return EventSourceResponse(event_generator())
\ No newline at end of file
+    return EventSourceResponse(event_generator())
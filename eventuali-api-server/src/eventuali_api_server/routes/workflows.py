@@ -0,0 +1,132 @@
+"""Workflow summary routes for the API server."""
+
+import logging
+from typing import Literal, Optional
+
+from fastapi import APIRouter, HTTPException, Query
+
+from ..dependencies.database import db_manager
+from ..dependencies.reader import decode_cursor, encode_cursor
+from ..models.events import (
+    AgentTreeNode,
+    WorkflowSummaryItem,
+    WorkflowsResponse,
+    WorkflowTimelineResponse,
+    WorkflowTreeResponse,
+)
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/workflows", tags=["workflows"])
+
+WorkflowStatus = Literal["started", "running", "completed", "failed"]
+
+
+@router.get("/", response_model=WorkflowsResponse)
+async def get_workflows(
+    status: Optional[WorkflowStatus] = Query(None),
+    since: Optional[str] = Query(
+        None, description="Only workflows started at or after this time"
+    ),
+    until: Optional[str] = Query(
+        None, description="Only workflows started before this time"
+    ),
+    min_duration_ms: Optional[int] = Query(None, ge=0),
+    slowest: int = Query(3, ge=0, le=20),
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = Query(None)
+) -> WorkflowsResponse:
+    """List workflow summaries, most recently started first.
+    
+    Summaries are maintained as events are appended, so listing costs
+    the same however many events each workflow has.  Pass the
+    ``next_cursor`` of a previous response as ``cursor`` to fetch the
+    following page.
+    """
+    before = None
+    if cursor:
+        try:
+            position, started_at = decode_cursor(cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        if started_at is None:
+            raise HTTPException(
+                status_code=400, detail=f"Invalid cursor: {cursor}"
+            )
+        before = (started_at, position)
+    
+    try:
+        workflows = await db_manager.get_workflow_summaries(
+            status=status,
+            since=since,
+            until=until,
+            min_duration_ms=min_duration_ms,
+            before=before,
+            limit=limit,
+            slowest=slowest
+        )
+    except Exception as e:
+        logger.error(f"Error retrieving workflows: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+    
+    next_cursor = None
+    if len(workflows) == limit:
+        last = workflows[-1]
+        next_cursor = encode_cursor(last["start_position"], last["started_at"])
+    
+    return WorkflowsResponse(
+        workflows=[WorkflowSummaryItem(**workflow) for workflow in workflows],
+        limit=limit,
+        next_cursor=next_cursor
+    )
+
+
+@router.get("/{workflow_id}", response_model=WorkflowSummaryItem)
+async def get_workflow(
+    workflow_id: str,
+    slowest: int = Query(3, ge=0, le=20)
+) -> WorkflowSummaryItem:
+    """Get the summary of one workflow."""
+    try:
+        workflow = await db_manager.get_workflow_summary(workflow_id, slowest)
+    except Exception as e:
+        logger.error(f"Error retrieving workflow: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+    
+    if workflow is None:
+        raise HTTPException(status_code=404, detail="Workflow not found")
+    return WorkflowSummaryItem(**workflow)
+
+
+@router.get("/{workflow_id}/tree", response_model=WorkflowTreeResponse)
+async def get_workflow_tree(workflow_id: str) -> WorkflowTreeResponse:
+    """Get a workflow's agents nested by causation."""
+    try:
+        roots = await db_manager.get_workflow_tree(workflow_id)
+    except Exception as e:
+        logger.error(f"Error retrieving workflow tree: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+    
+    return WorkflowTreeResponse(
+        workflow_id=workflow_id,
+        roots=[AgentTreeNode(**root) for root in roots]
+    )
+
+
+@router.get("/{workflow_id}/timeline", response_model=WorkflowTimelineResponse)
+async def get_workflow_timeline(workflow_id: str) -> WorkflowTimelineResponse:
+    """Get where a workflow's time went.
+    
+    Returns the critical path (the chain of agents that set the
+    end-to-end latency), each agent's self time versus time spent in
+    the agents it caused, and the gaps when no agent was active.
+    """
+    try:
+        timeline = await db_manager.get_workflow_timeline(workflow_id)
+    except Exception as e:
+        logger.error(f"Error building workflow timeline: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+    
+    if timeline is None:
+        raise HTTPException(status_code=404, detail="Workflow not found")
+    return WorkflowTimelineResponse(**timeline)
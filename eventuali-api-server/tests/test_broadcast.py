@@ -0,0 +1,47 @@
+"""Tests for the stream broadcaster."""
+
+import pytest
+
+from eventuali_api_server.config import APIServerConfig, set_config
+from eventuali_api_server.dependencies.broadcast import EventBroadcaster
+
+
+@pytest.fixture
+def broadcaster():
+    """Create a broadcaster with small subscriber queues."""
+    set_config(APIServerConfig(stream_queue_size=2))
+    return EventBroadcaster()
+
+
+async def test_publish_fans_out_to_all_subscribers(broadcaster):
+    """Every subscriber receives each published event."""
+    first = broadcaster.subscribe()
+    second = broadcaster.subscribe()
+
+    broadcaster.publish([{"event_id": "e-1"}])
+
+    assert (await first.get())["event_id"] == "e-1"
+    assert (await second.get())["event_id"] == "e-1"
+
+
+async def test_unsubscribe_stops_delivery(broadcaster):
+    """Unsubscribed clients are no longer tracked."""
+    subscription = broadcaster.subscribe()
+    broadcaster.unsubscribe(subscription)
+
+    broadcaster.publish([{"event_id": "e-1"}])
+
+    assert broadcaster.subscriber_count == 0
+    assert subscription.queue.empty()
+
+
+async def test_lagging_subscriber_is_disconnected(broadcaster):
+    """A full queue ends the subscription with a None marker."""
+    slow = broadcaster.subscribe()
+
+    broadcaster.publish([{"event_id": f"e-{i}"} for i in range(3)])
+
+    assert broadcaster.subscriber_count == 0
+    assert (await slow.get())["event_id"] == "e-0"
+    assert (await slow.get())["event_id"] == "e-1"
+    assert await slow.get() is None
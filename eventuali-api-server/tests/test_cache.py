@@ -0,0 +1,95 @@
+"""Tests for the in-memory recent event buffer and derived-result cache."""
+
+from eventuali_api_server.dependencies.cache import (
+    PositionedCache,
+    RecentEventBuffer,
+)
+
+
+def make_event(position, second, aggregate_type="agent_aggregate"):
+    """Build a serialized event dict."""
+    return {
+        "event_id": f"e-{position}",
+        "position": position,
+        "aggregate_type": aggregate_type,
+        "event_type": "AgentEvent",
+        "timestamp": f"2025-01-01T00:00:{second:02d}+00:00",
+    }
+
+
+def newest_first(events):
+    """Order events the way GET /events lists them."""
+    return sorted(
+        events, key=lambda e: (e["timestamp"], e["position"]), reverse=True
+    )
+
+
+def test_complete_buffer_answers_everything():
+    """A store smaller than the buffer is answered fully from memory."""
+    events = [make_event(i, i) for i in range(1, 6)]
+    buffer = RecentEventBuffer(capacity=10)
+    buffer.seed(newest_first(events), max_position=5)
+
+    page = buffer.query(limit=100)
+
+    assert [e["position"] for e in page] == [5, 4, 3, 2, 1]
+    assert buffer.query(limit=2, offset=4) == [events[0]]
+
+
+def test_pages_beyond_the_window_fall_back():
+    """Queries reaching past the buffered window return None."""
+    events = [make_event(i, i) for i in range(1, 11)]
+    buffer = RecentEventBuffer(capacity=4)
+    buffer.seed(newest_first(events)[:4], max_position=10)
+
+    assert [e["position"] for e in buffer.query(limit=3)] == [10, 9, 8]
+    assert buffer.query(limit=3, offset=2) is None
+    assert buffer.query(limit=2, aggregate_type="workflow_aggregate") is None
+
+
+def test_add_keeps_newest_and_tracks_after_coverage():
+    """Appends evict the oldest and position reads stay exact."""
+    events = [make_event(i, i) for i in range(1, 5)]
+    buffer = RecentEventBuffer(capacity=4)
+    buffer.seed(newest_first(events), max_position=4)
+
+    buffer.add([make_event(5, 30), make_event(6, 31)])
+
+    assert [e["position"] for e in buffer.query(limit=4)] == [6, 5, 4, 3]
+    assert [e["position"] for e in buffer.query(limit=10, after=4)] == [5, 6]
+    assert buffer.query(limit=10, after=1) is None
+
+
+def test_late_timestamp_is_not_served_from_memory():
+    """An append older than the window does not hide behind the buffer."""
+    events = [make_event(i, 10 + i) for i in range(1, 5)]
+    buffer = RecentEventBuffer(capacity=4)
+    buffer.seed(newest_first(events), max_position=4)
+
+    buffer.add([make_event(5, 0)])
+
+    assert [e["position"] for e in buffer.query(limit=4)] == [4, 3, 2, 1]
+    assert buffer.query(limit=10, after=4) is None
+
+
+def test_disabled_buffer_never_answers():
+    """A zero-capacity buffer always defers to the store."""
+    buffer = RecentEventBuffer(capacity=0)
+    buffer.seed([], max_position=0)
+
+    assert buffer.query(limit=10) is None
+
+
+def test_positioned_cache_invalidates_on_new_position():
+    """An entry is only served for the position it was computed at."""
+    cache = PositionedCache(max_size=2)
+    cache.put("workflow-1", 10, "timeline")
+
+    assert cache.get("workflow-1", 10) == "timeline"
+    assert cache.get("workflow-1", 11) is None
+    assert cache.get("workflow-1", 10) is None
+
+    for i in range(3):
+        cache.put(f"workflow-{i}", i, i)
+    assert len(cache) == 2
+    assert cache.get("workflow-0", 0) is None
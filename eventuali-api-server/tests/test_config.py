@@ -100,4 +100,19 @@ def test_empty_cors_origins_env(monkeypatch):
         "http://127.0.0.1:3000",
     ]
     
-    assert config.cors_origins == expected_origins
\ No newline at end of file
+    assert config.cors_origins == expected_origins
+
+
+def test_partition_settings(monkeypatch):
+    """Test partitioning is off by default and validated when set."""
+    assert APIServerConfig().partition_period is None
+    
+    monkeypatch.setenv("PARTITION_PERIOD", "Week")
+    monkeypatch.setenv("PARTITION_HOT_PERIODS", "3")
+    config = APIServerConfig.from_env()
+    
+    assert config.partition_period == "week"
+    assert config.partition_hot_periods == 3
+    
+    with pytest.raises(ValueError):
+        APIServerConfig(partition_period="month")
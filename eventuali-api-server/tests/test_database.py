@@ -0,0 +1,955 @@
+"""Tests for the SQLite read path."""
+
+import io
+import json
+import sqlite3
+from datetime import date
+from uuid import uuid4
+
+import pytest
+
+from eventuali_api_server.dependencies import reader as reader_module
+from eventuali_api_server.dependencies.export import iter_export, ndjson_line
+from eventuali_api_server.dependencies.filters import parse_attribute_filters
+from eventuali_api_server.dependencies.importer import (
+    insert_events,
+    read_ndjson,
+    resume_maintenance,
+    suspend_maintenance,
+)
+from eventuali_api_server.dependencies.partitions import (
+    Partition,
+    list_partitions,
+)
+from eventuali_api_server.dependencies.reader import (
+    EventReader,
+    decode_cursor,
+    encode_cursor,
+    terms_query,
+)
+
+
+EVENTS_SCHEMA = """
+CREATE TABLE events (
+    id TEXT PRIMARY KEY,
+    aggregate_id TEXT NOT NULL,
+    aggregate_type TEXT NOT NULL,
+    event_type TEXT NOT NULL,
+    event_version INTEGER NOT NULL,
+    aggregate_version INTEGER NOT NULL,
+    event_data TEXT NOT NULL,
+    event_data_type TEXT NOT NULL DEFAULT 'json',
+    metadata TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    UNIQUE(aggregate_id, aggregate_version)
+)
+"""
+
+
+def insert_event(
+    db_path,
+    aggregate_id,
+    aggregate_type,
+    event_type,
+    version,
+    timestamp,
+    **data
+):
+    """Insert a row the way the eventuali SQLite backend stores it."""
+    conn = sqlite3.connect(db_path)
+    with conn:
+        conn.execute(
+            "INSERT INTO events VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                str(uuid4()),
+                aggregate_id,
+                aggregate_type,
+                event_type,
+                1,
+                version,
+                json.dumps(data),
+                "json",
+                json.dumps({"causation_id": None, "correlation_id": None}),
+                timestamp,
+            )
+        )
+    conn.close()
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    """Create an empty events database."""
+    path = tmp_path / "events.db"
+    conn = sqlite3.connect(path)
+    conn.execute(EVENTS_SCHEMA)
+    conn.close()
+    return path
+
+
+@pytest.fixture
+async def reader(db_path):
+    """Create a reader with its indexes in place."""
+    reader = EventReader(db_path)
+    await reader.ensure_schema()
+    yield reader
+    reader.close()
+
+
+@pytest.fixture
+def populated(db_path):
+    """Insert a small mixed log of agent and workflow events."""
+    for i in range(5):
+        insert_event(
+            db_path,
+            "agent-1",
+            "agent_aggregate",
+            "AgentEvent",
+            i + 1,
+            f"2025-01-01T00:00:0{i}+00:00",
+            event_name="agent.tool_used",
+            agent_id="agent-1",
+            workflow_id="workflow-1",
+            attributes={"step": i},
+        )
+    for i in range(3):
+        insert_event(
+            db_path,
+            "workflow-1",
+            "workflow_aggregate",
+            "WorkflowEvent",
+            i + 1,
+            f"2025-01-01T00:00:0{i}.5+00:00",
+            event_name="workflow.progress",
+            workflow_id="workflow-1",
+        )
+    return db_path
+
+
+async def test_fetch_events_orders_most_recent_first(reader, populated):
+    """Events come back newest first with their attributes decoded."""
+    events = await reader.fetch_events(limit=3)
+
+    timestamps = [event["timestamp"] for event in events]
+    assert timestamps == sorted(timestamps, reverse=True)
+    assert events[0]["attributes"] == {"step": 4}
+    assert events[0]["correlation_id"] == "workflow-1"
+
+
+async def test_fetch_events_pagination(reader, populated):
+    """Limit and offset slice the ordered result."""
+    first = await reader.fetch_events(limit=4, offset=0)
+    second = await reader.fetch_events(limit=4, offset=4)
+
+    assert len(first) == 4
+    assert len(second) == 4
+    ids = {event["event_id"] for event in first + second}
+    assert len(ids) == 8
+
+
+async def test_fetch_events_filters(reader, populated):
+    """Aggregate type, event type and since filters apply in SQL."""
+    workflow = await reader.fetch_events(aggregate_type="workflow_aggregate")
+    assert len(workflow) == 3
+    assert all(e["aggregate_type"] == "workflow_aggregate" for e in workflow)
+
+    agent = await reader.fetch_events(event_type="AgentEvent")
+    assert len(agent) == 5
+
+    recent = await reader.fetch_events(since="2025-01-01T00:00:03Z")
+    assert [e["timestamp"] for e in recent] == ["2025-01-01T00:00:04+00:00"]
+
+
+async def test_ensure_schema_creates_indexes(reader, db_path):
+    """The composite read indexes exist after ensure_schema."""
+    conn = sqlite3.connect(db_path)
+    names = {
+        row[0]
+        for row in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index'"
+        )
+    }
+    conn.close()
+
+    assert "idx_event_positions_timestamp" in names
+    assert "idx_event_positions_type_timestamp" in names
+    assert "idx_event_positions_event_type_timestamp" in names
+
+
+def query_plans(reader, **filters):
+    """Run a listing and return the query plan of each statement it ran."""
+    conn = reader._connection()
+    statements = []
+    conn.set_trace_callback(statements.append)
+    try:
+        reader._fetch_events(
+            filters.pop("limit", 10),
+            filters.pop("offset", 0),
+            filters.pop("aggregate_type", None),
+            filters.pop("event_type", None),
+            filters.pop("since", None),
+            filters.pop("after", None),
+            filters.pop("before", None),
+            filters.pop("index_filters", None),
+            filters.pop("attribute_filters", None),
+        )
+    finally:
+        conn.set_trace_callback(None)
+    return [
+        " | ".join(
+            row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}")
+        )
+        for sql in statements
+    ]
+
+
+async def test_listings_read_in_index_order(reader, populated):
+    """Newest-first and position listings are index walks, not sorts."""
+    for filters in (
+        {},
+        {"since": "2025-01-01T00:00:02Z"},
+        {"before": ("2025-01-01T00:00:03+00:00", 4)},
+        {"after": 3},
+        {"aggregate_type": "agent_aggregate"},
+        {"event_type": "AgentEvent", "since": "2025-01-01T00:00:02Z"},
+    ):
+        plans = query_plans(reader, **filters)
+        assert plans, filters
+        for step in " | ".join(plans).split(" | "):
+            assert "TEMP B-TREE" not in step, (filters, plans)
+            # Full table scans have no index to name
+            assert not step.startswith("SCAN") or "USING" in step, (
+                filters, plans
+            )
+
+
+async def test_cursor_pages_seek_by_index(reader, populated):
+    """A cursor page starts with an index seek at the cursor's key."""
+    first = await reader.fetch_events(limit=3)
+    last = first[-1]
+    _, timestamp = decode_cursor(
+        encode_cursor(last["position"], last["timestamp"])
+    )
+    for filters in (
+        {},
+        {"aggregate_type": "agent_aggregate"},
+        {"index_filters": {"correlation_id": "workflow-1"}},
+    ):
+        plans = query_plans(
+            reader, before=(timestamp, last["position"]), **filters
+        )
+        seeks = [
+            plan for plan in plans
+            if plan.startswith("SEARCH") and "timestamp" in plan
+        ]
+        assert seeks, (filters, plans)
+        assert not any("TEMP B-TREE" in plan for plan in plans), filters
+
+
+async def test_positions_are_stable(reader, populated):
+    """Deleting the newest event or vacuuming never moves a position."""
+    positions = {
+        event["event_id"]: event["position"]
+        for event in await reader.fetch_events()
+    }
+    newest = max(positions, key=positions.get)
+    conn = sqlite3.connect(populated)
+    with conn:
+        conn.execute("DELETE FROM events WHERE id = ?", (newest,))
+        conn.execute("DELETE FROM event_positions WHERE id = ?", (newest,))
+    conn.execute("VACUUM")
+    conn.close()
+    insert_event(
+        populated,
+        "agent-2",
+        "agent_aggregate",
+        "AgentEvent",
+        1,
+        "2025-01-01T00:00:09+00:00",
+    )
+
+    events = await reader.fetch_events()
+    del positions[newest]
+    assert {
+        event["event_id"]: event["position"]
+        for event in events if event["event_id"] in positions
+    } == positions
+    assert events[0]["aggregate_id"] == "agent-2"
+    assert events[0]["position"] == 9
+    assert await reader.max_position() == 9
+
+
+async def test_fetch_events_after_position(reader, populated):
+    """Position reads return later events in append order."""
+    newest = await reader.fetch_events(limit=8)
+    positions = sorted(event["position"] for event in newest)
+    assert positions == list(range(1, 9))
+
+    page = await reader.fetch_events(limit=3, after=2)
+    assert [event["position"] for event in page] == [3, 4, 5]
+
+    tail = await reader.fetch_events(after=8)
+    assert tail == []
+
+
+async def test_fetch_events_keyset_pages(reader, populated):
+    """Keyset bounds walk the newest-first listing without overlap."""
+    seen = []
+    before = None
+    while True:
+        page = await reader.fetch_events(limit=3, before=before)
+        if not page:
+            break
+        seen.extend(page)
+        last = page[-1]
+        before = (last["timestamp"], last["position"])
+
+    offset_listing = await reader.fetch_events(limit=100)
+    assert [e["event_id"] for e in seen] == [
+        e["event_id"] for e in offset_listing
+    ]
+
+
+def test_cursor_round_trip():
+    """Cursors are opaque strings that decode to what was encoded."""
+    cursor = encode_cursor(42, "2025-01-01T00:00:00+00:00")
+    assert decode_cursor(cursor) == (42, "2025-01-01T00:00:00+00:00")
+    assert decode_cursor(encode_cursor(7)) == (7, None)
+
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor")
+
+
+async def test_fetch_aggregate_events_reads_one_stream(reader, populated):
+    """Aggregate reads return only that stream, bounded by version."""
+    events = await reader.fetch_aggregate_events(
+        "agent-1", aggregate_type="agent_aggregate"
+    )
+    assert [e["aggregate_version"] for e in events] == [1, 2, 3, 4, 5]
+    assert all(e["aggregate_id"] == "agent-1" for e in events)
+
+    window = await reader.fetch_aggregate_events(
+        "agent-1", from_version=2, to_version=3
+    )
+    assert [e["aggregate_version"] for e in window] == [2, 3]
+
+    wrong_type = await reader.fetch_aggregate_events(
+        "agent-1", aggregate_type="workflow_aggregate"
+    )
+    assert wrong_type == []
+
+
+async def test_index_filters_use_event_index(reader, populated):
+    """Secondary index filters match the event dict fields."""
+    tools = await reader.fetch_events(
+        index_filters={"event_name": "agent.tool_used"}
+    )
+    assert len(tools) == 5
+
+    workflow = await reader.fetch_events(
+        index_filters={"correlation_id": "workflow-1"}
+    )
+    assert [e["position"] for e in workflow] == [
+        e["position"] for e in await reader.fetch_events()
+    ]
+
+    both = await reader.fetch_events(
+        index_filters={
+            "correlation_id": "workflow-1",
+            "event_name": "workflow.progress",
+        }
+    )
+    assert [e["aggregate_type"] for e in both] == ["workflow_aggregate"] * 3
+
+    page = await reader.fetch_events(
+        limit=2,
+        after=3,
+        index_filters={"agent_id": "agent-1"}
+    )
+    assert [e["position"] for e in page] == [4, 5]
+
+
+async def test_event_index_backfills_existing_events(db_path):
+    """Events written before the read model existed are indexed."""
+    insert_event(
+        db_path,
+        "agent-2",
+        "agent_aggregate",
+        "AgentEvent",
+        1,
+        "2025-01-01T00:00:00+00:00",
+        event_name="agent.started",
+        agent_id="agent-2",
+        parent_agent_id="agent-1",
+    )
+    reader = EventReader(db_path)
+    await reader.ensure_schema()
+
+    children = await reader.fetch_events(
+        index_filters={"causation_id": "agent-1"}
+    )
+    reader.close()
+
+    assert [e["aggregate_id"] for e in children] == ["agent-2"]
+
+
+async def test_workflow_agents_projection(reader, populated):
+    """One row per workflow agent, kept current on append."""
+    agents = await reader.fetch_workflow_agents("workflow-1")
+    assert len(agents) == 1
+    assert agents[0]["agent_id"] == "agent-1"
+    assert agents[0]["event_count"] == 5
+    assert agents[0]["status"] == "running"
+    assert agents[0]["first_event_time"] == "2025-01-01T00:00:00+00:00"
+    assert agents[0]["last_event_time"] == "2025-01-01T00:00:04+00:00"
+
+    insert_event(
+        populated,
+        "agent-1",
+        "agent_aggregate",
+        "AgentEvent",
+        6,
+        "2025-01-01T00:00:09+00:00",
+        event_name="agent.worker.completed",
+        agent_id="agent-1",
+        workflow_id="workflow-1",
+    )
+    agents = await reader.fetch_workflow_agents("workflow-1")
+    assert agents[0]["status"] == "completed"
+    assert agents[0]["agent_name"] == "worker"
+    assert agents[0]["event_count"] == 6
+
+    assert await reader.fetch_workflow_agents("workflow-2") == []
+
+
+async def test_agent_status_projection(reader, populated):
+    """Current status per agent, with the event that last changed it."""
+    agents = await reader.fetch_agent_statuses()
+    assert [agent["agent_id"] for agent in agents] == ["agent-1"]
+    assert agents[0]["status"] == "running"
+    assert agents[0]["previous_status"] is None
+    assert agents[0]["status_position"] == 1
+    assert agents[0]["last_position"] == 5
+
+    insert_event(
+        populated,
+        "agent-1",
+        "agent_aggregate",
+        "AgentEvent",
+        6,
+        "2025-01-01T00:00:09+00:00",
+        event_name="agent.worker.failed",
+        agent_id="agent-1",
+        workflow_id="workflow-1",
+    )
+    agents = await reader.fetch_agent_statuses(status="failed")
+    assert agents[0]["previous_status"] == "running"
+    assert agents[0]["status_position"] == 9
+    assert agents[0]["last_event_name"] == "agent.worker.failed"
+    assert await reader.fetch_agent_statuses(status="running") == []
+    assert await reader.fetch_agent_statuses(workflow_id="workflow-2") == []
+
+    transitions = await reader.fetch_status_transitions(["agent-1"], [5, 9])
+    assert [row["status"] for row in transitions] == ["failed"]
+
+
+async def test_workflow_summary_projection(reader, populated):
+    """Workflow start/end, duration and agent outcome, kept current."""
+    insert_event(
+        populated,
+        "agent-2",
+        "agent_aggregate",
+        "AgentEvent",
+        1,
+        "2025-01-01T00:00:01+00:00",
+        event_name="agent.reviewer.failed",
+        agent_id="agent-2",
+        workflow_id="workflow-1",
+    )
+    insert_event(
+        populated,
+        "workflow-1",
+        "workflow_aggregate",
+        "WorkflowEvent",
+        4,
+        "2025-01-01T00:00:06+00:00",
+        event_name="workflow.completed",
+        workflow_id="workflow-1",
+    )
+
+    workflow = await reader.fetch_workflow_summary("workflow-1", slowest=1)
+    assert workflow["status"] == "completed"
+    assert workflow["started_at"] == "2025-01-01T00:00:00+00:00"
+    assert workflow["ended_at"] == "2025-01-01T00:00:06+00:00"
+    assert workflow["duration_ms"] == 6000
+    assert workflow["event_count"] == 10
+    assert workflow["agent_count"] == 2
+    assert workflow["agents_failed"] == 1
+    assert workflow["slowest_agents"] == [{
+        "agent_id": "agent-1",
+        "agent_name": None,
+        "status": "running",
+        "duration_ms": 4000,
+    }]
+    assert await reader.fetch_workflow_summary("workflow-2") is None
+
+
+async def test_workflow_summaries_pagination(reader, db_path):
+    """Most recently started first, continued by a keyset bound."""
+    for i in range(3):
+        insert_event(
+            db_path,
+            f"workflow-{i}",
+            "workflow_aggregate",
+            "WorkflowEvent",
+            1,
+            f"2025-01-01T00:00:0{i}+00:00",
+            event_name="workflow.started",
+            workflow_id=f"workflow-{i}",
+        )
+
+    page = await reader.fetch_workflow_summaries(limit=2)
+    assert [w["workflow_id"] for w in page] == ["workflow-2", "workflow-1"]
+    assert page[0]["status"] == "started"
+    assert page[0]["duration_ms"] is None
+
+    last = page[-1]
+    page = await reader.fetch_workflow_summaries(
+        limit=2, before=(last["started_at"], last["start_position"])
+    )
+    assert [w["workflow_id"] for w in page] == ["workflow-0"]
+    assert await reader.fetch_workflow_summaries(status="completed") == []
+
+
+async def test_causation_graph_queries(reader, db_path):
+    """Descendants, ancestry and workflow trees follow causation edges."""
+    for agent_id, parent_id, second in (
+        ("root", None, 0),
+        ("child-a", "root", 1),
+        ("child-b", "root", 2),
+        ("grandchild", "child-a", 3),
+    ):
+        insert_event(
+            db_path,
+            agent_id,
+            "agent_aggregate",
+            "AgentEvent",
+            1,
+            f"2025-01-01T00:00:0{second}+00:00",
+            event_name="agent.started",
+            agent_id=agent_id,
+            parent_agent_id=parent_id,
+            workflow_id="workflow-1",
+        )
+
+    descendants = await reader.fetch_descendants("root")
+    assert [(node["agent_id"], node["depth"]) for node in descendants] == [
+        ("child-a", 1), ("child-b", 1), ("grandchild", 2)
+    ]
+    assert descendants[2]["parent_agent_id"] == "child-a"
+    assert await reader.fetch_descendants("child-b") == []
+
+    event = (await reader.fetch_events(limit=1))[0]
+    ancestry = await reader.fetch_ancestry(event["event_id"])
+    assert ancestry["event"]["agent_id"] == "grandchild"
+    assert [node["agent_id"] for node in ancestry["ancestors"]] == [
+        "grandchild", "child-a", "root"
+    ]
+    assert await reader.fetch_ancestry("missing") is None
+
+    roots = await reader.fetch_workflow_tree("workflow-1")
+    assert [root["agent_id"] for root in roots] == ["root"]
+    children = roots[0]["children"]
+    assert [child["agent_id"] for child in children] == ["child-a", "child-b"]
+    assert children[0]["children"][0]["agent_id"] == "grandchild"
+
+
+async def test_search_events_full_text(reader, populated):
+    """Payload text is searchable, newest first, with filters."""
+    insert_event(
+        populated,
+        "agent-2",
+        "agent_aggregate",
+        "AgentEvent",
+        1,
+        "2025-01-01T00:00:09+00:00",
+        event_name="agent.tool_used",
+        agent_id="agent-2",
+        workflow_id="workflow-2",
+        attributes={"command": "pytest -q", "stdout": "3 failed, 12 passed"},
+    )
+
+    events = await reader.search_events("failed")
+    assert [event["aggregate_id"] for event in events] == ["agent-2"]
+    assert await reader.search_events('"pytest -q"', workflow_id="workflow-2")
+    assert await reader.search_events("pytest", workflow_id="workflow-1") == []
+
+    query = terms_query("agent.tool_used")
+    events = await reader.search_events(query, limit=2)
+    assert [event["position"] for event in events] == [9, 5]
+    events = await reader.search_events(query, before=5)
+    assert [event["position"] for event in events] == [4, 3, 2, 1]
+    assert await reader.search_events(
+        terms_query("workflow.prog*"), aggregate_type="agent_aggregate"
+    ) == []
+    assert len(await reader.search_events(terms_query("workflow.prog*"))) == 3
+
+    with pytest.raises(ValueError):
+        await reader.search_events('"unbalanced')
+
+
+async def test_attribute_filters_use_declared_index(db_path):
+    """attr. predicates compare payload values through an expression index."""
+    for i, (success, code) in enumerate(
+        [(True, 0), (False, 1), (False, 2), (True, 0)]
+    ):
+        insert_event(
+            db_path,
+            f"agent-{i}",
+            "agent_aggregate",
+            "AgentEvent",
+            1,
+            f"2025-01-01T00:00:0{i}+00:00",
+            attributes={"success": success, "return_code": code},
+        )
+    reader = EventReader(db_path, attribute_indexes=["success"])
+    await reader.ensure_schema()
+
+    failed = parse_attribute_filters([("attr.success", "false")])
+    events = await reader.fetch_events(attribute_filters=failed)
+    assert [event["aggregate_id"] for event in events] == [
+        "agent-2", "agent-1"
+    ]
+
+    nonzero = parse_attribute_filters(
+        [("attr.return_code!", "0"), ("attr.return_code>1", "")]
+    )
+    events = await reader.fetch_events(attribute_filters=nonzero)
+    assert [event["aggregate_id"] for event in events] == ["agent-2"]
+
+    conn = sqlite3.connect(db_path)
+    clause, params = failed[0].to_sql()
+    plan = conn.execute(
+        f"EXPLAIN QUERY PLAN SELECT rowid FROM events WHERE {clause} "
+        "ORDER BY timestamp DESC",
+        params,
+    ).fetchall()
+    assert any("idx_events_attr_success" in row[-1] for row in plan)
+    conn.close()
+    reader.close()
+
+    reader = EventReader(db_path)
+    await reader.ensure_schema()
+    conn = sqlite3.connect(db_path)
+    names = {row[0] for row in conn.execute("SELECT name FROM sqlite_master")}
+    assert "idx_events_attr_success" not in names
+    conn.close()
+    reader.close()
+
+
+def test_parse_attribute_filters_rejects_bad_paths():
+    """Paths are embedded in SQL, so only identifiers are accepted."""
+    with pytest.raises(ValueError):
+        parse_attribute_filters([("attr.a'); DROP TABLE events; --", "1")])
+    with pytest.raises(ValueError):
+        parse_attribute_filters([("attr.a>", "null")])
+    assert parse_attribute_filters([("limit", "5")]) == []
+
+
+async def test_count_events_from_counters(reader, populated):
+    """Common filters are counted exactly from maintained counters."""
+    assert await reader.count_events() == (8, False)
+    assert await reader.count_events(aggregate_type="agent_aggregate") == (
+        5, False
+    )
+    assert await reader.count_events(
+        event_type="WorkflowEvent",
+        index_filters={"event_name": "workflow.progress"},
+    ) == (3, False)
+
+    insert_event(
+        populated,
+        "agent-1",
+        "agent_aggregate",
+        "AgentEvent",
+        6,
+        "2025-01-01T00:00:09+00:00",
+        event_name="agent.completed",
+    )
+    assert await reader.count_events(
+        index_filters={"event_name": "agent.completed"}
+    ) == (1, False)
+    # Other predicates are counted directly on a log this small
+    assert await reader.count_events(after=6) == (3, False)
+
+
+async def test_event_counts_reconciled_on_startup(reader, populated):
+    """Counters that drifted from the log are rebuilt on startup."""
+    conn = sqlite3.connect(populated)
+    with conn:
+        conn.execute("UPDATE event_counts SET count = count + 5")
+    conn.close()
+
+    await reader.ensure_schema()
+
+    assert await reader.count_events() == (8, False)
+
+
+async def test_count_events_estimates_other_predicates(
+    reader, populated, monkeypatch
+):
+    """Windows are counted exactly and attribute predicates sampled."""
+    monkeypatch.setattr(reader_module, "COUNT_SAMPLE_SIZE", 4)
+    since = "2025-01-01T00:00:00+00:00"
+    step = parse_attribute_filters([("attr.step>", "0")])
+
+    assert await reader.count_events(
+        aggregate_type="agent_aggregate", since=since
+    ) == (4, False)
+    assert await reader.count_events(after=5) == (3, False)
+    assert await reader.count_events(
+        index_filters={"agent_id": "agent-1"}, since=since
+    ) == (4, False)
+
+    # Seven events are newer than since; three of the newest four are
+    # agent events with a step, scaled to the seven
+    assert await reader.count_events(
+        since=since, attribute_filters=step
+    ) == (5, True)
+    assert await reader.count_events(
+        after=5, attribute_filters=step
+    ) == (0, False)
+
+
+def test_iter_export_pages_and_resumes(reader, populated):
+    """Exports walk the log in append order and resume after a position."""
+    conn = sqlite3.connect(populated)
+    conn.row_factory = sqlite3.Row
+
+    records = list(iter_export(conn, page_size=3))
+    assert [r["position"] for r in records] == list(range(1, 9))
+    assert records[0]["event_data"]["event_name"] == "agent.tool_used"
+    assert records[0]["metadata"] == {
+        "causation_id": None, "correlation_id": None
+    }
+    assert json.loads(ndjson_line(records[0])) == records[0]
+
+    resumed = list(iter_export(conn, after=5, page_size=2))
+    assert [r["position"] for r in resumed] == [6, 7, 8]
+    conn.close()
+
+
+def test_iter_export_range_filters(reader, populated):
+    """Time bounds are inclusive/exclusive and to_position is an end cap."""
+    conn = sqlite3.connect(populated)
+    conn.row_factory = sqlite3.Row
+
+    windowed = list(iter_export(
+        conn,
+        since="2025-01-01T00:00:01Z",
+        until="2025-01-01T00:00:02+00:00",
+        aggregate_type="agent_aggregate",
+    ))
+    assert [r["timestamp"] for r in windowed] == [
+        "2025-01-01T00:00:01+00:00"
+    ]
+    assert [r["position"] for r in iter_export(conn, to_position=2)] == [
+        1, 2
+    ]
+    conn.close()
+
+
+async def test_reader_export_page_matches_iterator(reader, populated):
+    """The server's paged export reads the same records as the CLI."""
+    page = await reader.fetch_export_page(
+        0, 8, event_type="WorkflowEvent", page_size=2
+    )
+    assert [r["position"] for r in page] == [6, 7]
+
+
+async def test_import_round_trips_export(reader, populated, tmp_path):
+    """An export imported into another store rebuilds its read models."""
+    source = sqlite3.connect(populated)
+    source.row_factory = sqlite3.Row
+    lines = b"".join(ndjson_line(r) for r in iter_export(source))
+    source.close()
+
+    target_path = tmp_path / "imported.db"
+    target = sqlite3.connect(target_path)
+    target.execute(EVENTS_SCHEMA)
+    target.execute(
+        "CREATE INDEX idx_events_aggregate ON events (aggregate_id)"
+    )
+    index_ddl = suspend_maintenance(target)
+    records = read_ndjson(io.BytesIO(lines + b"\n" + lines))
+    totals = list(insert_events(target, records, batch_size=5))
+    assert totals[-1] == (8, 8)
+    assert resume_maintenance(target, index_ddl)
+
+    assert target.execute(
+        "SELECT name FROM sqlite_master WHERE name = 'idx_events_aggregate'"
+    ).fetchone()
+    target.close()
+
+    imported = EventReader(target_path)
+    await imported.ensure_schema()
+    expected = await reader.fetch_events(limit=100)
+    assert await imported.fetch_events(limit=100) == expected
+    assert await imported.fetch_workflow_agents("workflow-1") == (
+        await reader.fetch_workflow_agents("workflow-1")
+    )
+    imported.close()
+
+
+def test_import_rejects_version_conflicts(reader, populated):
+    """Duplicate ids are skipped; a taken version with a new id fails."""
+    source = sqlite3.connect(populated)
+    source.row_factory = sqlite3.Row
+    records = list(iter_export(source))
+    source.close()
+
+    target = sqlite3.connect(populated)
+    assert list(insert_events(target, records[:2])) == [(0, 2)]
+    clash = dict(records[1], id="other-event")
+    with pytest.raises(ValueError, match="other-event conflicts"):
+        list(insert_events(target, [clash]))
+    assert target.execute(
+        "SELECT COUNT(*) FROM events WHERE id = 'other-event'"
+    ).fetchone()[0] == 0
+    target.close()
+
+
+def test_read_ndjson_reports_bad_lines():
+    """Malformed lines are reported with their line number."""
+    with pytest.raises(ValueError, match="Line 2"):
+        list(read_ndjson(io.BytesIO(b'{"id": "a"}\n[1]\n')))
+
+
+async def test_sealed_partitions_are_read_back(
+    populated, tmp_path, monkeypatch
+):
+    """Sealed periods move to files and routed reads still see them."""
+    # agent-2 is still active, so its old event must stay in events.db
+    for version, day in ((1, "02"), (2, "09")):
+        insert_event(
+            populated,
+            "agent-2",
+            "agent_aggregate",
+            "AgentEvent",
+            version,
+            f"2025-01-{day}T00:00:00+00:00",
+            event_name="agent.tool_used",
+            agent_id="agent-2",
+        )
+    partitions_dir = tmp_path / "partitions"
+    reader = EventReader(populated, partitions_dir=partitions_dir)
+    await reader.ensure_schema()
+    before = await reader.fetch_events(limit=100)
+
+    sealed = await reader.seal_partitions("day", date(2025, 1, 6))
+    assert [p.path.name for p in sealed] == ["events-2025-01-01_2025-01-02.db"]
+    assert await reader.seal_partitions("day", date(2025, 1, 6)) == []
+
+    # agent-2 and the latest event of each sealed aggregate stay behind
+    hot = sqlite3.connect(populated)
+    assert hot.execute("SELECT COUNT(*) FROM events").fetchone()[0] == 4
+    assert hot.execute(
+        "SELECT SUM(count) FROM event_counts"
+    ).fetchone()[0] == 4
+    hot.close()
+
+    assert await reader.fetch_events(limit=100) == before
+    page = await reader.fetch_events(limit=3, offset=2)
+    assert page == before[2:5]
+    replay = await reader.fetch_events(limit=100, after=2)
+    assert [e["position"] for e in replay] == list(range(3, 11))
+    progress = await reader.fetch_events(
+        limit=100, index_filters={"event_name": "workflow.progress"}
+    )
+    assert len(progress) == 3
+    assert await reader.count_events() == (10, False)
+    assert await reader.count_events(aggregate_type="agent_aggregate") == (
+        7, False
+    )
+    assert await reader.count_events(since="2025-01-01T00:00:03Z") == (
+        3, False
+    )
+    assert await reader.count_events(
+        since="2025-01-01T00:00:00Z", after=3
+    ) == (7, False)
+
+    # Sealed counters are cached until the partition file changes
+    def no_connect(*args):
+        raise AssertionError("partition reopened")
+
+    monkeypatch.setattr(Partition, "connect", no_connect)
+    assert await reader.count_events(aggregate_type="agent_aggregate") == (
+        7, False
+    )
+    monkeypatch.undo()
+    stream = await reader.fetch_aggregate_events("agent-1")
+    assert [e["aggregate_version"] for e in stream] == [1, 2, 3, 4, 5]
+    export = await reader.fetch_export_page(0, 10, page_size=100)
+    assert [r["position"] for r in export] == list(range(1, 11))
+
+    # Dropping a period is deleting its file
+    for partition in list_partitions(partitions_dir):
+        partition.path.unlink()
+    assert len(await reader.fetch_events(limit=100)) == 4
+    reader.close()
+
+
+async def test_search_covers_only_hot_events(populated, tmp_path):
+    """Sealing drops moved events from the search index."""
+    reader = EventReader(populated, partitions_dir=tmp_path / "partitions")
+    await reader.ensure_schema()
+    query = terms_query("agent.tool_used")
+    events = await reader.search_events(query)
+    assert [event["position"] for event in events] == [5, 4, 3, 2, 1]
+
+    await reader.seal_partitions("day", date(2025, 1, 6))
+    events = await reader.search_events(query)
+    assert [event["position"] for event in events] == [5]
+
+    # No entries are left behind for the sealed positions
+    conn = sqlite3.connect(populated)
+    rowids = conn.execute(
+        "SELECT rowid FROM event_search WHERE event_search MATCH ? "
+        "ORDER BY rowid",
+        (query,)
+    ).fetchall()
+    conn.close()
+    assert rowids == [(5,)]
+    reader.close()
+
+
+async def test_append_to_sealed_aggregate(populated, tmp_path):
+    """A sealed aggregate keeps its version sequence and its history."""
+    reader = EventReader(populated, partitions_dir=tmp_path / "partitions")
+    await reader.ensure_schema()
+    await reader.seal_partitions("day", date(2025, 1, 6))
+
+    # The store numbers the next event from its own events table
+    conn = sqlite3.connect(populated)
+    version = conn.execute(
+        "SELECT MAX(aggregate_version) FROM events WHERE aggregate_id = ?",
+        ("agent-1",)
+    ).fetchone()[0]
+    conn.close()
+    assert version == 5
+    insert_event(
+        populated,
+        "agent-1",
+        "agent_aggregate",
+        "AgentEvent",
+        version + 1,
+        "2025-01-07T00:00:00+00:00",
+        event_name="agent.tool_used",
+    )
+
+    stream = await reader.fetch_aggregate_events("agent-1")
+    assert [e["aggregate_version"] for e in stream] == [1, 2, 3, 4, 5, 6]
+    tail = await reader.fetch_aggregate_events("agent-1", from_version=4)
+    assert [e["aggregate_version"] for e in tail] == [4, 5, 6]
+    head = await reader.fetch_aggregate_events("agent-1", limit=2)
+    assert [e["aggregate_version"] for e in head] == [1, 2]
+    reader.close()
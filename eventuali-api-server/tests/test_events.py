@@ -1,5 +1,9 @@
 """Tests for event routes."""
 
+import gzip
+import json
+import zlib
+
 import pytest
 from datetime import datetime
 from unittest.mock import AsyncMock, patch
@@ -7,6 +11,7 @@ from fastapi.testclient import TestClient
 
 from eventuali_api_server.main import create_app
 from eventuali_api_server.config import APIServerConfig, set_config
+from eventuali_api_server.dependencies.reader import encode_cursor
 
 
 @pytest.fixture
@@ -192,4 +197,94 @@ def test_event_stream_endpoint(client):
     response = client.get("/events/stream")
     
     # Should either work or fail gracefully
-    assert response.status_code in [200, 500]
\ No newline at end of file
+    assert response.status_code in [200, 500]
+
+
+def test_event_stream_invalid_last_event_id(client):
+    """Resume positions must be numeric."""
+    response = client.get(
+        "/events/stream", headers={"Last-Event-ID": "not-a-position"}
+    )
+
+    assert response.status_code == 400
+
+
+def test_get_events_invalid_cursor(client):
+    """Malformed continuation tokens are rejected."""
+    response = client.get("/events/?cursor=not-a-cursor")
+
+    assert response.status_code == 400
+
+
+def test_get_events_cursor_rejects_offset(client):
+    """A cursor page cannot also be shifted by an offset."""
+    cursor = encode_cursor(5, "2025-01-01T00:00:00+00:00")
+    response = client.get(f"/events/?cursor={cursor}&offset=10")
+
+    assert response.status_code == 400
+    assert "offset" in response.json()["detail"]
+
+
+def test_emit_event_batch(client):
+    """Test emitting a mixed batch with one invalid item."""
+    batch = {
+        "events": [
+            {
+                "type": "agent",
+                "name": "agent.started",
+                "attributes": {"agent_name": "test-agent"},
+                "aggregate_id": "test-agent-123",
+            },
+            {
+                "type": "workflow",
+                "name": "workflow.started",
+                "aggregate_id": "workflow-789",
+            },
+            {"type": "unknown", "name": "bogus.event"},
+        ]
+    }
+    
+    response = client.post("/events/batch", json=batch)
+    
+    # Structure test even if database fails
+    assert response.status_code in [200, 500]
+    if response.status_code == 200:
+        data = response.json()
+        assert data["appended"] == 2
+        assert data["failed"] == 1
+        assert [r["success"] for r in data["results"]] == [True, True, False]
+
+
+def test_emit_empty_batch(client):
+    """Test that an empty batch is a validation error."""
+    response = client.post("/events/batch", json={"events": []})
+    assert response.status_code == 422
+
+
+async def failing_export(**kwargs):
+    """Export pages that fail after the first one."""
+    yield [{"position": 1, "event_type": "agent.started"}]
+    raise RuntimeError("database is locked")
+
+
+@pytest.mark.parametrize("compressed", [False, True])
+def test_export_failure_is_reported_in_band(client, compressed):
+    """A failed export ends with an error record, not a clean EOF."""
+    with patch("eventuali_api_server.routes.events.db_manager") as mock_db:
+        mock_db.get_max_position = AsyncMock(return_value=2)
+        mock_db.iter_export = failing_export
+
+        response = client.get(f"/events/export?gzip={str(compressed).lower()}")
+
+    assert response.status_code == 200
+    body = response.content
+    if compressed:
+        # No trailer, so a gzip reader rejects the body as truncated
+        with pytest.raises(EOFError):
+            gzip.decompress(body)
+        decompressor = zlib.decompressobj(wbits=31)
+        body = decompressor.decompress(body)
+        assert not decompressor.eof
+    lines = [json.loads(line) for line in body.splitlines()]
+    assert lines[0]["position"] == 1
+    assert lines[-1] == {"error": "database is locked"}
@@ -0,0 +1,48 @@
+"""Tests for time partition bookkeeping."""
+
+from datetime import date
+
+from eventuali_api_server.dependencies.partitions import (
+    Partition,
+    hot_cutoff,
+    list_partitions,
+    period_start,
+)
+
+
+def test_periods_and_cutoff():
+    """Weeks start on Monday and the cutoff keeps the newest periods."""
+    wednesday = date(2025, 1, 8)
+    assert period_start(wednesday, "day") == wednesday
+    assert period_start(wednesday, "week") == date(2025, 1, 6)
+    assert hot_cutoff(wednesday, "day", 1) == wednesday
+    assert hot_cutoff(wednesday, "day", 3) == date(2025, 1, 6)
+    assert hot_cutoff(wednesday, "week", 2) == date(2024, 12, 30)
+
+
+def test_list_partitions_reads_bounds_from_names(tmp_path):
+    """Only partition files are listed, oldest first."""
+    for name in (
+        "events-2025-01-06_2025-01-13.db",
+        "events-2024-12-30_2025-01-06.db",
+        "events-2025-01-06_2025-01-13.db-journal",
+        "notes.txt",
+    ):
+        (tmp_path / name).touch()
+
+    partitions = list_partitions(tmp_path)
+    assert [(p.start, p.end) for p in partitions] == [
+        ("2024-12-30", "2025-01-06"),
+        ("2025-01-06", "2025-01-13"),
+    ]
+    assert list_partitions(tmp_path / "missing") == []
+
+
+def test_partition_overlaps_time_range(tmp_path):
+    """A partition overlaps a range unless it ends before or starts after."""
+    partition = Partition(tmp_path / "p.db", "2025-01-06", "2025-01-13")
+    assert partition.overlaps()
+    assert partition.overlaps(since="2025-01-12T23:59:59+00:00")
+    assert not partition.overlaps(since="2025-01-13T00:00:00+00:00")
+    assert not partition.overlaps(until="2025-01-06")
+    assert partition.overlaps(until="2025-01-06T00:00:01+00:00")
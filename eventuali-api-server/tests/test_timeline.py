@@ -0,0 +1,58 @@
+"""Tests for workflow critical path and timeline analysis."""
+
+from eventuali_api_server.dependencies.timeline import build_timeline
+
+
+def make_agent(agent_id, start, end):
+    """Build a workflow_agents row spanning seconds ``start``..``end``."""
+    return {
+        "agent_id": agent_id,
+        "agent_name": agent_id,
+        "status": "completed",
+        "first_event_time": f"2025-01-01T00:00:{start:02d}+00:00",
+        "last_event_time": f"2025-01-01T00:00:{end:02d}+00:00",
+    }
+
+
+SUMMARY = {
+    "workflow_id": "workflow-1",
+    "status": "completed",
+    "started_at": "2025-01-01T00:00:00+00:00",
+    "ended_at": "2025-01-01T00:00:30+00:00",
+    "last_event_time": "2025-01-01T00:00:30+00:00",
+}
+
+
+def test_critical_path_follows_last_finishing_agents():
+    """The path descends into whichever child finished last."""
+    agents = [
+        make_agent("root", 0, 20),
+        make_agent("fast", 1, 5),
+        make_agent("slow", 4, 18),
+        make_agent("leaf", 6, 17),
+    ]
+    edges = [("root", "fast"), ("root", "slow"), ("slow", "leaf")]
+
+    timeline = build_timeline(SUMMARY, agents, edges)
+
+    assert [a["agent_id"] for a in timeline["critical_path"]] == [
+        "root", "slow", "leaf"
+    ]
+    root = timeline["agents"][0]
+    # Children cover 1..18 of root's 0..20, overlapping at 4..5
+    assert (root["duration_ms"], root["child_ms"], root["self_ms"]) == (
+        20000, 17000, 3000
+    )
+    assert timeline["duration_ms"] == 30000
+
+
+def test_idle_gaps_cover_time_without_active_agents():
+    """Gaps between and after agent spans are reported."""
+    agents = [make_agent("a", 2, 5), make_agent("b", 10, 12)]
+
+    timeline = build_timeline(SUMMARY, agents, [])
+
+    gaps = [gap["duration_ms"] for gap in timeline["idle_gaps"]]
+    assert gaps == [2000, 5000, 18000]
+    assert timeline["idle_ms"] == 25000
+    assert [a["agent_id"] for a in timeline["critical_path"]] == ["b"]
@@ -0,0 +1,78 @@
+"""Tests for the group-commit writer."""
+
+import asyncio
+
+import pytest
+
+from eventuali_api_server.dependencies.writer import WriteCoalescer
+
+
+class RecordingStore:
+    """Store double that records each append_events call."""
+
+    def __init__(self, reject=None):
+        self.calls = []
+        self.reject = reject
+
+    async def append_events(self, events):
+        await asyncio.sleep(0)
+        if self.reject is not None and self.reject in events:
+            raise ValueError("rejected")
+        self.calls.append(list(events))
+
+
+async def test_concurrent_appends_share_one_commit():
+    """Appends arriving inside the window are written together."""
+    store = RecordingStore()
+    committed = []
+
+    async def on_commit(events):
+        committed.extend(events)
+
+    writer = WriteCoalescer(store, window=0.05, on_commit=on_commit)
+
+    await asyncio.gather(*(writer.append([f"e-{i}"]) for i in range(5)))
+
+    assert len(store.calls) == 1
+    assert sorted(store.calls[0]) == [f"e-{i}" for i in range(5)]
+    assert sorted(committed) == [f"e-{i}" for i in range(5)]
+
+
+async def test_max_batch_flushes_early():
+    """Reaching max_batch commits without waiting for the window."""
+    store = RecordingStore()
+    writer = WriteCoalescer(store, window=10.0, max_batch=2)
+
+    await asyncio.wait_for(
+        asyncio.gather(writer.append(["a"]), writer.append(["b"])),
+        timeout=1.0
+    )
+
+    assert store.calls == [["a", "b"]]
+
+
+async def test_failed_group_does_not_fail_others():
+    """A rejected append only fails its own caller."""
+    store = RecordingStore(reject="bad")
+    writer = WriteCoalescer(store, window=0.05)
+
+    results = await asyncio.gather(
+        writer.append(["good-1"]),
+        writer.append(["bad"]),
+        writer.append(["good-2"]),
+        return_exceptions=True
+    )
+
+    assert results[0] is None
+    assert isinstance(results[1], ValueError)
+    assert results[2] is None
+    assert ["good-1"] in store.calls
+    assert ["good-2"] in store.calls
+
+
+async def test_single_failure_propagates():
+    """A lone failing append raises to its caller."""
+    writer = WriteCoalescer(RecordingStore(reject="bad"), window=0)
+
+    with pytest.raises(ValueError):
+        await writer.append(["bad"])
@@ -236,7 +236,8 @@ class EventAPIClient:
             
             return EventsResponse(
                 events=events,
-                total=response_data.get('total', len(events_data)),
+                total=response_data.get('total'),
+                total_estimated=response_data.get('total_estimated', False),
                 limit=response_data.get('limit', limit),
                 offset=response_data.get('offset', offset)
             )
@@ -270,7 +271,8 @@ class EventAPIClient:
             
             return EventsResponse(
                 events=events,
-                total=len(events_data),
+                # A short page holds the whole stream; a full one may not
+                total=len(events_data) if len(events_data) < limit else None,
                 limit=limit,
                 offset=0
             )
@@ -304,7 +306,8 @@ class EventAPIClient:
             
             return EventsResponse(
                 events=events,
-                total=len(events_data),
+                # A short page holds the whole stream; a full one may not
+                total=len(events_data) if len(events_data) < limit else None,
                 limit=limit,
                 offset=0
             )
@@ -342,7 +345,8 @@ class EventAPIClient:
             
             return EventsResponse(
                 events=events,
-                total=len(events_data),
+                total=response_data.get('total'),
+                total_estimated=response_data.get('total_estimated', False),
                 limit=limit,
                 offset=0
             )
@@ -368,21 +372,34 @@ class EventAPIClient:
             logger.error(f"HTTP error getting workflow agents: {e}")
             raise
     
-    async def stream_events(self) -> AsyncGenerator[StreamEventItem, None]:
-        """Stream events via Server-Sent Events."""
+    async def stream_events(
+        self,
+        last_event_id: Optional[str] = None
+    ) -> AsyncGenerator[StreamEventItem, None]:
+        """Stream events via Server-Sent Events.
+        
+        Pass the ``id`` of the last item received to resume after a
+        disconnect; the server replays everything emitted since.
+        """
         await self._ensure_client()
         
         if self._closed:
             raise RuntimeError("Client is closed")
         
+        headers = {"Accept": "text/event-stream"}
+        if last_event_id:
+            headers["Last-Event-ID"] = last_event_id
+        
         try:
             async with self._client.stream(
                 "GET",
                 f"{self.events_url}/stream",
-                headers={"Accept": "text/event-stream"}
+                headers=headers
             ) as response:
                 response.raise_for_status()
                 
+                event_type = "event"
+                event_id = None
                 async for line in response.aiter_lines():
                     if not line.strip():
                         continue
@@ -390,6 +407,8 @@ class EventAPIClient:
                     # Parse SSE format
                     if line.startswith("event:"):
                         event_type = line[6:].strip()
+                    elif line.startswith("id:"):
+                        event_id = line[3:].strip()
                     elif line.startswith("data:"):
                         data_str = line[5:].strip()
                         try:
@@ -397,7 +416,7 @@ class EventAPIClient:
                             yield StreamEventItem(
                                 event=event_type,
                                 data=data,
-                                id=data.get("event_id")
+                                id=event_id
                             )
                         except json.JSONDecodeError as e:
                             logger.warning(f"Failed to parse SSE data: {e}")
@@ -122,12 +122,18 @@ async def event_streaming_loop():
     """Background task that streams events from the API and buffers them."""
     global event_buffer, event_subscribers
     
+    # Position of the last event received, so reconnects resume after it
+    last_event_id = None
+    
     while True:
         try:
             client = await get_api_client()
             logger.info("Starting event stream connection...")
             
-            async for stream_item in client.stream_events():
+            async for stream_item in client.stream_events(last_event_id):
+                if stream_item.event == "event" and stream_item.id:
+                    last_event_id = stream_item.id
+                
                 # Add to buffer
                 event_buffer.append(stream_item)
                 
@@ -419,7 +425,7 @@ async def get_events(request: GetEventsRequest) -> EventsResponse:
         logger.error(f"Failed to get events: {e}")
         return EventsResponse(
             events=[],
-            total=0,
+            total=None,
             limit=request.limit,
             offset=request.offset
         )
@@ -72,6 +72,7 @@ class EventResponse(BaseModel):
 class EventItem(BaseModel):
     """Model for individual event items."""
     event_id: str = Field(..., description="Unique event ID")
+    position: Optional[int] = Field(None, description="Global append position")
     aggregate_id: str = Field(..., description="Aggregate ID (agent, workflow, or system)")
     aggregate_type: str = Field(..., description="Type of aggregate")
     event_type: str = Field(..., description="Type of event")
@@ -100,6 +101,9 @@ class EventsResponse(BaseModel):
     """Response model for event listing."""
     events: List[EventItem] = Field(..., description="List of events")
     total: Optional[int] = Field(None, description="Total count if available")
+    total_estimated: bool = Field(
+        False, description="Whether total is an estimate"
+    )
     limit: int = Field(..., description="Query limit")
     offset: int = Field(..., description="Query offset")
 